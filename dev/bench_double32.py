@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot/blob/master/LICENSE
+
+# Throughput of Double32_t/Float16_t decoding on synthetic baskets.
+# Run this script from the root directory of the project.
+#
+#     python dev/bench_double32.py [numitems] [threads]
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(""))
+
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+
+import uproot
+from uproot.interp.numerical import asfloat16
+
+def bench(interpretation, data, repeat=5):
+    source = interpretation.fromroot(data, None, 0, len(data) // interpretation.itemsize, 0)
+    numitems = interpretation.source_numitems(source)
+    destination = interpretation.destination(numitems, numitems)
+    best = min(timeit.repeat(lambda: interpretation.fill(source, destination, 0, numitems, 0, numitems), number=1, repeat=repeat))
+    return numitems / best / 1e6
+
+if __name__ == "__main__":
+    numitems = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    ranged = numpy.random.randint(0, 1 << 30, numitems).astype(">u4").view(numpy.uint8)
+    truncated = numpy.empty(numitems, dtype=[("exponent", "u1"), ("mantissa", ">u2")])
+    truncated["exponent"] = numpy.random.randint(100, 140, numitems)
+    truncated["mantissa"] = numpy.random.randint(0, 1 << 13, numitems)
+    truncated = truncated.view(numpy.uint8)
+
+    executor = ThreadPoolExecutor(threads)
+    for name, interpretation, data in [("asdouble32 range", uproot.asdouble32(-1.0, 1.0, 30), ranged),
+                                       ("asdouble32 truncated", uproot.asdouble32(0.0, 0.0, 12), truncated),
+                                       ("asfloat16 range", asfloat16(-1.0, 1.0, 30), ranged),
+                                       ("asfloat16 truncated", asfloat16(0.0, 0.0, 12), truncated)]:
+        serial = bench(interpretation, data)
+        interpretation.executor = executor
+        parallel = bench(interpretation, data)
+        print("{0:22s} {1:8.1f} Mitems/s serial {2:8.1f} Mitems/s with {3} threads".format(name, serial, parallel, threads))
+    executor.shutdown()
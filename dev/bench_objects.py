@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot/blob/master/LICENSE
+
+# Microbenchmark for object-heavy reads: generated streamer readers and tree metadata.
+# Run this script from the root directory of the project.
+#
+#     python dev/bench_objects.py [repeat]
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(""))
+
+import timeit
+
+import uproot
+
+samples = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests", "samples")
+
+def opentrees():
+    uproot.open(os.path.join(samples, "HZZ-objects.root"))["events"]
+    uproot.open(os.path.join(samples, "small-evnt-tree-nosplit.root"))["tree"]
+
+def lorentzvectors():
+    tree = uproot.open(os.path.join(samples, "HZZ-objects.root"))["events"]
+    tree.arrays(["muonp4", "jetp4", "MET"], cache=None)
+
+def unsplitevent():
+    tree = uproot.open(os.path.join(samples, "small-evnt-tree-nosplit.root"))["tree"]
+    tree.array("evt", cache=None)
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for name in ["opentrees", "lorentzvectors", "unsplitevent"]:
+        best = min(timeit.repeat(globals()[name], number=1, repeat=repeat))
+        print("{0:20s} {1:8.2f} ms".format(name, best * 1e3))
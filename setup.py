@@ -147,6 +147,7 @@ setup(name = "uproot",
       extras_require = {
           "testing": ["pytest>=3.9", "pkgconfig", "lz4", "zstandard", 'backports.lzma;python_version<"3.3"', "xxhash", "mock", "requests"],
           "compress": ["lz4", "zstandard", 'backports.lzma;python_version<"3.3"', "xxhash"],
+          "numba": ["numba"],
       },
       classifiers = [
           "Development Status :: 5 - Production/Stable",
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot/blob/master/LICENSE
+
+import sys
+
+import numpy
+import pytest
+
+import awkward
+import uproot
+import uproot.interp.kernels
+
+def kernels(name):
+    if name == "numba":
+        pytest.importorskip("numba")
+    uproot.interp.kernels.setbackend(name)
+    return uproot.interp.kernels._kernels()
+
+@pytest.fixture(params=["numpy", "numba"])
+def backend(request):
+    out = kernels(request.param)
+    yield out
+    uproot.interp.kernels.setbackend("auto")
+
+def both(function, *args):
+    numpy_backend = kernels("numpy")
+    numba_backend = kernels("numba")
+    uproot.interp.kernels.setbackend("auto")
+    return getattr(numpy_backend, function)(*args), getattr(numba_backend, function)(*args)
+
+class Test(object):
+    def test_backend_switch(self):
+        uproot.interp.kernels.setbackend("numpy")
+        assert uproot.interp.kernels.getbackend() == "numpy"
+        uproot.interp.kernels.setbackend("auto")
+        assert uproot.interp.kernels.getbackend() in ("numpy", "numba")
+        with pytest.raises(ValueError):
+            uproot.interp.kernels.setbackend("fortran")
+
+    def test_backend_without_numba(self):
+        # "auto" remembers that numba couldn't be imported; asking for numba tries again and raises
+        saved, savedmodule = uproot.interp.kernels._backends.pop("numba", None), sys.modules.get("numba", None)
+        sys.modules["numba"] = None
+        try:
+            uproot.interp.kernels.setbackend("auto")
+            assert uproot.interp.kernels.getbackend() == "numpy"
+            with pytest.raises(ImportError):
+                uproot.interp.kernels.setbackend("numba")
+        finally:
+            if savedmodule is None:
+                del sys.modules["numba"]
+            else:
+                sys.modules["numba"] = savedmodule
+            uproot.interp.kernels._backends.pop("numba", None)
+            if saved is not None:
+                uproot.interp.kernels._backends["numba"] = saved
+            uproot.interp.kernels.setbackend("auto")
+
+    def test_counts2offsets(self):
+        counts = numpy.array([3, 0, 2, 0, 0, 5], dtype=numpy.int32)
+        one, two = both("counts2offsets", counts, awkward)
+        assert one.dtype == two.dtype == awkward.JaggedArray.INDEXTYPE
+        assert one.tolist() == two.tolist() == [0, 3, 3, 5, 5, 5, 10]
+
+    def test_divide(self):
+        for divisor in [1, 2, 4, 8, 3, 12]:
+            array = numpy.arange(0, 1000, 12, dtype=numpy.int32)
+            one = kernels("numpy").divide(array.copy(), divisor, awkward)
+            two = kernels("numba").divide(array.copy(), divisor, awkward)
+            uproot.interp.kernels.setbackend("auto")
+            assert one.tolist() == two.tolist() == (array // divisor).tolist()
+
+    def test_gather(self):
+        data = numpy.random.randint(0, 256, 1000).astype(numpy.uint8)
+        starts = numpy.random.randint(0, 900, 50)
+        counts = numpy.random.randint(0, 100, 50)
+        one, two = both("gather", data, starts, counts, awkward)
+        assert numpy.array_equal(one, two)
+        assert numpy.array_equal(one, numpy.concatenate([data[x : x + n] for x, n in zip(starts, counts)]))
+
+    def test_unskip(self):
+        byteoffsets = numpy.array([0, 10, 10, 16, 50, 58, 100], dtype=numpy.int32)
+        data = numpy.random.randint(0, 256, 100).astype(numpy.uint8)
+        for skipbytes, itemsize in [(6, 1), (10, 4), (10, 8), (6, 3)]:
+            for entrystart, entrystop in [(0, 6), (1, 4), (3, 3)]:
+                (onedata, oneoffsets), (twodata, twooffsets) = both("unskip", data, byteoffsets, entrystart, entrystop, skipbytes, itemsize, awkward)
+                assert numpy.array_equal(onedata, twodata)
+                assert oneoffsets.tolist() == twooffsets.tolist()
+
+    def test_double32(self):
+        truncated = numpy.empty(1000, dtype=[("exponent", "u1"), ("mantissa", ">u2")])
+        truncated["exponent"] = numpy.random.randint(0, 256, 1000)
+        truncated["mantissa"] = numpy.random.randint(0, 1 << 16, 1000)
+        ranged = numpy.random.randint(0, 1 << 30, 1000).astype(">u4")
+
+        for dtype in [numpy.float64, numpy.float32]:
+            for numbits in [2, 10, 14]:
+                one, two = numpy.empty(1000, dtype), numpy.empty(1000, dtype)
+                kernels("numpy").truncated(truncated, numbits, one, 64, awkward)
+                kernels("numba").truncated(truncated, numbits, two, 64, awkward)
+                assert numpy.array_equal(one, two, equal_nan=True)
+            one, two = numpy.empty(1000, dtype), numpy.empty(1000, dtype)
+            kernels("numpy").ranged(ranged, -3.0, 6.0 / (1 << 30), one, 64, awkward)
+            kernels("numba").ranged(ranged, -3.0, 6.0 / (1 << 30), two, 64, awkward)
+            assert numpy.array_equal(one, two)
+        uproot.interp.kernels.setbackend("auto")
+
+    def test_reads(self, backend):
+        t = uproot.open("tests/samples/small-evnt-tree-fullsplit.root")["tree"]
+        assert t.array("SliceI16").tolist() == [[i] * (i % 10) for i in range(100)]
+        assert t.array("StlVecI16").tolist() == [[i] * (i % 10) for i in range(100)]
+        assert t.array("StlVecStr").tolist() == [[("vec-%03d" % i).encode()] * (i % 10) for i in range(100)]
+        assert t.array("Str").tolist() == [("evt-%03d" % i).encode() for i in range(100)]
+
+        t = uproot.open("tests/samples/demo-double32.root")["T"]
+        assert numpy.absolute(t.array("fI16") - t.array("fD64")).max() < 1e-3
+        assert numpy.absolute(t.array("fR14") / t.array("fD64") - 1).max() < 1e-3
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot/blob/master/LICENSE
+
+import threading
+
+import numpy
+import pytest
+
+import uproot
+
+def same(one, two):
+    assert set(one) == set(two)
+    for name in one:
+        if hasattr(one[name], "flatten"):
+            assert numpy.array_equal(one[name].flatten(), two[name].flatten())
+        else:
+            assert numpy.array_equal(one[name], two[name])
+
+class Test(object):
+    def test_arrays(self):
+        with uproot.Scheduler(3, limits={"fetch": 1, "decompress": 2}) as scheduler:
+            for filename in ["tests/samples/HZZ-zlib.root", "tests/samples/HZZ-uncompressed.root", "tests/samples/HZZ-lzma.root"]:
+                tree = uproot.open(filename)["events"]
+                same(tree.arrays(executor=scheduler), tree.arrays())
+                same(tree.arrays(["Jet_P*", "NJet"], executor=scheduler, blocking=False)(), tree.arrays(["Jet_P*", "NJet"]))
+                assert tree["Jet_Px"].array(executor=scheduler, entrystart=100, entrystop=1000).tolist() == tree["Jet_Px"].array(entrystart=100, entrystop=1000).tolist()
+
+    def test_iterate(self):
+        tree = uproot.open("tests/samples/HZZ-zlib.root")["events"]
+        expectation = [x["Jet_Px"].tolist() for x in tree.iterate(["Jet_Px", "MET_px"], 500, namedecode="utf-8")]
+        with uproot.Scheduler(2) as scheduler:
+            assert [x["Jet_Px"].tolist() for x in tree.iterate(["Jet_Px", "MET_px"], 500, namedecode="utf-8", executor=scheduler, prefetch=2)] == expectation
+            assert uproot.numentries(["tests/samples/HZZ-zlib.root", "tests/samples/HZZ-lzma.root"], "events", executor=scheduler) == 2 * tree.numentries
+
+    def test_basketcache(self):
+        tree = uproot.open("tests/samples/HZZ-zlib.root")["events"]
+        basketcache = {}
+        with uproot.Scheduler(2) as scheduler:
+            one = tree.array("Jet_Px", executor=scheduler, basketcache=basketcache)
+            assert len(basketcache) == tree["Jet_Px"].numbaskets
+            two = tree.array("Jet_Px", executor=scheduler, basketcache=basketcache)
+        assert one.tolist() == two.tolist()
+
+    def test_priority(self):
+        order = []
+        with uproot.Scheduler(1) as scheduler:
+            blocker = threading.Event()
+            scheduler.schedule("fetch", blocker.wait)
+            with scheduler.step() as early:
+                pass
+            with scheduler.step() as late:
+                pass
+            late_future = scheduler.schedule("decompress", order.append, ("late",), priority=late)
+            early_fetch = scheduler.schedule("fetch", order.append, ("early fetch",), priority=early)
+            early_interpret = scheduler.schedule("interpret", lambda x, fetched: order.append(x), ("early interpret",), after=[early_fetch], priority=early)
+            blocker.set()
+            late_future.result()
+            early_interpret.result()
+        assert order == ["early fetch", "early interpret", "late"]
+
+    def test_limits(self):
+        lock = threading.Lock()
+        running = [0, 0]
+        def task(x):
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            threading.Event().wait(0.01)
+            with lock:
+                running[0] -= 1
+            return x
+        with uproot.Scheduler(4, limits={"fetch": 1}) as scheduler:
+            assert list(scheduler.map(task, range(8))) == list(range(8))
+        assert running[1] == 1
+
+        # with chunksize, each task handles that many items
+        class CountingScheduler(uproot.Scheduler):
+            calls = 0
+            def submit(self, *args, **kwds):
+                CountingScheduler.calls += 1
+                return super(CountingScheduler, self).submit(*args, **kwds)
+        def chunked(x, y):
+            return x + y
+        with CountingScheduler(2) as scheduler:
+            assert list(scheduler.map(chunked, range(7), range(10, 17), chunksize=3)) == [x + y for x, y in zip(range(7), range(10, 17))]
+            assert CountingScheduler.calls == 3
+            with pytest.raises(ValueError):
+                scheduler.map(chunked, range(7), range(7), chunksize=0)
+            with pytest.raises(TypeError):
+                scheduler.map(chunked, range(7), range(7), chunk=3)
+
+        with pytest.raises(ValueError):
+            uproot.Scheduler(2, limits={"download": 1})
+
+    def test_dependencies(self):
+        with uproot.Scheduler(2) as scheduler:
+            one = scheduler.schedule("fetch", lambda: 1)
+            two = scheduler.schedule("fetch", lambda: 2)
+            three = scheduler.schedule("interpret", lambda x, y, z: x + y + z, (10,), after=[one, two])
+            assert three.result() == 13
+
+            broken = scheduler.schedule("fetch", lambda: 1 // 0)
+            downstream = scheduler.schedule("interpret", lambda x: x, after=[broken])
+            with pytest.raises(ZeroDivisionError):
+                downstream.result()
+
+    def test_shared_source_pool(self):
+        with uproot.Scheduler(2) as scheduler:
+            source = lambda path: uproot.FileSource(path, chunkbytes=8*1024, limitbytes=1024**2, parallel=scheduler)
+            tree = uproot.open("tests/samples/HZZ-zlib.root", localsource=source)["events"]
+            same(tree.arrays(["Jet_P*", "MET_p*"], executor=scheduler), uproot.open("tests/samples/HZZ-zlib.root")["events"].arrays(["Jet_P*", "MET_p*"]))
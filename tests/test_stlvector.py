@@ -3,10 +3,29 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/uproot/blob/master/LICENSE
 
 import os
+import struct
 
+import numpy
 import pytest
+import awkward
 
 import uproot
+from uproot.source.source import Source
+from uproot.source.cursor import Cursor
+
+def _stlstring(x):
+    if len(x) < 255:
+        return struct.pack(">B", len(x)) + x
+    else:
+        return struct.pack(">Bi", 255, len(x)) + x
+
+def _payloads(entries):
+    # entry payloads as they are after asjagged strips the 6-byte header
+    data = numpy.frombuffer(b"".join(entries), dtype=numpy.uint8)
+    return awkward.JaggedArray.fromcounts([len(x) for x in entries], data)
+
+def _objectwise(reader, entries):
+    return [reader.read(Source(numpy.frombuffer(x, dtype=numpy.uint8)), Cursor(0), None, None) if len(x) > 0 else [] for x in entries]
 
 class Test(object):
     def runTest(self):
@@ -23,6 +42,45 @@ class Test(object):
         for i in range(100):
             assert a[i].tolist() == [i] * (i % 10)
 
+    def test_vector_of_numbers_ranges(self):
+        branch = uproot.open("tests/samples/small-evnt-tree-fullsplit.root")["tree"]["StlVecF64"]
+        for start, stop in [(0, 1), (0, 10), (3, 17), (25, 26), (47, 100), (99, 100), (50, 50)]:
+            a = branch.array(entrystart=start, entrystop=stop)
+            assert a.tolist() == [[i] * (i % 10) for i in range(start, stop)]
+
+    def test_vector_of_vector_of_numbers_columnar(self):
+        entries = []
+        for i in range(50):
+            inner = [list(range(j * (i % 3))) for j in range(i % 5)]
+            entries.append(struct.pack(">i", len(inner)) + b"".join(struct.pack(">i%di" % len(x), len(x), *x) for x in inner))
+        entries.append(b"")
+        a = uproot.asstlvectorvector(uproot.asdtype(">i4"))._parse(_payloads(entries))
+        assert a.tolist() == [[list(x) for x in y] for y in _objectwise(uproot.STLVector(uproot.STLVector(uproot.asdtype(">i4"))), entries)]
+
+    def test_vector_of_strings_columnar(self):
+        entries = []
+        for i in range(30):
+            strings = [(b"x" * (i * 20 + j)) for j in range(i % 4)]
+            entries.append(struct.pack(">i", len(strings)) + b"".join(_stlstring(x) for x in strings))
+        a = uproot.asstlvectorstring()._parse(_payloads(entries))
+        assert a.tolist() == _objectwise(uproot.STLVector(uproot.STLString()), entries)
+        assert max(len(x) for y in a.tolist() for x in y) > 255
+
+    def test_map_columnar(self):
+        entries = []
+        for i in range(20):
+            keys = list(range(i % 4))
+            entries.append(struct.pack(">i", len(keys)) + b"".join(struct.pack(">id", k, k * 1.5) for k in keys))
+        a = uproot.asstlmap(uproot.asdtype(">i4"), uproot.asdtype(">f8"))._parse(_payloads(entries))
+        assert [dict(zip(x["first"].tolist(), x["second"].tolist())) for x in a] == _objectwise(uproot.STLMap(uproot.asdtype(">i4"), uproot.asdtype(">f8")), entries)
+
+        entries = []
+        for i in range(20):
+            keys = [b"key" * (j * 50) + str(j).encode() for j in range(i % 4)]
+            entries.append(struct.pack(">i", len(keys)) + b"".join(_stlstring(k) + struct.pack(">f", j) for j, k in enumerate(keys)))
+        a = uproot.asstlmap(uproot.STLString(), uproot.asdtype(">f4"))._parse(_payloads(entries))
+        assert [dict(zip(x["first"].tolist(), x["second"].tolist())) for x in a] == _objectwise(uproot.STLMap(uproot.STLString(), uproot.asdtype(">f4")), entries)
+
     def test_vector_of_vector_of_numbers(self):
         branch = uproot.open("tests/samples/vectorVectorDouble.root")["t"]["x"]
         assert branch.array().tolist() == [[], [[], []], [[10.0], [], [10.0, 20.0]], [[20.0, -21.0, -22.0]], [[200.0], [-201.0], [202.0]]]
@@ -35,6 +93,29 @@ class Test(object):
         tree = uproot.open("tests/samples/small-evnt-tree-fullsplit.root")["tree"]
         assert tree.array("StdStr").tolist() == [b'std-000', b'std-001', b'std-002', b'std-003', b'std-004', b'std-005', b'std-006', b'std-007', b'std-008', b'std-009', b'std-010', b'std-011', b'std-012', b'std-013', b'std-014', b'std-015', b'std-016', b'std-017', b'std-018', b'std-019', b'std-020', b'std-021', b'std-022', b'std-023', b'std-024', b'std-025', b'std-026', b'std-027', b'std-028', b'std-029', b'std-030', b'std-031', b'std-032', b'std-033', b'std-034', b'std-035', b'std-036', b'std-037', b'std-038', b'std-039', b'std-040', b'std-041', b'std-042', b'std-043', b'std-044', b'std-045', b'std-046', b'std-047', b'std-048', b'std-049', b'std-050', b'std-051', b'std-052', b'std-053', b'std-054', b'std-055', b'std-056', b'std-057', b'std-058', b'std-059', b'std-060', b'std-061', b'std-062', b'std-063', b'std-064', b'std-065', b'std-066', b'std-067', b'std-068', b'std-069', b'std-070', b'std-071', b'std-072', b'std-073', b'std-074', b'std-075', b'std-076', b'std-077', b'std-078', b'std-079', b'std-080', b'std-081', b'std-082', b'std-083', b'std-084', b'std-085', b'std-086', b'std-087', b'std-088', b'std-089', b'std-090', b'std-091', b'std-092', b'std-093', b'std-094', b'std-095', b'std-096', b'std-097', b'std-098', b'std-099']
 
+    def test_long_strings(self):
+        def basket(strings, skipbytes):
+            entries = [b"\x00" * (skipbytes - 1) + _stlstring(x) for x in strings]
+            byteoffsets = numpy.cumsum([0] + [len(x) for x in entries]).astype(numpy.int32)
+            return numpy.frombuffer(b"".join(entries), dtype=numpy.uint8), byteoffsets
+
+        for skipbytes in (1, 7):
+            interpretation = uproot.asstring(skipbytes=skipbytes)
+            baskets = [[b"short", b"x" * 300, b""], [b"y" * 254, b"z" * 255, b"w" * 1000, b"end"]]
+            expectation = [x for y in baskets for x in y]
+            destination = interpretation.destination(sum(len(x) + 4 for x in expectation), len(expectation))
+            itemstart = entrystart = 0
+            for strings in baskets:
+                data, byteoffsets = basket(strings, skipbytes)
+                source = interpretation.fromroot(data, byteoffsets, 0, len(strings), 0)
+                itemstop = itemstart + interpretation.numitems(len(data), len(strings))
+                interpretation.fill(source, destination, itemstart, itemstop, entrystart, entrystart + len(strings))
+                itemstart = itemstop
+                entrystart += len(strings)
+            out = interpretation.finalize(interpretation.clip(destination, 0, itemstart, 0, entrystart), None)
+            assert isinstance(out, awkward.StringArray)
+            assert out.tolist() == expectation
+
     def test_strings3(self):
         tree = uproot.open("tests/samples/small-evnt-tree-fullsplit.root")["tree"]
         assert tree.array("StlVecStr").tolist() == [[], [b'vec-001'], [b'vec-002', b'vec-002'], [b'vec-003', b'vec-003', b'vec-003'], [b'vec-004', b'vec-004', b'vec-004', b'vec-004'], [b'vec-005', b'vec-005', b'vec-005', b'vec-005', b'vec-005'], [b'vec-006', b'vec-006', b'vec-006', b'vec-006', b'vec-006', b'vec-006'], [b'vec-007', b'vec-007', b'vec-007', b'vec-007', b'vec-007', b'vec-007', b'vec-007'], [b'vec-008', b'vec-008', b'vec-008', b'vec-008', b'vec-008', b'vec-008', b'vec-008', b'vec-008'], [b'vec-009', b'vec-009', b'vec-009', b'vec-009', b'vec-009', b'vec-009', b'vec-009', b'vec-009', b'vec-009'], [], [b'vec-011'], [b'vec-012', b'vec-012'], [b'vec-013', b'vec-013', b'vec-013'], [b'vec-014', b'vec-014', b'vec-014', b'vec-014'], [b'vec-015', b'vec-015', b'vec-015', b'vec-015', b'vec-015'], [b'vec-016', b'vec-016', b'vec-016', b'vec-016', b'vec-016', b'vec-016'], [b'vec-017', b'vec-017', b'vec-017', b'vec-017', b'vec-017', b'vec-017', b'vec-017'], [b'vec-018', b'vec-018', b'vec-018', b'vec-018', b'vec-018', b'vec-018', b'vec-018', b'vec-018'], [b'vec-019', b'vec-019', b'vec-019', b'vec-019', b'vec-019', b'vec-019', b'vec-019', b'vec-019', b'vec-019'], [], [b'vec-021'], [b'vec-022', b'vec-022'], [b'vec-023', b'vec-023', b'vec-023'], [b'vec-024', b'vec-024', b'vec-024', b'vec-024'], [b'vec-025', b'vec-025', b'vec-025', b'vec-025', b'vec-025'], [b'vec-026', b'vec-026', b'vec-026', b'vec-026', b'vec-026', b'vec-026'], [b'vec-027', b'vec-027', b'vec-027', b'vec-027', b'vec-027', b'vec-027', b'vec-027'], [b'vec-028', b'vec-028', b'vec-028', b'vec-028', b'vec-028', b'vec-028', b'vec-028', b'vec-028'], [b'vec-029', b'vec-029', b'vec-029', b'vec-029', b'vec-029', b'vec-029', b'vec-029', b'vec-029', b'vec-029'], [], [b'vec-031'], [b'vec-032', b'vec-032'], [b'vec-033', b'vec-033', b'vec-033'], [b'vec-034', b'vec-034', b'vec-034', b'vec-034'], [b'vec-035', b'vec-035', b'vec-035', b'vec-035', b'vec-035'], [b'vec-036', b'vec-036', b'vec-036', b'vec-036', b'vec-036', b'vec-036'], [b'vec-037', b'vec-037', b'vec-037', b'vec-037', b'vec-037', b'vec-037', b'vec-037'], [b'vec-038', b'vec-038', b'vec-038', b'vec-038', b'vec-038', b'vec-038', b'vec-038', b'vec-038'], [b'vec-039', b'vec-039', b'vec-039', b'vec-039', b'vec-039', b'vec-039', b'vec-039', b'vec-039', b'vec-039'], [], [b'vec-041'], [b'vec-042', b'vec-042'], [b'vec-043', b'vec-043', b'vec-043'], [b'vec-044', b'vec-044', b'vec-044', b'vec-044'], [b'vec-045', b'vec-045', b'vec-045', b'vec-045', b'vec-045'], [b'vec-046', b'vec-046', b'vec-046', b'vec-046', b'vec-046', b'vec-046'], [b'vec-047', b'vec-047', b'vec-047', b'vec-047', b'vec-047', b'vec-047', b'vec-047'], [b'vec-048', b'vec-048', b'vec-048', b'vec-048', b'vec-048', b'vec-048', b'vec-048', b'vec-048'], [b'vec-049', b'vec-049', b'vec-049', b'vec-049', b'vec-049', b'vec-049', b'vec-049', b'vec-049', b'vec-049'], [], [b'vec-051'], [b'vec-052', b'vec-052'], [b'vec-053', b'vec-053', b'vec-053'], [b'vec-054', b'vec-054', b'vec-054', b'vec-054'], [b'vec-055', b'vec-055', b'vec-055', b'vec-055', b'vec-055'], [b'vec-056', b'vec-056', b'vec-056', b'vec-056', b'vec-056', b'vec-056'], [b'vec-057', b'vec-057', b'vec-057', b'vec-057', b'vec-057', b'vec-057', b'vec-057'], [b'vec-058', b'vec-058', b'vec-058', b'vec-058', b'vec-058', b'vec-058', b'vec-058', b'vec-058'], [b'vec-059', b'vec-059', b'vec-059', b'vec-059', b'vec-059', b'vec-059', b'vec-059', b'vec-059', b'vec-059'], [], [b'vec-061'], [b'vec-062', b'vec-062'], [b'vec-063', b'vec-063', b'vec-063'], [b'vec-064', b'vec-064', b'vec-064', b'vec-064'], [b'vec-065', b'vec-065', b'vec-065', b'vec-065', b'vec-065'], [b'vec-066', b'vec-066', b'vec-066', b'vec-066', b'vec-066', b'vec-066'], [b'vec-067', b'vec-067', b'vec-067', b'vec-067', b'vec-067', b'vec-067', b'vec-067'], [b'vec-068', b'vec-068', b'vec-068', b'vec-068', b'vec-068', b'vec-068', b'vec-068', b'vec-068'], [b'vec-069', b'vec-069', b'vec-069', b'vec-069', b'vec-069', b'vec-069', b'vec-069', b'vec-069', b'vec-069'], [], [b'vec-071'], [b'vec-072', b'vec-072'], [b'vec-073', b'vec-073', b'vec-073'], [b'vec-074', b'vec-074', b'vec-074', b'vec-074'], [b'vec-075', b'vec-075', b'vec-075', b'vec-075', b'vec-075'], [b'vec-076', b'vec-076', b'vec-076', b'vec-076', b'vec-076', b'vec-076'], [b'vec-077', b'vec-077', b'vec-077', b'vec-077', b'vec-077', b'vec-077', b'vec-077'], [b'vec-078', b'vec-078', b'vec-078', b'vec-078', b'vec-078', b'vec-078', b'vec-078', b'vec-078'], [b'vec-079', b'vec-079', b'vec-079', b'vec-079', b'vec-079', b'vec-079', b'vec-079', b'vec-079', b'vec-079'], [], [b'vec-081'], [b'vec-082', b'vec-082'], [b'vec-083', b'vec-083', b'vec-083'], [b'vec-084', b'vec-084', b'vec-084', b'vec-084'], [b'vec-085', b'vec-085', b'vec-085', b'vec-085', b'vec-085'], [b'vec-086', b'vec-086', b'vec-086', b'vec-086', b'vec-086', b'vec-086'], [b'vec-087', b'vec-087', b'vec-087', b'vec-087', b'vec-087', b'vec-087', b'vec-087'], [b'vec-088', b'vec-088', b'vec-088', b'vec-088', b'vec-088', b'vec-088', b'vec-088', b'vec-088'], [b'vec-089', b'vec-089', b'vec-089', b'vec-089', b'vec-089', b'vec-089', b'vec-089', b'vec-089', b'vec-089'], [], [b'vec-091'], [b'vec-092', b'vec-092'], [b'vec-093', b'vec-093', b'vec-093'], [b'vec-094', b'vec-094', b'vec-094', b'vec-094'], [b'vec-095', b'vec-095', b'vec-095', b'vec-095', b'vec-095'], [b'vec-096', b'vec-096', b'vec-096', b'vec-096', b'vec-096', b'vec-096'], [b'vec-097', b'vec-097', b'vec-097', b'vec-097', b'vec-097', b'vec-097', b'vec-097'], [b'vec-098', b'vec-098', b'vec-098', b'vec-098', b'vec-098', b'vec-098', b'vec-098', b'vec-098'], [b'vec-099', b'vec-099', b'vec-099', b'vec-099', b'vec-099', b'vec-099', b'vec-099', b'vec-099', b'vec-099']]
@@ -45,6 +126,13 @@ class Test(object):
         a = branch.array()
         assert [x._StlVecStr for x in a] == [[], [b'vec-001'], [b'vec-002', b'vec-002'], [b'vec-003', b'vec-003', b'vec-003'], [b'vec-004', b'vec-004', b'vec-004', b'vec-004'], [b'vec-005', b'vec-005', b'vec-005', b'vec-005', b'vec-005'], [b'vec-006', b'vec-006', b'vec-006', b'vec-006', b'vec-006', b'vec-006'], [b'vec-007', b'vec-007', b'vec-007', b'vec-007', b'vec-007', b'vec-007', b'vec-007'], [b'vec-008', b'vec-008', b'vec-008', b'vec-008', b'vec-008', b'vec-008', b'vec-008', b'vec-008'], [b'vec-009', b'vec-009', b'vec-009', b'vec-009', b'vec-009', b'vec-009', b'vec-009', b'vec-009', b'vec-009'], [], [b'vec-011'], [b'vec-012', b'vec-012'], [b'vec-013', b'vec-013', b'vec-013'], [b'vec-014', b'vec-014', b'vec-014', b'vec-014'], [b'vec-015', b'vec-015', b'vec-015', b'vec-015', b'vec-015'], [b'vec-016', b'vec-016', b'vec-016', b'vec-016', b'vec-016', b'vec-016'], [b'vec-017', b'vec-017', b'vec-017', b'vec-017', b'vec-017', b'vec-017', b'vec-017'], [b'vec-018', b'vec-018', b'vec-018', b'vec-018', b'vec-018', b'vec-018', b'vec-018', b'vec-018'], [b'vec-019', b'vec-019', b'vec-019', b'vec-019', b'vec-019', b'vec-019', b'vec-019', b'vec-019', b'vec-019'], [], [b'vec-021'], [b'vec-022', b'vec-022'], [b'vec-023', b'vec-023', b'vec-023'], [b'vec-024', b'vec-024', b'vec-024', b'vec-024'], [b'vec-025', b'vec-025', b'vec-025', b'vec-025', b'vec-025'], [b'vec-026', b'vec-026', b'vec-026', b'vec-026', b'vec-026', b'vec-026'], [b'vec-027', b'vec-027', b'vec-027', b'vec-027', b'vec-027', b'vec-027', b'vec-027'], [b'vec-028', b'vec-028', b'vec-028', b'vec-028', b'vec-028', b'vec-028', b'vec-028', b'vec-028'], [b'vec-029', b'vec-029', b'vec-029', b'vec-029', b'vec-029', b'vec-029', b'vec-029', b'vec-029', b'vec-029'], [], [b'vec-031'], [b'vec-032', b'vec-032'], [b'vec-033', b'vec-033', b'vec-033'], [b'vec-034', b'vec-034', b'vec-034', b'vec-034'], [b'vec-035', b'vec-035', b'vec-035', b'vec-035', b'vec-035'], [b'vec-036', b'vec-036', b'vec-036', b'vec-036', b'vec-036', b'vec-036'], [b'vec-037', b'vec-037', b'vec-037', b'vec-037', b'vec-037', b'vec-037', b'vec-037'], [b'vec-038', b'vec-038', b'vec-038', b'vec-038', b'vec-038', b'vec-038', b'vec-038', b'vec-038'], [b'vec-039', b'vec-039', b'vec-039', b'vec-039', b'vec-039', b'vec-039', b'vec-039', b'vec-039', b'vec-039'], [], [b'vec-041'], [b'vec-042', b'vec-042'], [b'vec-043', b'vec-043', b'vec-043'], [b'vec-044', b'vec-044', b'vec-044', b'vec-044'], [b'vec-045', b'vec-045', b'vec-045', b'vec-045', b'vec-045'], [b'vec-046', b'vec-046', b'vec-046', b'vec-046', b'vec-046', b'vec-046'], [b'vec-047', b'vec-047', b'vec-047', b'vec-047', b'vec-047', b'vec-047', b'vec-047'], [b'vec-048', b'vec-048', b'vec-048', b'vec-048', b'vec-048', b'vec-048', b'vec-048', b'vec-048'], [b'vec-049', b'vec-049', b'vec-049', b'vec-049', b'vec-049', b'vec-049', b'vec-049', b'vec-049', b'vec-049'], [], [b'vec-051'], [b'vec-052', b'vec-052'], [b'vec-053', b'vec-053', b'vec-053'], [b'vec-054', b'vec-054', b'vec-054', b'vec-054'], [b'vec-055', b'vec-055', b'vec-055', b'vec-055', b'vec-055'], [b'vec-056', b'vec-056', b'vec-056', b'vec-056', b'vec-056', b'vec-056'], [b'vec-057', b'vec-057', b'vec-057', b'vec-057', b'vec-057', b'vec-057', b'vec-057'], [b'vec-058', b'vec-058', b'vec-058', b'vec-058', b'vec-058', b'vec-058', b'vec-058', b'vec-058'], [b'vec-059', b'vec-059', b'vec-059', b'vec-059', b'vec-059', b'vec-059', b'vec-059', b'vec-059', b'vec-059'], [], [b'vec-061'], [b'vec-062', b'vec-062'], [b'vec-063', b'vec-063', b'vec-063'], [b'vec-064', b'vec-064', b'vec-064', b'vec-064'], [b'vec-065', b'vec-065', b'vec-065', b'vec-065', b'vec-065'], [b'vec-066', b'vec-066', b'vec-066', b'vec-066', b'vec-066', b'vec-066'], [b'vec-067', b'vec-067', b'vec-067', b'vec-067', b'vec-067', b'vec-067', b'vec-067'], [b'vec-068', b'vec-068', b'vec-068', b'vec-068', b'vec-068', b'vec-068', b'vec-068', b'vec-068'], [b'vec-069', b'vec-069', b'vec-069', b'vec-069', b'vec-069', b'vec-069', b'vec-069', b'vec-069', b'vec-069'], [], [b'vec-071'], [b'vec-072', b'vec-072'], [b'vec-073', b'vec-073', b'vec-073'], [b'vec-074', b'vec-074', b'vec-074', b'vec-074'], [b'vec-075', b'vec-075', b'vec-075', b'vec-075', b'vec-075'], [b'vec-076', b'vec-076', b'vec-076', b'vec-076', b'vec-076', b'vec-076'], [b'vec-077', b'vec-077', b'vec-077', b'vec-077', b'vec-077', b'vec-077', b'vec-077'], [b'vec-078', b'vec-078', b'vec-078', b'vec-078', b'vec-078', b'vec-078', b'vec-078', b'vec-078'], [b'vec-079', b'vec-079', b'vec-079', b'vec-079', b'vec-079', b'vec-079', b'vec-079', b'vec-079', b'vec-079'], [], [b'vec-081'], [b'vec-082', b'vec-082'], [b'vec-083', b'vec-083', b'vec-083'], [b'vec-084', b'vec-084', b'vec-084', b'vec-084'], [b'vec-085', b'vec-085', b'vec-085', b'vec-085', b'vec-085'], [b'vec-086', b'vec-086', b'vec-086', b'vec-086', b'vec-086', b'vec-086'], [b'vec-087', b'vec-087', b'vec-087', b'vec-087', b'vec-087', b'vec-087', b'vec-087'], [b'vec-088', b'vec-088', b'vec-088', b'vec-088', b'vec-088', b'vec-088', b'vec-088', b'vec-088'], [b'vec-089', b'vec-089', b'vec-089', b'vec-089', b'vec-089', b'vec-089', b'vec-089', b'vec-089', b'vec-089'], [], [b'vec-091'], [b'vec-092', b'vec-092'], [b'vec-093', b'vec-093', b'vec-093'], [b'vec-094', b'vec-094', b'vec-094', b'vec-094'], [b'vec-095', b'vec-095', b'vec-095', b'vec-095', b'vec-095'], [b'vec-096', b'vec-096', b'vec-096', b'vec-096', b'vec-096', b'vec-096'], [b'vec-097', b'vec-097', b'vec-097', b'vec-097', b'vec-097', b'vec-097', b'vec-097'], [b'vec-098', b'vec-098', b'vec-098', b'vec-098', b'vec-098', b'vec-098', b'vec-098', b'vec-098'], [b'vec-099', b'vec-099', b'vec-099', b'vec-099', b'vec-099', b'vec-099', b'vec-099', b'vec-099', b'vec-099']]
 
+    def test_unsplit_arrays(self):
+        a = uproot.open("tests/samples/small-evnt-tree-nosplit.root")["tree"].array("evt")
+        assert [x._ArrayI16.tolist() for x in a] == [[i] * 10 for i in range(100)]
+        assert [x._ArrayU64.tolist() for x in a] == [[i] * 10 for i in range(100)]
+        assert [x._ArrayF64.tolist() for x in a] == [[float(i)] * 10 for i in range(100)]
+        assert [x._I32 for x in a] == list(range(100))
+
     def test_array(self):
         tree = uproot.open("tests/samples/small-evnt-tree-fullsplit.root")["tree"]
         assert tree.array("ArrayI16[10]").tolist() == [[i] * 10 for i in range(100)]
@@ -3,6 +3,9 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/uproot/blob/master/LICENSE
 
 import os
+import pickle
+import shutil
+import sys
 from collections import namedtuple
 
 import numpy
@@ -16,6 +19,17 @@ def basest(array):
         array = array.base
     return array
 
+def double32_reference(raw, interpretation):
+    if interpretation.truncated:
+        unpacked = raw["exponent"].astype(numpy.int32) << 23
+        mantissa = raw["mantissa"].astype(numpy.int32)
+        unpacked |= (mantissa & ((1 << (interpretation.numbits + 1)) - 1)) << (23 - interpretation.numbits)
+        sign = ((1 << (interpretation.numbits + 1)) & mantissa != 0) * -2 + 1
+        return (unpacked.view(numpy.float32) * sign).astype(interpretation.todtype)
+    else:
+        out = raw.astype(interpretation.todtype)
+        return out * (float(interpretation.high - interpretation.low) / (1 << interpretation.numbits)) + interpretation.low
+
 class Test(object):
     ###################################################### double32
 
@@ -35,6 +49,31 @@ class Test(object):
         assert ratio_fI30.min() > 0.9999 and ratio_fI30.max() < 1.0001
         assert ratio_fI28.min() > 0.9999 and ratio_fI28.max() < 1.0001
 
+    def test_double32_decoding(self):
+        t = uproot.open("tests/samples/demo-double32.root")["T"]
+        for name in ["fI32", "fI20", "fI8", "fI2", "fR14", "fR8", "fR2"]:
+            branch = t[name]
+            double32 = branch.interpretation
+            float16 = uproot.interp.numerical.asfloat16(double32.low, double32.high, double32.numbits)
+            raw = branch.array(uproot.asdtype(double32.fromdtype))
+            for interpretation in [double32, float16]:
+                expected = double32_reference(raw, interpretation)
+                array = branch.array(interpretation)
+                assert array.dtype == expected.dtype
+                assert numpy.array_equal(array, expected)
+
+    def test_double32_parallel(self):
+        from concurrent.futures import ThreadPoolExecutor
+        t = uproot.open("tests/samples/demo-double32.root")["T"]
+        for name in ["fI30", "fR10"]:
+            expected = t.array(name)
+            interpretation = uproot.asdouble32(t[name].interpretation.low, t[name].interpretation.high, t[name].interpretation.numbits)
+            interpretation.blocksize = 100
+            interpretation.parallelitems = 250
+            with ThreadPoolExecutor(4) as executor:
+                interpretation.executor = executor
+                assert numpy.array_equal(t.array(name, interpretation, entrystart=123, entrystop=31234), expected[123:31234])
+
     ###################################################### basket
 
     def test_flat_basket(self):
@@ -109,7 +148,8 @@ class Test(object):
         two = branch.basket(0, interpretation, local_entrystart, local_entrystop)
 
         assert one.tolist() == [b"hey-0", b"hey-1", b"hey-2", b"hey-3", b"hey-4", b"hey-5"]
-        assert basest(one.content.content) is not basest(two.content.content)
+        assert isinstance(one, awkward.StringArray)
+        assert basest(one.content) is not basest(two.content)
 
         three = branch.basket(0)
         assert three.tolist() == [b"hey-0", b"hey-1", b"hey-2", b"hey-3", b"hey-4", b"hey-5"]
@@ -194,6 +234,97 @@ class Test(object):
         for n in 1000, 5, 6, 7:
             assert [x.tolist() for (x,) in tree.iterate("str", n, outputtype=tuple)] == [expectation[x : x + n] for x in range(0, len(expectation), n)]
 
+    def test_prefetch_iterate(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        class CountingExecutor(ThreadPoolExecutor):
+            calls = 0
+            def map(self, *args, **kwds):
+                CountingExecutor.calls += 1
+                return super(CountingExecutor, self).map(*args, **kwds)
+
+        tree = uproot.open("tests/samples/sample-6.10.05-uncompressed.root")["sample"]
+        expectation = [(start, stop, x.tolist(), y.tolist()) for start, stop, (x, y) in tree.iterate(["Ai8", "str"], 4, outputtype=tuple, reportentries=True)]
+
+        with CountingExecutor(2) as executor:
+            for prefetch, prefetchbytes in [(1, None), (3, None), (100, None), (3, 1), (3, "1 kB")]:
+                assert [(start, stop, x.tolist(), y.tolist()) for start, stop, (x, y) in tree.iterate(["Ai8", "str"], 4, outputtype=tuple, reportentries=True, executor=executor, prefetch=prefetch, prefetchbytes=prefetchbytes)] == expectation
+
+            CountingExecutor.calls = 0
+            next(tree.iterate("i8", 4, executor=executor, prefetch=3))
+            assert CountingExecutor.calls == 4
+
+            CountingExecutor.calls = 0
+            next(tree.iterate("i8", 4, executor=executor, prefetch=3, prefetchbytes=1))
+            assert CountingExecutor.calls == 1
+
+            # basket sizes are read once per iteration, not once per step
+            branch = tree["i8"]
+            sizereads = []
+            iteratekeys = branch._threadsafe_iterate_keys
+            def countingkeys(keycache, complete, *args):
+                if not complete:
+                    sizereads.append(keycache)
+                return iteratekeys(keycache, complete, *args)
+            branch._threadsafe_iterate_keys = countingkeys
+            try:
+                assert len(list(tree.iterate("i8", 4, executor=executor, prefetch=3, prefetchbytes="1 kB", max_memory="1 MB"))) == 8
+            finally:
+                del branch._threadsafe_iterate_keys
+            assert len(sizereads) == 1
+
+            waits = list(tree.iterate("i8", 4, outputtype=tuple, executor=executor, blocking=False, prefetch=2))
+            assert [x.tolist() for (x,) in (wait() for wait in waits)] == [x.tolist() for (x,) in tree.iterate("i8", 4, outputtype=tuple)]
+
+        with pytest.raises(ValueError):
+            next(tree.iterate("i8", 4, prefetch=2))
+
+    def test_max_memory(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        class CountingExecutor(ThreadPoolExecutor):
+            calls = 0
+            def map(self, *args, **kwds):
+                CountingExecutor.calls += 1
+                return super(CountingExecutor, self).map(*args, **kwds)
+
+        tree = uproot.open("tests/samples/HZZ-zlib.root")["events"]
+        expectation = [x.tolist() for x, y in tree.iterate(["Jet_Px", "MET_px"], 500, outputtype=tuple)]
+
+        with CountingExecutor(2) as executor:
+            budget = uproot.MemoryBudget("1 MB")
+            assert [x.tolist() for x, y in tree.iterate(["Jet_Px", "MET_px"], 500, outputtype=tuple, executor=executor, prefetch=4, max_memory=budget)] == expectation
+            assert budget.usedbytes == 0
+            assert 0 < budget.peakbytes <= budget.limitbytes
+
+            # a budget smaller than one step still reads, one step at a time
+            budget = uproot.MemoryBudget(1)
+            CountingExecutor.calls = 0
+            for i, (x, y) in enumerate(tree.iterate(["Jet_Px", "MET_px"], 500, outputtype=tuple, executor=executor, prefetch=4, max_memory=budget)):
+                assert x.tolist() == expectation[i]
+                assert CountingExecutor.calls == 2 * (i + 1)
+                if i == 2:
+                    break
+            assert budget.usedbytes == 0
+
+            # without blocking, a step counts until its function is called, which the iteration does when it needs room
+            budget = uproot.MemoryBudget("1 MB")
+            functions = list(tree.iterate(["Jet_Px", "MET_px"], 500, outputtype=tuple, executor=executor, prefetch=4, max_memory=budget, blocking=False))
+            assert 0 < budget.usedbytes and budget.peakbytes <= budget.limitbytes
+            assert [function()[0].tolist() for function in functions] == expectation
+            assert budget.usedbytes == 0
+
+        assert [x.tolist() for x, y in tree.iterate(["Jet_Px", "MET_px"], 500, outputtype=tuple, max_memory="100 kB")] == expectation
+
+        budget = uproot.MemoryBudget("10 MB")
+        assert [x.tolist() for x, in uproot.iterate(["tests/samples/HZZ-zlib.root", "tests/samples/HZZ-lzma.root"], "events", ["Jet_Px"], 500, outputtype=tuple, max_memory=budget)] == 2 * expectation
+        assert budget.usedbytes == 0 and budget.peakbytes > 0
+
+        budget = uproot.MemoryBudget("10 MB")
+        assert tree.lazyarrays(["Jet_Px"], entrysteps=500, max_memory=budget)["Jet_Px"].tolist() == tree.array("Jet_Px").tolist()
+        assert uproot.lazyarray("tests/samples/HZZ-zlib.root", "events", "Jet_Px", max_memory=budget).tolist() == tree.array("Jet_Px").tolist()
+        assert budget.usedbytes == 0 and budget.peakbytes > 0
+
     ###################################################### old tests
 
     def test_branch_array(self):
@@ -566,6 +697,24 @@ class Test(object):
         assert lazy["f4"].tolist() == [-14.899999618530273, -13.899999618530273, -12.899999618530273, -11.899999618530273, -10.899999618530273, -9.899999618530273, -8.899999618530273, -7.900000095367432, -6.900000095367432, -5.900000095367432, -4.900000095367432, -3.9000000953674316, -2.9000000953674316, -1.899999976158142, -0.8999999761581421, 0.10000000149011612, 1.100000023841858, 2.0999999046325684, 3.0999999046325684, 4.099999904632568, 5.099999904632568, 6.099999904632568, 7.099999904632568, 8.100000381469727, 9.100000381469727, 10.100000381469727, 11.100000381469727, 12.100000381469727, 13.100000381469727, 14.100000381469727, -14.899999618530273, -13.899999618530273, -12.899999618530273, -11.899999618530273, -10.899999618530273, -9.899999618530273, -8.899999618530273, -7.900000095367432, -6.900000095367432, -5.900000095367432, -4.900000095367432, -3.9000000953674316, -2.9000000953674316, -1.899999976158142, -0.8999999761581421, 0.10000000149011612, 1.100000023841858, 2.0999999046325684, 3.0999999046325684, 4.099999904632568, 5.099999904632568, 6.099999904632568, 7.099999904632568, 8.100000381469727, 9.100000381469727, 10.100000381469727, 11.100000381469727, 12.100000381469727, 13.100000381469727, 14.100000381469727]
         assert lazy["af4"].tolist() == [[-13.899999618530273, -12.899999618530273, -11.899999618530273], [-12.899999618530273, -11.899999618530273, -10.899999618530273], [-11.899999618530273, -10.899999618530273, -9.899999618530273], [-10.899999618530273, -9.899999618530273, -8.899999618530273], [-9.899999618530273, -8.899999618530273, -7.900000095367432], [-8.899999618530273, -7.900000095367432, -6.900000095367432], [-7.900000095367432, -6.900000095367432, -5.900000095367432], [-6.900000095367432, -5.900000095367432, -4.900000095367432], [-5.900000095367432, -4.900000095367432, -3.9000000953674316], [-4.900000095367432, -3.9000000953674316, -2.9000000953674316], [-3.9000000953674316, -2.9000000953674316, -1.899999976158142], [-2.9000000953674316, -1.899999976158142, -0.8999999761581421], [-1.899999976158142, -0.8999999761581421, 0.10000000149011612], [-0.8999999761581421, 0.10000000149011612, 1.100000023841858], [0.10000000149011612, 1.100000023841858, 2.0999999046325684], [1.100000023841858, 2.0999999046325684, 3.0999999046325684], [2.0999999046325684, 3.0999999046325684, 4.099999904632568], [3.0999999046325684, 4.099999904632568, 5.099999904632568], [4.099999904632568, 5.099999904632568, 6.099999904632568], [5.099999904632568, 6.099999904632568, 7.099999904632568], [6.099999904632568, 7.099999904632568, 8.100000381469727], [7.099999904632568, 8.100000381469727, 9.100000381469727], [8.100000381469727, 9.100000381469727, 10.100000381469727], [9.100000381469727, 10.100000381469727, 11.100000381469727], [10.100000381469727, 11.100000381469727, 12.100000381469727], [11.100000381469727, 12.100000381469727, 13.100000381469727], [12.100000381469727, 13.100000381469727, 14.100000381469727], [13.100000381469727, 14.100000381469727, 15.100000381469727], [14.100000381469727, 15.100000381469727, 16.100000381469727], [15.100000381469727, 16.100000381469727, 17.100000381469727], [-13.899999618530273, -12.899999618530273, -11.899999618530273], [-12.899999618530273, -11.899999618530273, -10.899999618530273], [-11.899999618530273, -10.899999618530273, -9.899999618530273], [-10.899999618530273, -9.899999618530273, -8.899999618530273], [-9.899999618530273, -8.899999618530273, -7.900000095367432], [-8.899999618530273, -7.900000095367432, -6.900000095367432], [-7.900000095367432, -6.900000095367432, -5.900000095367432], [-6.900000095367432, -5.900000095367432, -4.900000095367432], [-5.900000095367432, -4.900000095367432, -3.9000000953674316], [-4.900000095367432, -3.9000000953674316, -2.9000000953674316], [-3.9000000953674316, -2.9000000953674316, -1.899999976158142], [-2.9000000953674316, -1.899999976158142, -0.8999999761581421], [-1.899999976158142, -0.8999999761581421, 0.10000000149011612], [-0.8999999761581421, 0.10000000149011612, 1.100000023841858], [0.10000000149011612, 1.100000023841858, 2.0999999046325684], [1.100000023841858, 2.0999999046325684, 3.0999999046325684], [2.0999999046325684, 3.0999999046325684, 4.099999904632568], [3.0999999046325684, 4.099999904632568, 5.099999904632568], [4.099999904632568, 5.099999904632568, 6.099999904632568], [5.099999904632568, 6.099999904632568, 7.099999904632568], [6.099999904632568, 7.099999904632568, 8.100000381469727], [7.099999904632568, 8.100000381469727, 9.100000381469727], [8.100000381469727, 9.100000381469727, 10.100000381469727], [9.100000381469727, 10.100000381469727, 11.100000381469727], [10.100000381469727, 11.100000381469727, 12.100000381469727], [11.100000381469727, 12.100000381469727, 13.100000381469727], [12.100000381469727, 13.100000381469727, 14.100000381469727], [13.100000381469727, 14.100000381469727, 15.100000381469727], [14.100000381469727, 15.100000381469727, 16.100000381469727], [15.100000381469727, 16.100000381469727, 17.100000381469727]]
 
+    def test_tree_lazy_compact(self):
+        tree = uproot.open("tests/samples/HZZ-zlib.root")["events"]
+        lazy = tree.lazyarrays(["NJet", "Jet_Px"], entrysteps=10)
+        chunks = lazy["Jet_Px"].chunks
+        assert len(chunks) == 243 and len(chunks.made) == 0
+        assert lazy["NJet"].chunks.steps is chunks.steps
+
+        strict = tree.array("Jet_Px")
+        assert lazy["Jet_Px"][95:125].tolist() == strict[95:125].tolist()
+        assert sorted(i for i, x in chunks.made.items() if x.ismaterialized) == [9, 10, 11, 12]
+        assert len(chunks.made) <= 5
+        assert chunks.generator.prefetched == {}
+        assert len(lazy["NJet"].chunks.made) == 0
+
+        assert lazy["NJet"].sum() == tree.array("NJet").sum()
+        assert lazy["Jet_Px"][[5, 2000, -1]].tolist() == strict[[5, 2000, -1]].tolist()
+        assert lazy["Jet_Px"].tolist() == strict.tolist()
+
     def test_tree_lazy_cached(self):
         tree = uproot.open("tests/samples/sample-5.30.00-uncompressed.root")["sample"]
 
@@ -674,4 +823,476 @@ class Test(object):
     def test_mempartitions(self):
         t = uproot.open("tests/samples/sample-5.23.02-zlib.root")["sample"]
         assert list(t.mempartitions(500)) == [(0, 2), (2, 4), (4, 6), (6, 8), (8, 10), (10, 12), (12, 14), (14, 16), (16, 18), (18, 20), (20, 22), (22, 24), (24, 26), (26, 28), (28, 30)]
-        assert [sum(y.nbytes for y in x.values()) for x in t.iterate(entrysteps="0.5 kB")] == [693, 865, 822, 779, 951, 695, 867, 824, 781, 953, 695, 867, 824, 781, 953]
+        assert [sum(y.nbytes for y in x.values()) for x in t.iterate(entrysteps="0.5 kB")] == [693, 459, 502, 822, 416, 865, 545, 695, 460, 503, 546, 695, 867, 546, 374, 781, 503, 546, 695, 460, 503, 546]
+
+    def test_clusters(self):
+        t = uproot.open("tests/samples/sample-6.10.05-zlib.root")["sample"]
+        assert t["n"]._entryoffsets == [0, 7, 14, 21, 28, 30]
+        assert t["ab"]._entryoffsets == [0, 9, 18, 27, 30]
+        assert list(t.clusters(["n"])) == [(0, 7), (7, 14), (14, 21), (21, 28), (28, 30)]
+        assert list(t.clusters(["n"], entrystart=10, entrystop=22)) == [(7, 14), (14, 21), (21, 28)]
+        assert list(t.clusters(["n"], entrystart=10, entrystop=22, strict=True)) == [(14, 21)]
+        assert list(t.clusters(["n", "ab"])) == [(0, 30)]
+        assert t._clustercache[(b"ab", b"n")].tolist() == [0, 30]
+
+        # TTree cluster metadata are used when the baskets agree with them
+        t = uproot.open("tests/samples/small-dy-nooffsets.root")["tree"]
+        assert t._fAutoFlush == 200
+        assert list(t.clusters()) == [(0, 200), (200, 400), (400, 501)]
+
+        t = uproot.open("tests/samples/sample-6.10.05-zlib.root")["sample"]
+        t._fAutoFlush, t._fNClusterRange, t._fClusterRangeEnd, t._fClusterSize = 7, 1, numpy.array([13]), numpy.array([3])
+        assert t._clustermetadata().tolist() == [0, 3, 6, 9, 12, 14, 21, 28, 30]
+        assert list(t.clusters(["n"])) == [(0, 7), (7, 14), (14, 21), (21, 28), (28, 30)]
+        t._fAutoFlush, t._fNClusterRange = 7, 0
+        t._clustercache = {}
+        assert list(t.clusters(["n"])) == [(0, 7), (7, 14), (14, 21), (21, 28), (28, 30)]
+        t._fAutoFlush = -30000000
+        assert t._clustermetadata() is None
+
+    def test_mempartitions_nonlinear(self):
+        t = uproot.open("tests/samples/sample-6.10.05-zlib.root")["sample"]
+        branches = list(t._normalize_branches(["Ai4"], awkward))
+        for numbytes in [100, 200, 400]:
+            partitions = list(t.mempartitions(numbytes, branches=["Ai4"], linear=False))
+            assert partitions[0][0] == 0 and partitions[-1][1] == t.numentries
+            assert all(stop == nextstart for (start, stop), (nextstart, nextstop) in zip(partitions[:-1], partitions[1:]))
+            for start, stop in partitions[:-1]:
+                assert stop in t["Ai4"]._entryoffsets
+                assert abs(t._numbytes(branches, start, stop, None) - numbytes) <= numbytes / 2.0
+            assert list(t["Ai4"].mempartitions(numbytes, linear=False)) == partitions
+
+        assert list(t.mempartitions(200, branches=["Ai4"], linear=False)) == [(0, 13), (13, 24), (24, 30)]
+        assert list(t.mempartitions(200, branches=["Ai4"], entrystart=5, entrystop=20, linear=False)) == [(5, 18), (18, 20)]
+        assert [(start, stop) for start, stop, arrays in t.iterate(["Ai4"], entrysteps="200 B", reportentries=True)] == [(0, 13), (13, 24), (24, 30)]
+        assert [len(x) for x in t.lazyarrays(["Ai4"], entrysteps="200 B")["Ai4"].chunks] == [13, 11, 6]
+
+    def test_cut(self):
+        t = uproot.open("tests/samples/sample-6.10.05-zlib.root")["sample"]
+        names = ["n", "i8", "Ai4", "str", "f8"]
+        full = t.arrays(names)
+        selection = (full[b"n"] % 2 == 0) & (full[b"f8"] > -10)
+        for cut in ["(n % 2 == 0) & (f8 > -10)", lambda n, f8: (n % 2 == 0) & (f8 > -10)]:
+            arrays = t.arrays(names, cut=cut)
+            for name in names:
+                assert arrays[name.encode()].tolist() == full[name.encode()][selection].tolist()
+        assert t.arrays(["Ai4"], cut="n == 3", flatten=True)[b"Ai4"].tolist() == full[b"Ai4"][full[b"n"] == 3].flatten().tolist()
+        assert t.arrays(["str"], cut="n > 100")[b"str"].tolist() == []
+
+        basketcache = {}
+        arrays = t.arrays(["i8", "Ai4"], cut="i4 == 12", basketcache=basketcache)
+        assert arrays[b"i8"].tolist() == [12] and arrays[b"Ai4"].tolist() == [[10, 12]]
+        assert len(basketcache) == t["i4"].numbaskets + 2
+
+        steps = [(start, stop, arrays[b"i8"].tolist()) for start, stop, arrays in t.iterate(["i8"], entrysteps=10, reportentries=True, cut="n == 1")]
+        assert steps == [(0, 10, [-14, -9]), (10, 20, [-4, 1]), (20, 30, [6, 11])]
+
+        with pytest.raises(ValueError):
+            t.arrays(["i8"], cut="nonexistent > 0")
+        with pytest.raises(ValueError):
+            t.arrays(["i8"], cut="Ai4")
+
+    def test_cut_pandas(self):
+        pytest.importorskip("pandas")
+        t = uproot.open("tests/samples/sample-6.10.05-zlib.root")["sample"]
+        df = t.pandas.df(["i8"], cut="n == 3")
+        assert df.index.tolist() == [3, 8, 13, 18, 23, 28]
+        assert df["i8"].tolist() == [-12, -7, -2, 3, 8, 13]
+        df = t.pandas.df(["Ai4"], cut="n == 3")
+        assert df.index.get_level_values("entry").tolist() == [3, 3, 3, 8, 8, 8, 13, 13, 13, 18, 18, 18, 23, 23, 23, 28, 28, 28]
+        df = list(uproot.pandas.iterate(["tests/samples/sample-6.10.05-zlib.root"] * 2, "sample", ["i8"], cut="n == 3"))
+        assert sum([x.index.tolist() for x in df], []) == [3, 8, 13, 18, 23, 28, 33, 38, 43, 48, 53, 58]
+
+    def test_entries(self):
+        t = uproot.open("tests/samples/sample-6.10.05-zlib.root")["sample"]
+        names = ["n", "i8", "Ai4", "str"]
+        full = t.arrays(names)
+        entries = numpy.array([1, 2, 9, 20, 29])
+        mask = numpy.zeros(t.numentries, dtype=numpy.bool_)
+        mask[entries] = True
+        for selection in [entries, mask]:
+            arrays = t.arrays(names, entries=selection)
+            for name in names:
+                assert arrays[name.encode()].tolist() == full[name.encode()][entries].tolist()
+        assert t.array("Ai4", entries=entries, flatten=True).tolist() == full[b"Ai4"][entries].flatten().tolist()
+        assert t["n"].array(entries=entries, entrystart=5, entrystop=25).tolist() == [4, 0]
+        assert t.array("str", entries=[]).tolist() == []
+        assert t.arrays(["i8"], entries=entries, cut="n > 1")[b"i8"].tolist() == [-13, -6, 14]
+
+        basketcache = {}
+        t.array("Ai4", entries=entries, basketcache=basketcache)
+        assert len(basketcache) == len(set(numpy.searchsorted(t["Ai4"]._entryoffsets, entries, side="right")))
+
+        lazy = t.lazyarrays(["Ai4"], entries=entries, entrysteps=10)
+        assert [len(x) for x in lazy["Ai4"].chunks] == [3, 0, 2]
+        assert lazy["Ai4"].tolist() == full[b"Ai4"][entries].tolist()
+
+        with pytest.raises(ValueError):
+            t.array("n", entries=[3, 1])
+        with pytest.raises(IndexError):
+            t.array("n", entries=[3, 30])
+        with pytest.raises(ValueError):
+            t.array("n", entries=mask[:-1])
+
+    def test_zonemap(self, tmpdir):
+        t = uproot.open("tests/samples/sample-6.10.05-zlib.root")["sample"]
+        zonemap = uproot.ZoneMap()
+        full = t.arrays(["i4", "i8", "Ai4", "n"], zonemap=zonemap)
+        zones = zonemap.zones(t["i4"], t["i4"].interpretation)
+        assert zones["min"].tolist() == [-15, -8, -1, 6, 13]
+        assert zones["max"].tolist() == [-9, -2, 5, 12, 14]
+        assert zones["entries"].tolist() == [7, 7, 7, 7, 2]
+        zones = zonemap.zones(t["Ai4"], t["Ai4"].interpretation)
+        assert zones["items"].sum() == len(full[b"Ai4"].content)
+        assert zonemap.zones(t["str"], t["str"].interpretation) is None
+
+        for cut, selection in [("(i4 >= 12) & (n > 0)", (full[b"i4"] >= 12) & (full[b"n"] > 0)),
+                               ("(Ai4 > 14).any()", (full[b"Ai4"] > 14).any()),
+                               ("-3 == i4", full[b"i4"] == -3),
+                               ("i4 > 100", full[b"i4"] > 100)]:
+            basketcache = {}
+            assert t.arrays(["i8"], cut=cut, zonemap=zonemap, basketcache=basketcache)[b"i8"].tolist() == full[b"i8"][selection].tolist()
+            assert len(basketcache) < t["i4"].numbaskets + t["n"].numbaskets + t["i8"].numbaskets
+
+        path = str(tmpdir.join("zones.json"))
+        zonemap.save(path)
+        loaded = uproot.ZoneMap(path)
+        assert len(loaded) == len(zonemap)
+        basketcache = {}
+        steps = [arrays[b"i8"].tolist() for arrays in t.iterate(["i8"], entrysteps=10, cut="i4 == -3", zonemap=loaded, basketcache=basketcache)]
+        assert steps == [[], [-3], []]
+        assert len([x for x in basketcache if ";i4;" in x]) == 1
+
+    def test_histogram(self, tmpdir):
+        tree = uproot.open("tests/samples/HZZ-zlib.root")["events"]
+        px, py, muon, nmuon, weight = tree.arrays(["MET_px", "MET_py", "Muon_Px", "NMuon", "EventWeight"], outputtype=tuple)
+
+        h = tree.histogram("MET_px", bins=20, range=(-100, 100), entrysteps=500)
+        counts, edges = numpy.histogram(px, bins=20, range=(-100, 100))
+        assert h.values.tolist() == counts.tolist()
+        assert h.underflows == (px < -100).sum() and h.overflows == (px >= 100).sum()
+        assert h._fEntries == len(px)
+        assert numpy.isclose(h._fTsumwx, px[(px >= -100) & (px < 100)].sum())
+
+        selection = nmuon >= 2
+        h = tree.histogram("sqrt(Muon_Px**2)", bins=[0, 10, 50, 100], weight="EventWeight", cut="NMuon >= 2")
+        items = abs(muon[selection].flatten())
+        counts, edges = numpy.histogram(items, bins=[0, 10, 50, 100], weights=muon[selection].tojagged(weight[selection]).flatten())
+        assert numpy.allclose(h.values[:-1], counts[:-1])
+        assert h.alledges[1:-1].tolist() == [0, 10, 50, 100]
+
+        with uproot.Scheduler(2) as scheduler:
+            h2 = tree.histogram(("MET_px", "MET_py"), bins=(5, 4), range=((-50, 50), (-50, 50)), executor=scheduler, entrysteps=300)
+        counts, xedges, yedges = numpy.histogram2d(px, py, bins=(5, 4), range=((-50, 50), (-50, 50)))
+        assert numpy.array(h2.values).tolist() == counts.tolist()
+        assert h2._fTitle == b"MET_py vs MET_px"
+
+        h = uproot.histogram(["tests/samples/HZZ-zlib.root", "tests/samples/HZZ-lzma.root"], "events", "MET_px")
+        assert h.alledges[1] == px.min() and h.alledges[-2] == numpy.nextafter(float(px.max()), numpy.inf)
+        assert h.values.sum() == 2 * len(px) and h.underflows == 0 and h.overflows == 0
+
+        h = uproot.histogram(["tests/samples/sample-5.23.02-zlib.root", "tests/samples/sample-6.08.04-zlib.root", "tests/samples/sample-6.10.05-zlib.root"], "sample", "i8")
+        assert h.values.sum() == 90 and h.overflows == 0
+
+        path = str(tmpdir.join("histograms.root"))
+        with uproot.recreate(path) as f:
+            f["h"] = h
+            f["h2"] = h2
+        f = uproot.open(path)
+        assert f["h"].values.tolist() == h.values.tolist()
+        assert numpy.array(f["h2"].values).tolist() == numpy.array(h2.values).tolist()
+
+    def test_reducers(self):
+        tree = uproot.open("tests/samples/HZZ-zlib.root")["events"]
+        px, muon, nmuon, weight = tree.arrays(["MET_px", "Muon_Px", "NMuon", "EventWeight"], outputtype=tuple)
+        selection = nmuon >= 2
+
+        assert tree.count() == tree.numentries
+        assert tree.count(entrystart=100, entrystop=150) == 50
+        assert tree.count(cut="NMuon >= 2", entrysteps=700) == selection.sum()
+        assert tree.count("Muon_Px") == len(muon.flatten())
+        assert numpy.isclose(tree.sum("MET_px", entrysteps=100), px.sum())
+        assert numpy.isclose(tree.sum("MET_px", weight="EventWeight"), (px * weight).sum())
+        assert numpy.isclose(tree.mean("Muon_Px", cut="NMuon >= 2"), muon[selection].flatten().mean())
+        assert numpy.isclose(tree.mean("MET_px", weight="EventWeight", cut=lambda NMuon: NMuon >= 2), (px * weight)[selection].sum() / weight[selection].sum())
+        assert tree.min("Muon_Px") == muon.flatten().min()
+        assert tree.max("MET_px", cut="NMuon == 1") == px[nmuon == 1].max()
+
+        with pytest.raises(ValueError):
+            tree.min("MET_px", cut="NMuon > 1000")
+
+    def test_eval(self):
+        tree = uproot.open("tests/samples/HZZ-zlib.root")["events"]
+        px, py, muon, nmuon = tree.arrays(["MET_px", "MET_py", "Muon_Px", "NMuon"], outputtype=tuple)
+
+        for backend in ["numpy", "auto"]:
+            uproot.interp.kernels.setbackend(backend)
+            try:
+                assert numpy.allclose(tree.eval("sqrt(MET_px**2 + MET_py**2)", entrysteps=500), numpy.sqrt(px**2 + py**2))
+                assert tree.eval("MET_px > 0 && !(NMuon == 0) || MET_py < -50").tolist() == (((px > 0) & (nmuon != 0)) | (py < -50)).tolist()
+                assert tree.eval("1 < NMuon < 3", entrystart=100, entrystop=900).tolist() == (nmuon[100:900] == 2).tolist()
+                # "!" binds tighter than comparisons, as in C++
+                assert tree.eval("!MET_px > 0").tolist() == ((px == 0) > 0).tolist()
+                assert tree.eval("!(MET_px > 0)").tolist() == (px <= 0).tolist()
+                assert tree.eval(" !NMuon").tolist() == (nmuon == 0).tolist()
+            finally:
+                uproot.interp.kernels.setbackend("auto")
+
+        assert tree.eval("Muon_Px * 2 + NMuon", entrysteps=700).tolist() == (muon * 2 + nmuon).tolist()
+        assert tree.eval("Muon_Px[0]", cut="NMuon >= 1").tolist() == muon[nmuon >= 1][:, 0].tolist()
+        assert tree.eval("Muon_Px.counts").tolist() == muon.counts.tolist()
+        assert [len(x) for x in tree.itereval("MET_px * 2", entrysteps=1000)] == [1000, 1000, 421]
+        assert len(tree.eval("MET_px + 1", entrystart=5, entrystop=5)) == 0
+        assert tree.eval("NMuon", cut="!(NMuon > 1)").tolist() == nmuon[nmuon <= 1].tolist()
+
+        for bad in ["MET_px +", "nope * 2", "MET_px.sum()"]:
+            with pytest.raises(ValueError):
+                tree.eval(bad)
+
+    def test_eval_aliases(self):
+        tree = uproot.open("tests/samples/issue447.root")["l1uGTTree/L1uGTTree"]
+        decisions = tree.array("m_algoDecisionInitial")
+        assert tree.aliases[b"L1_AlwaysTrue"] == b"L1uGT.m_algoDecisionInitial[458]"
+        assert tree.eval("L1_AlwaysTrue").tolist() == decisions[:, 458].tolist()
+        assert tree.eval("L1_AlwaysTrue && !L1_BptxOR").tolist() == (decisions[:, 458] & ~decisions[:, 464]).tolist()
+        assert tree.eval("L1uGT.m_algoDecisionInitial[458:460]").tolist() == decisions[:, 458:460].tolist()
+
+    @pytest.mark.skipif(sys.version_info < (3, 8), reason="processes requires Python 3.8 or later")
+    def test_iterate_processes(self):
+        import uproot._processes
+        tree = uproot.open("tests/samples/HZZ.root")["events"]
+        expect = [dict(x) for x in tree.iterate(["Muon_Px", "NJet"], entrysteps=700, namedecode="utf-8")]
+        got = [dict(x) for x in tree.iterate(["Muon_Px", "NJet"], entrysteps=700, namedecode="utf-8", processes=2)]
+        assert [x.keys() for x in got] == [x.keys() for x in expect]
+        assert [x["Muon_Px"].tolist() for x in got] == [x["Muon_Px"].tolist() for x in expect]
+        assert [x["NJet"].tolist() for x in got] == [x["NJet"].tolist() for x in expect]
+
+        got = sorted(tree.iterate("NJet", entrysteps=700, reportentries=True, outputtype=tuple, processes=2, ordered=False, prefetch=1))
+        assert [(start, stop) for start, stop, arrays in got] == [(start, stop) for start, stop, arrays in tree.iterate("NJet", entrysteps=700, reportentries=True)]
+        assert numpy.concatenate([arrays[0] for start, stop, arrays in got]).tolist() == tree.array("NJet").tolist()
+
+        got = list(tree.iterate(["Muon_Px", "NJet"], entrysteps=700, outputtype=namedtuple, namedecode="utf-8", cut="NJet > 0", processes=1))
+        assert numpy.concatenate([x.NJet for x in got]).tolist() == tree.arrays("NJet", cut="NJet > 0")[b"NJet"].tolist()
+
+        paths = ["tests/samples/sample-5.23.02-zlib.root", "tests/samples/sample-6.08.04-zlib.root"]
+        expect = list(uproot.iterate(paths, "sample", ["i8", "str"], entrysteps=7, reportentries=True))
+        got = list(uproot.iterate(paths, "sample", ["i8", "str"], entrysteps=7, reportentries=True, processes=2))
+        assert [(start, stop) for start, stop, arrays in got] == [(start, stop) for start, stop, arrays in expect]
+        assert [arrays[b"i8"].tolist() for start, stop, arrays in got] == [arrays[b"i8"].tolist() for start, stop, arrays in expect]
+        assert [arrays[b"str"].tolist() for start, stop, arrays in got] == [arrays[b"str"].tolist() for start, stop, arrays in expect]
+
+        # cluster and memory-size steps
+        for entrysteps in [None, "100 B"]:
+            expect = list(uproot.iterate(paths, "sample", ["i8"], entrysteps=entrysteps, reportentries=True))
+            got = list(uproot.iterate(paths, "sample", ["i8"], entrysteps=entrysteps, reportentries=True, processes=2))
+            assert len(got) > len(paths)
+            assert [(start, stop, arrays[b"i8"].tolist()) for start, stop, arrays in got] == [(start, stop, arrays[b"i8"].tolist()) for start, stop, arrays in expect]
+
+        tree = uproot.open("tests/samples/issue371.root")["Event"]
+        expect = tree.array("Primary.")
+        got = numpy.concatenate([x[b"Primary."] for x in tree.iterate("Primary.", entrysteps=1, processes=2)])
+        assert [x.__class__.__name__ for x in got] == [x.__class__.__name__ for x in expect]
+        assert [x.__dict__.keys() for x in got] == [x.__dict__.keys() for x in expect]
+
+        # trees in subdirectories are opened again by their full path; errors in workers come back as plain exceptions
+        tree = uproot.open("tests/samples/issue447.root")["l1uGTTree/L1uGTTree"]
+        got = list(tree.iterate("m_algoDecisionInitial", outputtype=tuple, processes=2))
+        assert [x[0].flatten().tolist() for x in got] == [tree.array("m_algoDecisionInitial").flatten().tolist()]
+        job = uproot._processes._Job(tree, "tests/samples/issue447.root", "nonexistent", (uproot.source.memmap.MemmapSource.defaults, uproot.source.xrootd.XRootDSource.defaults, uproot.source.http.HTTPSource.defaults), {}, [], [(0, 1)], {})
+        with pytest.raises(KeyError):
+            list(uproot._processes.iterate(1, [job]))
+
+        tree = uproot.open("tests/samples/issue371.root")["Event"]
+        with pytest.raises(ValueError):
+            list(tree.iterate("Primary.", processes=0))
+        with pytest.raises(ValueError):
+            list(tree.iterate("Primary.", processes=2, executor=object()))
+
+    def test_iterate_prefetchfiles(self):
+        import concurrent.futures
+        paths = ["tests/samples/sample-5.23.02-zlib.root", "tests/samples/sample-5.30.00-zlib.root", "tests/samples/sample-6.08.04-zlib.root"]
+        expect = list(uproot.iterate(paths, "sample", ["i8", "str"], entrysteps=7, reportentries=True))
+        executor = concurrent.futures.ThreadPoolExecutor(2)
+        for basketcache in [None, {}]:
+            got = list(uproot.iterate(paths, "sample", ["i8", "str"], entrysteps=7, reportentries=True, executor=executor, prefetchfiles=2, basketcache=basketcache))
+            assert [(start, stop) for start, stop, arrays in got] == [(start, stop) for start, stop, arrays in expect]
+            assert [arrays[b"i8"].tolist() for start, stop, arrays in got] == [arrays[b"i8"].tolist() for start, stop, arrays in expect]
+            assert [arrays[b"str"].tolist() for start, stop, arrays in got] == [arrays[b"str"].tolist() for start, stop, arrays in expect]
+
+        steps = uproot.iterate(paths, "sample", "i8", executor=executor, prefetchfiles=2)
+        assert next(steps)[b"i8"].tolist() == uproot.open(paths[0])["sample"].array("i8").tolist()
+        steps.close()
+
+        # files opened ahead have the baskets of their first step read, whatever the kind of steps
+        tree = uproot.open(paths[2])["sample"]
+        branchesinterp = dict((branch.name, interpretation) for branch, interpretation in tree._normalize_branches(["i8", "str"], awkward))
+        for entrysteps in [None, "100 B", 7, float("inf")]:
+            basketcache = {}
+            uproot.tree._warmfirststep(tree, branchesinterp, entrysteps, awkward, basketcache, {})
+            start, stop = next(iter(tree._normalize_entrysteps(entrysteps, branchesinterp, 0, tree.numentries, {})))
+            assert set(basketcache) == set(tree[name]._basketcachekey(i) for name in branchesinterp for i in range(*tree[name]._basketstartstop(start, stop)))
+
+        with pytest.raises(ValueError):
+            list(uproot.iterate(paths, "sample", "i8", prefetchfiles=1))
+
+    def test_iterate_acrossfiles(self):
+        paths = ["tests/samples/sample-5.23.02-zlib.root", "tests/samples/sample-5.30.00-zlib.root", "tests/samples/sample-6.08.04-zlib.root"]
+        i8 = numpy.concatenate([uproot.open(x)["sample"].array("i8") for x in paths])
+        Ai8 = [y for x in paths for y in uproot.open(x)["sample"].array("Ai8").tolist()]
+
+        got = list(uproot.iterate(paths, "sample", ["i8", "Ai8", "str"], entrysteps=40, reportentries=True, acrossfiles=True))
+        assert [(start, stop) for start, stop, arrays in got] == [(0, 40), (40, 80), (80, 90)]
+        assert numpy.concatenate([arrays[b"i8"] for start, stop, arrays in got]).tolist() == i8.tolist()
+        assert [y for start, stop, arrays in got for y in arrays[b"Ai8"].tolist()] == Ai8
+
+        got = list(uproot.iterate(paths, "sample", ["i8"], entrysteps=40, outputtype=namedtuple, cut="i8 > 0", acrossfiles=True))
+        assert numpy.concatenate([arrays.i8 for arrays in got]).tolist() == i8[i8 > 0].tolist()
+
+        got = list(uproot.iterate(paths, "sample", ["i8", "Ai8"], entrysteps="1 kB", acrossfiles=True, blocking=False))
+        assert numpy.concatenate([arrays()[b"i8"] for arrays in got]).tolist() == i8.tolist()
+
+        with pytest.raises(ValueError):
+            list(uproot.iterate(paths, "sample", ["i8"], entrysteps=None, acrossfiles=True))
+
+    def test_iterate_acrossfiles_pandas(self):
+        pandas = pytest.importorskip("pandas")
+        paths = ["tests/samples/sample-5.23.02-zlib.root", "tests/samples/sample-5.30.00-zlib.root", "tests/samples/sample-6.08.04-zlib.root"]
+        expect = pandas.concat(list(uproot.iterate(paths, "sample", ["i8", "Ai8"], outputtype=pandas.DataFrame)))
+        got = list(uproot.iterate(paths, "sample", ["i8", "Ai8"], entrysteps=40, outputtype=pandas.DataFrame, acrossfiles=True))
+        assert len(got) == 3
+        assert pandas.concat(got).equals(expect)
+
+    def test_scan(self, tmpdir):
+        paths = ["tests/samples/sample-5.23.02-zlib.root", "tests/samples/sample-6.08.04-zlib.root", "tests/samples/HZZ.root"]
+        filename = os.path.join(str(tmpdir), "manifest.json")
+        manifest = uproot.scan(paths, "sample", ["i8", "Ai8"], manifest=filename)
+        assert manifest.paths == paths
+        assert manifest.numentries(total=False) == uproot.numentries(paths, "sample", total=False)
+        assert list(manifest.files[paths[0]]["branches"]) == ["i8", "Ai8"]
+        assert manifest.files[paths[0]]["branches"]["i8"]["uncompressedbytes"] > 0
+        assert not manifest.files[paths[2]]["hastree"]
+
+        loaded = uproot.Manifest(filename)
+        assert loaded.files == manifest.files
+        assert uproot.numentries(loaded, "sample") == 60
+        assert len(uproot.scan(paths, "sample", ["i8", "Ai8"], manifest=loaded)) == 3
+
+        expect = numpy.concatenate([uproot.open(x)["sample"].array("i8") for x in paths[:2]])
+        assert numpy.concatenate([x[b"i8"] for x in uproot.iterate(loaded, "sample", "i8", entrysteps="1 kB", acrossfiles=True)]).tolist() == expect.tolist()
+        assert uproot.lazyarrays(loaded, "sample", "i8")["i8"].tolist() == expect.tolist()
+
+        with pytest.raises(ValueError):
+            list(uproot.iterate(loaded, "other", "i8"))
+
+    def test_partitions(self):
+        units = uproot.partitions("tests/samples/small-dy-nooffsets.root", "tree", 20000)
+        assert units == [[("tests/samples/small-dy-nooffsets.root", 0, 400)], [("tests/samples/small-dy-nooffsets.root", 400, 501)]]
+        assert uproot.partitions("tests/samples/small-dy-nooffsets.root", "tree", "10 kB", compressed=True) == [[("tests/samples/small-dy-nooffsets.root", 0, 400)], [("tests/samples/small-dy-nooffsets.root", 400, 501)]]
+
+        paths = ["tests/samples/sample-5.23.02-zlib.root", "tests/samples/sample-5.24.00-zlib.root", "tests/samples/sample-6.10.05-zlib.root", "tests/samples/HZZ.root"]
+        # clusters of 28, 28, 28, 28, 8 bytes in each file; a file without the TTree is skipped
+        assert uproot.partitions(paths, "sample", 100, ["n"]) == [[(paths[0], 0, 28)], [(paths[0], 28, 30), (paths[1], 0, 21)], [(paths[1], 21, 30), (paths[2], 0, 14)], [(paths[2], 14, 30)]]
+
+        with pytest.raises(ValueError):
+            uproot.partitions(paths, "sample", 0)
+
+    def test_filepool(self, tmpdir):
+        paths = ["tests/samples/sample-5.23.02-zlib.root", "tests/samples/sample-6.08.04-zlib.root", "tests/samples/sample-6.10.05-zlib.root"]
+        pool = uproot.FilePool(capacity=1)
+        one = pool.open(paths[0])
+        assert pool.open(paths[0]) is one
+        tree = pool.tree(paths[0], "sample")
+        assert pool.tree(paths[0], "sample") is tree and tree.array("i8").tolist() == list(range(-15, 15))
+
+        # files in use stay open beyond capacity; idle ones are closed, least recently used first
+        two = pool.tree(paths[1], "sample")
+        assert len(pool) == 2
+        pool.release(two)
+        assert len(pool) == 1 and paths[0] in pool
+        for i in range(4):
+            one.close()
+        pool.open(paths[2]).close()
+        assert len(pool) == 1 and paths[2] in pool and paths[0] not in pool
+        reopened = pool.open(paths[0])
+        assert reopened is not one
+        with pytest.raises(KeyError):
+            pool.tree(paths[1], "nonexistent")
+        assert len(pool) == 1 and paths[0] in pool
+        reopened.close()
+        pool.clear()
+        assert len(pool) == 0
+        pool.capacity = 0
+        pool.release(pool.open(paths[0]))
+        assert len(pool) == 0
+
+        # a file that changed on disk is opened again
+        filename = os.path.join(str(tmpdir), "sample.root")
+        shutil.copy(paths[0], filename)
+        pool.capacity = 4
+        old = pool.open(filename)
+        old.close()
+        shutil.copy(paths[1], filename)
+        os.utime(filename, (0, 0))
+        new = pool.open(filename)
+        assert new is not old and len(pool) == 1
+        new.close()
+
+        # the process-wide pool is shared by uproot.open(..., pool=True) and lazy arrays, which give files back between reads
+        file = uproot.open(paths[2], pool=True)
+        assert uproot.open(paths[2], pool=True) is file
+        lazy = file["sample"].lazyarrays(["i8"], entrysteps=7)
+        file.close()
+        file.close()
+        assert lazy["i8"].tolist() == list(range(-15, 15))
+        assert uproot.rootio.filepool._entries[file._context.poolkey].refcount == 0
+        assert pickle.loads(pickle.dumps(lazy))["i8"].tolist() == list(range(-15, 15))
+
+    def test_treemetadata(self, tmpdir):
+        filename = os.path.join(str(tmpdir), "sample.root")
+        shutil.copy("tests/samples/sample-6.10.05-zlib.root", filename)
+        tree = uproot.open(filename)["sample"]
+        metadata = pickle.loads(pickle.dumps(tree.metadata(["i4", "Ai8", "af8"])))
+        assert set(metadata.branches) == set([b"i4", b"Ai8", b"af8", b"n"])
+        restored = metadata.tree()
+        assert restored.numentries == tree.numentries and list(restored.clusters(["i4", "Ai8"])) == list(tree.clusters(["i4", "Ai8"]))
+        expect = tree.arrays(["i4", "Ai8", "af8"], entrystart=3, entrystop=25)
+        got = restored.arrays(["i4", "Ai8", "af8"], entrystart=3, entrystop=25)
+        assert all(got[name].tolist() == expect[name].tolist() for name in expect)
+
+        # lazy arrays carry it, so reading them elsewhere doesn't parse the file again
+        lazy = pickle.loads(pickle.dumps(tree.lazyarrays(["i4", "Ai8"], entrysteps=7, persistvirtual=True)))
+        assert lazy["Ai8"].tolist() == tree.array("Ai8").tolist()
+
+        with pytest.raises(ValueError):
+            uproot.open("tests/samples/small-evnt-tree-nosplit.root")["tree"].metadata(["evt"])
+        state = metadata.__getstate__()
+        state["version"] += 1
+        with pytest.raises(ValueError):
+            uproot.TTreeMetadata.__new__(uproot.TTreeMetadata).__setstate__(state)
+
+        # a different file at the same path is refused
+        shutil.copy("tests/samples/sample-6.08.04-zlib.root", filename)
+        with pytest.raises(ValueError):
+            metadata.tree()
+
+    def test_daskframe(self):
+        pandas = pytest.importorskip("pandas")
+        pytest.importorskip("dask.dataframe")
+        paths = ["tests/samples/sample-5.23.02-zlib.root", "tests/samples/sample-6.08.04-zlib.root", "tests/samples/HZZ.root"]
+        frame = uproot.daskframe(paths, "sample", ["i8", "ai4", "Ai8"], flatten=True, entrysteps=7)
+        assert frame.npartitions == 10
+        assert frame.divisions[:3] == (0, 7, 14) and frame.divisions[-1] == 59
+        got = frame.compute()
+        expect = [uproot.open(x)["sample"].pandas.df(["i8", "ai4", "Ai8"], flatten=True) for x in paths[:2]]
+        assert got.index.tolist() == [entry + offset for one, offset in zip(expect, [0, 30]) for entry, subentry in one.index]
+        assert got["subentry"].tolist() == [subentry for one in expect for entry, subentry in one.index]
+        expect = pandas.concat(expect)
+        assert got.columns.tolist() == ["subentry"] + expect.columns.tolist()
+        assert got.drop(columns="subentry").values.tolist() == expect.values.tolist()
+
+        array = uproot.daskarray(paths, "sample", "ai4", entrysteps=10)
+        assert array.chunks == ((10,) * 6, (3,))
+        assert array.compute().tolist() == numpy.concatenate([uproot.open(x)["sample"].array("ai4") for x in paths[:2]]).tolist()
+        assert uproot.daskarray(paths, "sample", "Ai8", flatten=True).compute().tolist() == expect["Ai8"].tolist()
+        with pytest.raises(NotImplementedError):
+            uproot.daskarray(paths, "sample", "Ai8")
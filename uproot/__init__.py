@@ -139,8 +139,9 @@ In Python:
 )
 
 # high-level entry points
-from uproot.rootio import open, xrootd, http
-from uproot.tree import iterate, numentries, lazyarray, lazyarrays, daskarray, daskframe
+from uproot.rootio import open, xrootd, http, FilePool
+from uproot.tree import iterate, numentries, lazyarray, lazyarrays, daskarray, daskframe, scan, Manifest, partitions, TTreeMetadata
+from uproot.reduce import histogram
 from uproot.write.TFile import TFileCreate as create
 from uproot.write.TFile import TFileRecreate as recreate
 from uproot.write.TFile import TFileUpdate as update
@@ -152,7 +153,9 @@ from uproot.source.file import FileSource
 from uproot.source.xrootd import XRootDSource
 from uproot.source.http import HTTPSource
 
-from uproot.cache import ArrayCache, ThreadSafeArrayCache
+from uproot.cache import ArrayCache, ThreadSafeArrayCache, MemoryBudget, ZoneMap
+
+from uproot.scheduler import Scheduler
 
 from uproot.interp.auto import interpret
 from uproot.interp.numerical import asdtype
@@ -169,6 +172,9 @@ from uproot.interp.objects import STLVector
 from uproot.interp.objects import STLMap
 from uproot.interp.objects import STLString
 from uproot.interp.objects import Pointer
+from uproot.interp.stl import asstlvectorvector
+from uproot.interp.stl import asstlvectorstring
+from uproot.interp.stl import asstlmap
 asdebug = asjagged(asdtype("u1"))
 
 from uproot import pandas
@@ -184,4 +190,4 @@ from uproot.version import __version__
 # don't expose uproot.uproot; it's ugly
 del uproot
 
-__all__ = ["open", "xrootd", "http", "iterate", "numentries", "lazyarray", "lazyarrays", "daskarray", "daskframe", "create", "recreate", "update", "ZLIB", "LZMA", "LZ4", "ZSTD", "newtree", "newbranch", "MemmapSource", "FileSource", "XRootDSource", "HTTPSource", "ArrayCache", "ThreadSafeArrayCache", "interpret", "asdtype", "asarray", "asdouble32", "asstlbitset", "asjagged", "astable", "asobj", "asgenobj", "asstring", "asdebug", "SimpleArray", "STLVector", "STLMap", "STLString", "Pointer", "pandas", "__version__"]
+__all__ = ["open", "xrootd", "http", "FilePool", "iterate", "numentries", "scan", "Manifest", "partitions", "TTreeMetadata", "lazyarray", "lazyarrays", "daskarray", "daskframe", "histogram", "create", "recreate", "update", "ZLIB", "LZMA", "LZ4", "ZSTD", "newtree", "newbranch", "MemmapSource", "FileSource", "XRootDSource", "HTTPSource", "ArrayCache", "ThreadSafeArrayCache", "MemoryBudget", "ZoneMap", "Scheduler", "interpret", "asdtype", "asarray", "asdouble32", "asstlbitset", "asjagged", "astable", "asobj", "asgenobj", "asstring", "asstlvectorvector", "asstlvectorstring", "asstlmap", "asdebug", "SimpleArray", "STLVector", "STLMap", "STLString", "Pointer", "pandas", "__version__"]
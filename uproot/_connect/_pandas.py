@@ -27,13 +27,13 @@ class TTreeMethods_pandas(object):
     def __init__(self, tree):
         self._tree = tree
 
-    def df(self, branches=None, namedecode="utf-8", entrystart=None, entrystop=None, flatten=True, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True):
+    def df(self, branches=None, namedecode="utf-8", entrystart=None, entrystop=None, flatten=True, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, cut=None, entries=None, zonemap=None):
         import pandas
-        return self._tree.arrays(branches=branches, outputtype=pandas.DataFrame, namedecode=namedecode, entrystart=entrystart, entrystop=entrystop, flatten=flatten, flatname=flatname, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=blocking)
+        return self._tree.arrays(branches=branches, outputtype=pandas.DataFrame, namedecode=namedecode, entrystart=entrystart, entrystop=entrystop, flatten=flatten, flatname=flatname, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=blocking, cut=cut, entries=entries, zonemap=zonemap)
 
-    def iterate(self, branches=None, entrysteps=None, namedecode="utf-8", entrystart=None, entrystop=None, flatten=True, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True):
+    def iterate(self, branches=None, entrysteps=None, namedecode="utf-8", entrystart=None, entrystop=None, flatten=True, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, prefetch=0, prefetchbytes=None, max_memory=None, cut=None, zonemap=None):
         import pandas
-        return self._tree.iterate(branches=branches, entrysteps=entrysteps, outputtype=pandas.DataFrame, namedecode=namedecode, reportentries=False, entrystart=entrystart, entrystop=entrystop, flatten=flatten, flatname=flatname, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=blocking)
+        return self._tree.iterate(branches=branches, entrysteps=entrysteps, outputtype=pandas.DataFrame, namedecode=namedecode, reportentries=False, entrystart=entrystart, entrystop=entrystop, flatten=flatten, flatname=flatname, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=blocking, prefetch=prefetch, prefetchbytes=prefetchbytes, max_memory=max_memory, cut=cut, zonemap=zonemap)
 
 def default_flatname(branchname, fieldname, index):
     out = branchname
@@ -45,7 +45,7 @@ def default_flatname(branchname, fieldname, index):
         out += "[" + "][".join(str(x) for x in index) + "]"
     return out
 
-def futures2df(futures, outputtype, entrystart, entrystop, flatten, flatname, awkward):
+def futures2df(futures, outputtype, entrystart, entrystop, flatten, flatname, awkward, entries=None):
     import pandas
 
     if flatname is None:
@@ -91,7 +91,10 @@ def futures2df(futures, outputtype, entrystart, entrystop, flatten, flatname, aw
                 columns.append(fn)
                 data[fn] = list(array)     # must be serialized as a Python list for Pandas to accept it
 
-        index = pandas.RangeIndex(entrystart, entrystop, name="entry")
+        if entries is None:
+            index = pandas.RangeIndex(entrystart, entrystop, name="entry")
+        else:
+            index = pandas.Index(entries, name="entry")
         return outputtype(columns=columns, data=data, index=index)
 
     else:
@@ -139,7 +142,9 @@ def futures2df(futures, outputtype, entrystart, entrystop, flatten, flatname, aw
             interpretations.append(interpretation)
             arrays.append(array)
 
-        index = pandas.MultiIndex.from_arrays([index.tojagged(numpy.arange(entrystart, entrystop, dtype=numpy.int64)).content, index.content], names=["entry", "subentry"])
+        if entries is None:
+            entries = numpy.arange(entrystart, entrystop, dtype=numpy.int64)
+        index = pandas.MultiIndex.from_arrays([index.tojagged(entries).content, index.content], names=["entry", "subentry"])
 
         df = outputtype(index=index)
 
@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import ast
+import numbers
+import re
+
+import numpy
+
+import uproot.interp.kernels
+
+# Expressions of branches, such as "sqrt(px**2 + py**2)" or TTree aliases. Names are
+# branches, aliases (expanded recursively), or Numpy functions; "a.b" may name the
+# subbranch "a/b"; "&&", "||", and "!" are accepted as in TTree::Draw; and x[i] or x[i:j]
+# index within each entry of a jagged or multidimensional x. Expressions are compiled
+# into closures that apply Numpy ufuncs in place on intermediate results, or, with the
+# Numba kernel backend, into one fused loop when all branches are flat numbers.
+
+_binops = {ast.Add: numpy.add, ast.Sub: numpy.subtract, ast.Mult: numpy.multiply, ast.Div: numpy.true_divide, ast.FloorDiv: numpy.floor_divide, ast.Mod: numpy.remainder, ast.Pow: numpy.power, ast.BitAnd: numpy.bitwise_and, ast.BitOr: numpy.bitwise_or, ast.BitXor: numpy.bitwise_xor, ast.LShift: numpy.left_shift, ast.RShift: numpy.right_shift}
+_binsource = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.Div: "/", ast.FloorDiv: "//", ast.Mod: "%", ast.Pow: "**", ast.BitAnd: "&", ast.BitOr: "|", ast.BitXor: "^", ast.LShift: "<<", ast.RShift: ">>"}
+_unaryops = {ast.USub: numpy.negative, ast.UAdd: numpy.positive, ast.Invert: numpy.invert, ast.Not: numpy.logical_not}
+_unarysource = {ast.USub: "-", ast.UAdd: "+", ast.Not: "not "}
+_compareops = {ast.Eq: numpy.equal, ast.NotEq: numpy.not_equal, ast.Lt: numpy.less, ast.LtE: numpy.less_equal, ast.Gt: numpy.greater, ast.GtE: numpy.greater_equal}
+_comparesource = {ast.Eq: "==", ast.NotEq: "!=", ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">="}
+
+_cppoperators = re.compile(r"&&|\|\|")
+_cppnot = re.compile(r"!(?!=)")
+
+def _translate(expr):
+    # TTree::Draw's "&&" and "||" have Python's precedence if spelled as words, but "!" binds as tightly as "~", not as
+    # loosely as "not"; it's written as "~" and the (line, column) of each one is returned, to make them logical nots
+    expr = _cppoperators.sub(lambda m: {"&&": " and ", "||": " or "}[m.group(0)], expr).strip()
+    nots = set()
+    for m in _cppnot.finditer(expr):
+        line = expr.count("\n", 0, m.start())
+        linestart = expr.rfind("\n", 0, m.start()) + 1
+        nots.add((line + 1, len(expr[linestart:m.start()].encode("utf-8"))))
+    return _cppnot.sub("~", expr), nots
+
+class _LogicalNot(ast.NodeTransformer):
+    def __init__(self, nots):
+        self.nots = nots
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Invert) and (node.lineno, node.col_offset) in self.nots:
+            node.op = ast.Not()
+        return node
+
+def _constant(node):
+    # (True, value) if node is a literal, (False, None) otherwise
+    name = type(node).__name__
+    if name == "Constant":
+        return True, node.value
+    elif name == "Num":
+        return True, node.n
+    elif name == "Str":
+        return True, node.s
+    elif name == "NameConstant":
+        return True, node.value
+    elif name == "Name" and node.id in ("True", "False", "None"):
+        return True, {"True": True, "False": False, "None": None}[node.id]
+    else:
+        return False, None
+
+def _dotted(node):
+    # "a.b.c" for a chain of attributes on a name, None otherwise
+    if isinstance(node, ast.Name):
+        return node.id
+    elif isinstance(node, ast.Attribute):
+        out = _dotted(node.value)
+        return None if out is None else out + "." + node.attr
+    else:
+        return None
+
+class _Branch(object):
+    # leaf of a resolved expression: the i-th branch read for it
+    def __init__(self, index):
+        self.index = index
+
+class _Compiler(object):
+    def __init__(self, expr, tree, what):
+        self.expr = expr
+        self.tree = tree
+        self.what = what
+        self.names = []
+        self.aliases = dict((k.decode("utf-8", "replace") if isinstance(k, bytes) else k, v) for k, v in getattr(tree, "aliases", {}).items())
+
+    def error(self, message):
+        return ValueError("{0} {1} {2}".format(self.what, repr(self.expr), message))
+
+    def parse(self, expr):
+        if isinstance(expr, bytes):
+            expr = expr.decode("utf-8", "replace")
+        try:
+            expr, nots = _translate(expr)
+            return _LogicalNot(nots).visit(ast.parse(expr, mode="eval")).body
+        except SyntaxError:
+            raise self.error("is not a valid expression")
+
+    def branch(self, name):
+        name = self.tree.get(name).name
+        if name not in self.names:
+            self.names.append(name)
+        return _Branch(self.names.index(name))
+
+    def resolve(self, node, stack=()):
+        # replaces branch names and subbranch paths by _Branch leaves and expands aliases
+        if isinstance(node, ast.Name) and not _constant(node)[0]:
+            if node.id in self.tree:
+                return self.branch(node.id)
+            elif node.id in self.aliases:
+                if node.id in stack:
+                    raise self.error("has a cycle of aliases: {0}".format(" -> ".join(stack + (node.id,))))
+                return self.resolve(self.parse(self.aliases[node.id]), stack + (node.id,))
+            elif hasattr(numpy, node.id):
+                return node
+            else:
+                raise self.error("refers to {0}, which is neither a branch, an alias, nor a numpy function".format(repr(node.id)))
+
+        elif isinstance(node, ast.Attribute):
+            path = _dotted(node)
+            if path is not None and not hasattr(numpy, path.split(".")[0]):
+                for name in (path, path.replace(".", "/")):
+                    if name in self.tree:
+                        return self.branch(name)
+            node.value = self.resolve(node.value, stack)
+            return node
+
+        elif isinstance(node, ast.AST):
+            for field, value in ast.iter_fields(node):
+                if isinstance(value, list):
+                    setattr(node, field, [self.resolve(x, stack) if isinstance(x, ast.AST) else x for x in value])
+                elif isinstance(value, ast.AST) and not isinstance(value, (ast.expr_context, ast.operator, ast.unaryop, ast.cmpop, ast.boolop)):
+                    setattr(node, field, self.resolve(value, stack))
+            return node
+
+        else:
+            return node
+
+    def compile(self, node):
+        # function from the list of branch arrays to (value, whether value is a new array that may be overwritten)
+        isconstant, value = _constant(node)
+        if isconstant:
+            return lambda arrays: (value, False)
+
+        elif isinstance(node, _Branch):
+            index = node.index
+            return lambda arrays: (arrays[index], False)
+
+        elif isinstance(node, ast.Name):
+            function = getattr(numpy, node.id)
+            return lambda arrays: (function, False)
+
+        elif isinstance(node, ast.Attribute):
+            value, attr = self.compile(node.value), node.attr
+            return lambda arrays: (getattr(value(arrays)[0], attr), False)
+
+        elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow) and _constant(node.right)[1] in (2, 0.5) and not isinstance(_constant(node.right)[1], bool):
+            # as fast as Numpy's own x**2 and x**0.5
+            return self.ufunc(numpy.square if _constant(node.right)[1] == 2 else numpy.sqrt, [self.compile(node.left)])
+
+        elif isinstance(node, ast.BinOp) and type(node.op) in _binops:
+            return self.ufunc(_binops[type(node.op)], [self.compile(node.left), self.compile(node.right)])
+
+        elif isinstance(node, ast.UnaryOp) and type(node.op) in _unaryops:
+            return self.ufunc(_unaryops[type(node.op)], [self.compile(node.operand)])
+
+        elif isinstance(node, ast.Compare) and all(type(x) in _compareops for x in node.ops):
+            operands = [self.compile(x) for x in [node.left] + node.comparators]
+            out = self.ufunc(_compareops[type(node.ops[0])], operands[:2])
+            for i in range(1, len(node.ops)):
+                comparison = self.ufunc(_compareops[type(node.ops[i])], operands[i : i + 2])
+                out = self.ufunc(numpy.logical_and, [out, comparison])
+            return out
+
+        elif isinstance(node, ast.BoolOp):
+            ufunc = numpy.logical_and if isinstance(node.op, ast.And) else numpy.logical_or
+            out = self.compile(node.values[0])
+            for x in node.values[1:]:
+                out = self.ufunc(ufunc, [out, self.compile(x)])
+            return out
+
+        elif isinstance(node, ast.IfExp):
+            test, body, orelse = self.compile(node.test), self.compile(node.body), self.compile(node.orelse)
+            return lambda arrays: (numpy.where(test(arrays)[0], body(arrays)[0], orelse(arrays)[0]), True)
+
+        elif isinstance(node, ast.Call) and all(not isinstance(x, getattr(ast, "Starred", ())) for x in node.args) and all(x.arg is not None for x in node.keywords):
+            function = self.compile(node.func)
+            args = [self.compile(x) for x in node.args]
+            keywords = [(x.arg, self.compile(x.value)) for x in node.keywords]
+            def call(arrays):
+                f = function(arrays)[0]
+                if isinstance(f, numpy.ufunc) and f.nin == len(args) and len(keywords) == 0:
+                    return self.ufunc(f, args)(arrays)
+                # other functions may return views of their arguments
+                return f(*[x(arrays)[0] for x in args], **dict((k, x(arrays)[0]) for k, x in keywords)), False
+            return call
+
+        elif isinstance(node, ast.Subscript):
+            value, perentry, index = self.compile(node.value), self.perentry(node.slice), self.compile(self.index(node.slice))
+            def subscript(arrays):
+                x, i = value(arrays)[0], index(arrays)[0]
+                if perentry and (len(getattr(x, "shape", ())) > 1 or hasattr(x, "starts")):
+                    return x[:, i], False
+                return x[i], False
+            return subscript
+
+        elif isinstance(node, ast.Slice):
+            parts = [None if x is None else self.compile(x) for x in (node.lower, node.upper, node.step)]
+            return lambda arrays: (slice(*[None if x is None else x(arrays)[0] for x in parts]), False)
+
+        elif isinstance(node, ast.Tuple):
+            items = [self.compile(x) for x in node.elts]
+            return lambda arrays: (tuple(x(arrays)[0] for x in items), False)
+
+        else:
+            raise self.error("uses unsupported syntax: {0}".format(type(node).__name__))
+
+    @staticmethod
+    def index(node):
+        # Python 2 and < 3.9 wrap subscripts in Index
+        return node.value if type(node).__name__ == "Index" else node
+
+    def perentry(self, node):
+        node = self.index(node)
+        isconstant, value = _constant(node)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            isconstant, value = _constant(node.operand)
+        return isinstance(node, ast.Slice) or (isconstant and isinstance(value, numbers.Integral) and not isinstance(value, bool))
+
+    @staticmethod
+    def ufunc(ufunc, operands):
+        def apply(arrays):
+            values = [x(arrays) for x in operands]
+            args = [x for x, owned in values]
+            if not all(type(x) is numpy.ndarray or isinstance(x, (numbers.Number, numpy.generic)) for x in args):
+                return ufunc(*args), True
+            for x, owned in values:
+                if owned and type(x) is numpy.ndarray:
+                    # write into an intermediate result if the output has its dtype and shape
+                    probe = ufunc(*[y[:1] if type(y) is numpy.ndarray and y.ndim > 0 else y for y in args])
+                    if getattr(probe, "dtype", None) == x.dtype and numpy.broadcast(*args).shape == x.shape:
+                        return ufunc(*args, out=x), True
+            return ufunc(*args), True
+        return apply
+
+    def source(self, node):
+        # Python source for one item of a flat, elementwise expression (for Numba), or None
+        isconstant, value = _constant(node)
+        if isconstant:
+            return repr(value) if isinstance(value, (numbers.Number, numpy.number)) else None
+        elif isinstance(node, _Branch):
+            return "_{0}[i]".format(node.index)
+        elif isinstance(node, ast.BinOp) and type(node.op) in _binsource:
+            left, right = self.source(node.left), self.source(node.right)
+            return None if left is None or right is None else "({0} {1} {2})".format(left, _binsource[type(node.op)], right)
+        elif isinstance(node, ast.UnaryOp) and type(node.op) in _unarysource:
+            operand = self.source(node.operand)
+            return None if operand is None else "({0}{1})".format(_unarysource[type(node.op)], operand)
+        elif isinstance(node, ast.Compare) and all(type(x) in _comparesource for x in node.ops):
+            operands = [self.source(x) for x in [node.left] + node.comparators]
+            if any(x is None for x in operands):
+                return None
+            return "(" + operands[0] + "".join(" {0} {1}".format(_comparesource[type(op)], x) for op, x in zip(node.ops, operands[1:])) + ")"
+        elif isinstance(node, ast.BoolOp):
+            values = [self.source(x) for x in node.values]
+            return None if any(x is None for x in values) else "(" + (" and " if isinstance(node.op, ast.And) else " or ").join(values) + ")"
+        elif isinstance(node, ast.IfExp):
+            parts = [self.source(x) for x in (node.body, node.test, node.orelse)]
+            return None if any(x is None for x in parts) else "({0} if {1} else {2})".format(*parts)
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and isinstance(getattr(numpy, node.func.id, None), numpy.ufunc) and len(node.keywords) == 0:
+            args = [self.source(x) for x in node.args]
+            return None if any(x is None for x in args) else "numpy.{0}({1})".format(node.func.id, ", ".join(args))
+        else:
+            return None
+
+_fused = {}
+
+def _fusedkernel(source, numargs):
+    # one loop over the items, with no intermediate arrays
+    if source not in _fused:
+        import numba
+        names = ", ".join("_{0}".format(i) for i in range(numargs))
+        code = "def kernel(out, {0}):\n    for i in range(len(out)):\n        out[i] = {1}\n".format(names, source)
+        scope = {"numpy": numpy}
+        exec(code, scope)
+        _fused[source] = numba.njit(error_model="numpy")(scope["kernel"])
+    return _fused[source]
+
+def _fusedfails(source):
+    # Numba could not compile this expression for some input types; use Numpy from now on
+    _fused[source] = None
+
+def _flatnumbers(arrays):
+    return len(arrays) > 0 and all(type(x) is numpy.ndarray and x.ndim == 1 and x.dtype.kind in "biuf" and len(x) == len(arrays[0]) for x in arrays)
+
+def expression(expr, tree, what="expression"):
+    # (names of the branches in expr, function from their arrays, in that order, to its value)
+    compiler = _Compiler(expr, tree, what)
+    node = compiler.resolve(compiler.parse(expr))
+    evaluate = compiler.compile(node)
+    source = compiler.source(node)
+    numargs = len(compiler.names)
+
+    def function(*arrays):
+        if source is not None and _fused.get(source, True) is not None and uproot.interp.kernels.getbackend() == "numba" and _flatnumbers(arrays):
+            # the Numpy closure on the first item determines the output dtype
+            first = numpy.asarray(evaluate([x[:1] for x in arrays])[0])
+            if first.shape == (min(len(arrays[0]), 1),):
+                out = numpy.empty(len(arrays[0]), dtype=first.dtype)
+                try:
+                    _fusedkernel(source, numargs)(out, *arrays)
+                except Exception:
+                    _fusedfails(source)
+                else:
+                    return out
+        return evaluate(arrays)[0]
+
+    return compiler.names, function
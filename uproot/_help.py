@@ -86,6 +86,9 @@ u"""Opens a ROOT file (local or remote), specified by file path.
 
     {httpsource}
 
+    pool : ``None``, ``True``, or :py:class:`FilePool <uproot.rootio.FilePool>`
+        if not ``None``, get the file from this pool (``True`` for the process-wide ``uproot.rootio.filepool``), which returns the same ROOTDirectory for the same unchanged file and arguments. :py:meth:`close <uproot.rootio.ROOTDirectory.close>` returns it to the pool rather than closing it.
+
     {options}
 
     Returns
@@ -138,6 +141,81 @@ u"""Opens a remote ROOT file with HTTP (if ``requests`` is installed).
         top-level directory of the ROOT file.
     """.format(**open_fragments), width=TEXT_WIDTH)
 
+################################################################ uproot.rootio.FilePool
+
+uproot.rootio.FilePool.__doc__ = wrap(
+u"""A size-bounded set of open ROOT files, shared by everything that opens files in a process, so that a file used repeatedly is parsed (header, streamers, TTree metadata) only once.
+
+    Files are known by path, the sources and options they were opened with, and, for local files, size and modification time, so a file that has changed on disk is opened again (and the old version is closed once it is idle). Each :py:meth:`open <uproot.rootio.FilePool.open>` or :py:meth:`tree <uproot.rootio.FilePool.tree>` counts as a use of the file until the matching :py:meth:`release <uproot.rootio.FilePool.release>`. When more than *capacity* files are open, the least recently used files that are not in use are closed, which also limits the number of memory maps and file handles a long-running process holds. Files in use are never closed, so the pool may temporarily hold more than *capacity* files.
+
+    :py:func:`iterate <uproot.tree.iterate>`, :py:func:`lazyarrays <uproot.tree.lazyarrays>`, :py:func:`daskframe <uproot.tree.daskframe>`, :py:func:`scan <uproot.tree.scan>`, :py:func:`partitions <uproot.tree.partitions>`, :py:func:`histogram <uproot.reduce.histogram>`, worker processes, and unpickled lazy arrays (those without :py:class:`TTreeMetadata <uproot.tree.TTreeMetadata>`) all use the process-wide pool, ``uproot.rootio.filepool`` (default *capacity* 16). ``len(pool)`` is the number of open files and ``path in pool`` tests whether a path is open.
+
+    Parameters
+    ----------
+    capacity : non-negative int
+        number of files to keep open when they are not in use; may be changed later by setting the **capacity** attribute.
+""", width=TEXT_WIDTH)
+
+_method(uproot.rootio.FilePool.open).__doc__ = wrap(
+u"""Get a ROOT file from the pool, opening it if necessary, and count it as in use until :py:meth:`release <uproot.rootio.FilePool.release>` or :py:meth:`close <uproot.rootio.ROOTDirectory.close>`.
+
+    Parameters
+    ----------
+    path : str
+        local file path or URL, as in :py:func:`open <uproot.rootio.open>`.
+
+    {localsource}
+
+    {xrootdsource}
+
+    {httpsource}
+
+    {options}
+
+    Returns
+    -------
+    :py:class:`ROOTDirectory <uproot.rootio.ROOTDirectory>`
+        top-level directory of the ROOT file, the same object for every caller that uses the same file and arguments.
+""".format(**open_fragments), width=TEXT_WIDTH)
+
+_method(uproot.rootio.FilePool.tree).__doc__ = wrap(
+u"""Get a TTree (or other object) from a ROOT file in the pool, reading it only the first time, and count the file as in use until :py:meth:`release <uproot.rootio.FilePool.release>`.
+
+    Parameters
+    ----------
+    path : str
+        local file path or URL, as in :py:func:`open <uproot.rootio.open>`.
+
+    treepath : str
+        path within the ROOT file to find the TTree (may include "``/``" for subdirectories or "``;``" for cycle numbers).
+
+    {localsource}
+
+    {xrootdsource}
+
+    {httpsource}
+
+    {options}
+
+    Returns
+    -------
+    :py:class:`TTreeMethods <uproot.tree.TTreeMethods>`
+        the same object for every caller that uses the same file and arguments. Raises ``KeyError`` (and releases the file) if the file has no *treepath*.
+""".format(**open_fragments), width=TEXT_WIDTH)
+
+_method(uproot.rootio.FilePool.release).__doc__ = wrap(
+u"""Stop using a file obtained from :py:meth:`open <uproot.rootio.FilePool.open>` or :py:meth:`tree <uproot.rootio.FilePool.tree>`; once no one uses it, it may be closed to stay within capacity.
+
+    Parameters
+    ----------
+    obj : :py:class:`ROOTDirectory <uproot.rootio.ROOTDirectory>` or object read from it
+        the file, or any object read from it, such as the TTree.
+""", width=TEXT_WIDTH)
+
+_method(uproot.rootio.FilePool.clear).__doc__ = wrap(
+u"""Close all files in the pool that are not in use.
+""", width=TEXT_WIDTH)
+
 ################################################################ uproot.rootio.ROOTDirectory
 
 uproot.rootio.ROOTDirectory.__doc__ = wrap(
@@ -446,11 +524,11 @@ tree_fragments = {
 
     # entrysteps
     "entrysteps": u"""entrysteps : ``None``, positive int, ``float("inf")``, string matching number + /[kMGTPEZY]?B/i, or iterable of *(int, int)* pairs
-        if ``None`` *(default)*, iterate in steps of TTree clusters (number of entries for which all branches' baskets align); if an integer, iterate in steps of equal numbers of entries (except at the end of a file); if infinite, take file-sized steps; if a string, iterate in steps of approximately equal memory, given by a memory size string; otherwise, iterate in explicit, user-specified *(start, stop)* intervals ("start" is inclusive and "stop" is exclusive).""",
+        if ``None`` *(default)*, iterate in steps of TTree clusters (number of entries for which all branches' baskets align); if an integer, iterate in steps of equal numbers of entries (except at the end of a file); if infinite, take file-sized steps; if a string, iterate in steps of approximately equal memory, given by a memory size string (see ``mempartitions`` with ``linear=False``); otherwise, iterate in explicit, user-specified *(start, stop)* intervals ("start" is inclusive and "stop" is exclusive).""",
 
     # entrysteps_tree
     "entrysteps_tree": u"""entrysteps : ``None``, positive int, ``float("inf")``, string matching number + /[kMGTPEZY]?B/i, or iterable of *(int, int)* pairs
-        if ``None`` *(default)*, iterate in steps of TTree clusters (number of entries for which all branches' baskets align); if an integer, iterate in steps of equal numbers of entries; if infinite, iterate over the whole file in one step; if a string, iterate in steps of approximately equal memory, given by a memory size string; otherwise, iterate in explicit, user-specified *(start, stop)* intervals ("start" is inclusive and "stop" is exclusive).""",
+        if ``None`` *(default)*, iterate in steps of TTree clusters (number of entries for which all branches' baskets align); if an integer, iterate in steps of equal numbers of entries; if infinite, iterate over the whole file in one step; if a string, iterate in steps of approximately equal memory, given by a memory size string (see ``mempartitions`` with ``linear=False``); otherwise, iterate in explicit, user-specified *(start, stop)* intervals ("start" is inclusive and "stop" is exclusive).""",
 
     # branch
     "branch": u"""branch : str
@@ -525,9 +603,73 @@ tree_fragments = {
     "blocking": u"""blocking : bool
         if ``True`` *(default)*, do not exit this function until the arrays are read, and return those arrays. If ``False``, exit immediately and return a zero-argument function. That zero-argument function returns the desired array, and it blocks until the array is available. This option is only useful with a non-``None`` executor.""",
 
+    # prefetch
+    "prefetch": u"""prefetch : non-negative int
+        if ``0`` *(default)*, start reading a step only when it is requested; otherwise, keep up to this many future steps reading, decompressing, and interpreting on the *executor* while the current step is being used. Steps are still yielded in order. Requires a non-``None`` *executor*.""",
+
+    # prefetchbytes
+    "prefetchbytes": u"""prefetchbytes : ``None``, positive number, or str
+        if not ``None`` *(default)*, limit on the uncompressed size of the prefetched steps (including the one about to be yielded), either as a number of bytes or a memory size string. At least one step is always read.""",
+
+    # max_memory
+    "max_memory": u"""max_memory : ``None``, positive number, str, or :py:class:`MemoryBudget <uproot.cache.MemoryBudget>`
+        if not ``None`` *(default)*, limit on the memory held by steps: a step is read only when its decompressed baskets and output arrays fit in the budget alongside the steps already reading, and a yielded step counts (with its measured size) until the next step is requested. If *blocking* is ``False``, a yielded step counts until its function is called; if the next step doesn't fit, the oldest uncalled functions are called by the iteration. Steps that do not fit are read one at a time. Pass a ``MemoryBudget`` to share one budget among several iterations and read its ``peakbytes`` afterward.""",
+
+    # max_memory_lazy
+    "max_memory_lazy": u"""max_memory : ``None``, positive number, str, or :py:class:`MemoryBudget <uproot.cache.MemoryBudget>`
+        if not ``None`` *(default)*, limit on the memory used by reads that materialize chunks at the same time (e.g. from several threads): a read waits until its decompressed baskets and output array fit in the budget. Materialized chunks kept in *cache* are not counted. Pass a ``MemoryBudget`` to read its ``peakbytes`` afterward.""",
+
+    # cut
+    "cut": u"""cut : ``None``, str, or function
+        if not ``None`` *(default)*, keep only the entries that pass this selection: either an expression of branch names, aliases, and Numpy functions (see :py:meth:`itereval <uproot.tree.TTreeMethods.itereval>`), such as ``"(nMuon >= 2) & (abs(MET_px) > 20)"``, or a function whose argument names are branch names, returning one boolean per entry. The branches in the selection are read first, and for every other branch, only the baskets containing at least one selected entry are decompressed. Entry numbers of the selected entries are in the Pandas index, if applicable.""",
+
+    # zonemap
+    "zonemap": u"""zonemap : ``None`` or :py:class:`ZoneMap <uproot.cache.ZoneMap>`
+        if not ``None`` *(default)*, record the minimum and maximum of every numeric basket that is read in full, and skip the baskets in which comparisons of a branch with a number in a string *cut* cannot be satisfied.""",
+
+    # processes
+    "processes": u"""processes : ``None`` or positive int
+        if not ``None`` *(default)*, read the steps in this many worker processes, which open the files themselves (keeping the last few open, so that streamers and TTree metadata are read once per worker), read, decompress, and interpret whole steps (including *cut*, object branches, and Pandas flattening), and return arrays through shared memory. The *cache*, *basketcache*, and *keycache* of this process are not used, a function *cut* must be picklable, and a *zonemap* is used but not filled. Cannot be combined with an *executor*; *prefetch* adds steps in flight beyond one per process. Requires Python 3.8 or later.""",
+
+    # ordered
+    "ordered": u"""ordered : bool
+        if ``True`` *(default)*, steps read by worker *processes* are yielded in order; otherwise, each is yielded as soon as it is ready (use *reportentries* to tell which entries it contains).""",
+
+    # prefetchfiles
+    "prefetchfiles": u"""prefetchfiles : non-negative int
+        number of files to open on the *executor* (required if positive) ahead of the one being iterated over: reading streamers and TTree metadata, resolving *branches*, and reading the baskets of the first step (decompressed into *basketcache* if there is one, otherwise as raw bytes, which remote sources keep in their chunk cache). Default is ``0``. Unless *reportfile* is ``True`` or *blocking* is ``False``, files are closed when their last step has been used.""",
+
+    # acrossfiles
+    "acrossfiles": u"""acrossfiles : bool
+        if ``False`` *(default)*, each file is iterated over on its own, so every file starts a new step; if ``True``, steps continue from one file into the next, so that all steps but the last have *entrysteps* entries (a number of entries, a memory size string, or ``inf``). The pieces of a step are concatenated (a step within one file is not copied), and *reportpath* and *reportfile* give the file in which the step starts.""",
+
+    # entries
+    "entries": u"""entries : ``None``, array of int, or array of bool
+        if not ``None`` *(default)*, read only these entries: either sorted entry numbers or a boolean mask with one value per entry in the TTree. Entries outside of *entrystart* and *entrystop* are ignored. Only the baskets containing at least one of these entries are decompressed.""",
+
+    # expr
+    "expr": u"""expr : str or function
+        quantity to compute: either the name of a branch or an expression of branch names, aliases, and Numpy functions (see :py:meth:`itereval <uproot.tree.TTreeMethods.itereval>`), such as ``"sqrt(MET_px**2 + MET_py**2)"``, or a function whose argument names are branch names. Jagged quantities contribute every item of every selected entry, with per-entry quantities (such as *weight*) repeated for each item.""",
+
+    # bins
+    "bins": u"""bins : positive int or array of float
+        number of equal-width bins between the edges in *range* *(default is 10)*, or the bin edges themselves. Values below the first edge go to the underflow bin and values at or above the last edge go to the overflow bin, as in ROOT. For a TH2, a pair of these (one for each axis) or a single int for both axes.""",
+
+    # range
+    "range": u"""range : ``None`` or (float, float)
+        low and high edges of the equal-width bins; if ``None`` *(default)*, the minimum and maximum of the selected values, found by an extra pass over the data, with the high edge raised just enough to put the maximum in the last bin. For a TH2, a pair of these.""",
+
+    # weight
+    "weight": u"""weight : ``None``, str, or function
+        if not ``None`` *(default)*, per-entry (or per-item) weight, given as a branch name, expression, or function like *expr*.""",
+
+    # title
+    "title": u"""title : ``None``, str, or bytes
+        title of the histogram; if ``None`` *(default)*, the expression(s), with the y expression first for a TH2.""",
+
     # persistvirtual
     "persistvirtual": u"""persistvirtual : bool
-        if ``False`` *(default)*, the resulting awkward.VirtualArrays would convert themselves into real arrays (materialize) before being saved in awkward-array's persistence methods; if ``True``, the "virtualness" of the arrays is preserved\u2014that is, only instructions for reconstituting the arrays is saved, not the array data themselves.""",
+        if ``False`` *(default)*, the resulting awkward.VirtualArrays would convert themselves into real arrays (materialize) before being saved in awkward-array's persistence methods; if ``True``, the "virtualness" of the arrays is preserved\u2014that is, only instructions for reconstituting the arrays is saved, not the array data themselves. Lazy arrays of a single TTree save its :py:class:`TTreeMetadata <uproot.tree.TTreeMetadata>` with the instructions, so that they read baskets without reading the TTree again when they are loaded.""",
 
     # recursive
     "recursive": u"""recursive : bool
@@ -562,8 +704,8 @@ u"""Opens a series of ROOT files (local or remote), yielding the same number of
 
     Parameters
     ----------
-    path : str or list of str
-        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order.
+    path : str, list of str, or :py:class:`Manifest <uproot.tree.Manifest>`
+        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order. A :py:class:`Manifest <uproot.tree.Manifest>` from :py:func:`scan <uproot.tree.scan>` stands for the files it describes, so that their numbers of entries are not looked up again and files without the TTree are not opened.
 
     treepath : str
         path within each ROOT file to find the TTree (may include "``/``" for subdirectories or "``;``" for cycle numbers).
@@ -604,6 +746,24 @@ u"""Opens a series of ROOT files (local or remote), yielding the same number of
 
     {httpsource}
 
+    {prefetch}
+
+    {prefetchbytes}
+
+    {max_memory}
+
+    {cut}
+
+    {zonemap}
+
+    {processes}
+
+    {ordered}
+
+    {prefetchfiles}
+
+    {acrossfiles}
+
     {options}
 
     Returns
@@ -621,8 +781,8 @@ u"""Opens a series of ROOT files (local or remote), yielding Pandas DataFrames i
 
     Parameters
     ----------
-    path : str or list of str
-        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order.
+    path : str, list of str, or :py:class:`Manifest <uproot.tree.Manifest>`
+        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order. A :py:class:`Manifest <uproot.tree.Manifest>` from :py:func:`scan <uproot.tree.scan>` stands for the files it describes, so that their numbers of entries are not looked up again and files without the TTree are not opened.
 
     treepath : str
         path within each ROOT file to find the TTree (may include "``/``" for subdirectories or "``;``" for cycle numbers).
@@ -659,6 +819,16 @@ u"""Opens a series of ROOT files (local or remote), yielding Pandas DataFrames i
 
     {httpsource}
 
+    {prefetch}
+
+    {prefetchbytes}
+
+    {max_memory}
+
+    {cut}
+
+    {zonemap}
+
     {options}
 
     Returns
@@ -695,6 +865,7 @@ u"""Adds array reading methods to TTree objects that have been streamed from a R
     - :py:meth:`allitems <uproot.tree.TTreeMethods.allitems>` return *(branch name, branch)* pairs at all levels of depth (shortcut for passing ``recursive=True`` to :py:meth:`items <uproot.tree.TTreeMethods.items>`).
     - :py:meth:`clusters <uproot.tree.TTreeMethods.clusters>` iterate over *(int, int)* pairs representing cluster entry starts and stops in this TTree.
     - :py:meth:`mempartitions <uproot.tree.TTreeMethods.mempartitions>` iterate over *(int, int)* pairs representing entry starts and stops that attempt to maintain a constant memory footprint.
+    - :py:meth:`metadata <uproot.tree.TTreeMethods.metadata>` return what reading some branches needs from this TTree, to send to other processes.
 
     **Methods for reading array data:**
 
@@ -875,7 +1046,9 @@ u"""Return *(branch name, branch)* pairs at all levels of depth (shortcut for pa
 _method(uproot.tree.TTreeMethods.clusters).__doc__ = wrap(
 u"""Return entry starts and stops as *(int, int)* pairs representing clusters for a given set of branches this TTree.
 
-    Rather than using ROOT's self-reported clusters (which don't exist in every ROOT file), this method finds the minimal step sizes in which a given set of branches have basket thresholds for the same entry number. For a single branch, this is exactly the basket boundaries. It is possible for a given set of branches to never line up, in which case, the cluster is the entire file.
+    This method finds the minimal step sizes in which a given set of branches have basket thresholds for the same entry number. For a single branch, this is exactly the basket boundaries. It is possible for a given set of branches to never line up, in which case, the cluster is the entire file.
+
+    If the TTree reports its clusters in entries (``fAutoFlush``, ``fClusterRangeEnd``, ``fClusterSize``) and every selected branch has a basket threshold at each of them, those clusters are used directly; otherwise, the branches' basket thresholds are intersected. Either way, the result is cached on the TTree for each set of branches.
 
     Parameters
     ----------
@@ -913,7 +1086,7 @@ u"""Return entry starts and stops as *(int, int)* pairs of (approximately) equal
     {keycache}
 
     linear : bool
-        if ``True`` *(default)*, the step size is uniform (same number of entries in each step); any variations in entry size as a function of entry number are averaged over. Non-linear steps (``False``), which would take into account bigger entry sizes at the beginning or end of the file, have not been implemented.
+        if ``True`` *(default)*, the step size is uniform (same number of entries in each step); any variations in entry size as a function of entry number are averaged over. If ``False``, steps end where the cumulative uncompressed size of the baskets (interpolated within each basket) crosses each multiple of *numbytes*, so steps have fewer entries where entries are bigger; a step boundary is moved to the nearest cluster or basket boundary if that changes its size by at most a quarter of *numbytes*. Memory size strings passed as *entrysteps* use ``linear=False``.
 
     Returns
     -------
@@ -921,6 +1094,23 @@ u"""Return entry starts and stops as *(int, int)* pairs of (approximately) equal
         start (inclusive) and stop (exclusive) pairs for each equal-memory partition.
 """, width=TEXT_WIDTH)
 
+_method(uproot.tree.TTreeMethods.metadata).__doc__ = wrap(
+u"""Return what reading a given set of branches needs from this TTree, as a :py:class:`TTreeMetadata <uproot.tree.TTreeMetadata>` that is much smaller to pickle than the file's streamers and TTree, and can be turned back into a TTree without reading them.
+
+    Parameters
+    ----------
+    {branches}
+
+    Returns
+    -------
+    :py:class:`TTreeMetadata <uproot.tree.TTreeMetadata>`
+        basket positions, sizes, and entry offsets, compression settings, and interpretations of the selected branches (and the branches that count their entries).
+
+    Notes
+    -----
+    Interpretations that refer to classes defined by the file's streamers (:py:class:`asgenobj <uproot.interp.objects.asgenobj>`) can't be described without the file; selecting such a branch raises ``ValueError``.
+""".format(**tree_fragments), width=TEXT_WIDTH)
+
 _method(uproot.tree.TTreeMethods.array).__doc__ = wrap(
 u"""Read one branch into an array (or other object if provided an alternate *interpretation*).
 
@@ -948,6 +1138,10 @@ u"""Read one branch into an array (or other object if provided an alternate *int
 
     {blocking}
 
+    {entries}
+
+    {zonemap}
+
     Returns
     -------
     array or other object, depending on *interpretation*.
@@ -984,6 +1178,12 @@ u"""Read many branches into arrays (or other objects if provided alternate *inte
 
     {blocking}
 
+    {cut}
+
+    {entries}
+
+    {zonemap}
+
     Returns
     -------
     outputtype of arrays or other objects, depending on *interpretation*
@@ -1021,6 +1221,8 @@ u"""Create a lazy array that would read the branch as needed.
 
     {chunked}
 
+    {max_memory_lazy}
+
     Returns
     -------
     ChunkedArray of VirtualArrays or VirtualArray
@@ -1030,6 +1232,8 @@ u"""Create a lazy array that would read the branch as needed.
 _method(uproot.tree.TTreeMethods.lazyarrays).__doc__ = wrap(
 u"""Create a table of lazy arrays.
 
+    With *chunked*, each column is a ChunkedArray whose VirtualArrays are only made when a chunk is first used, and the chunk boundaries are stored once for all columns, so a table of many branches and chunks costs little until it's read. Slices, conversions to Numpy, iteration, and reductions read each run of adjacent chunks that aren't in memory yet in one call (up to 16 MB of uncompressed data), unless *flatten* or *max_memory* is given.
+
     Parameters
     ----------
     {branches}
@@ -1060,6 +1264,10 @@ u"""Create a table of lazy arrays.
 
     {chunked}
 
+    {max_memory_lazy}
+
+    {entries}
+
     Returns
     -------
     ChunkedArray of Table of VirtualArrays or Table of VirtualArrays
@@ -1103,12 +1311,312 @@ u"""Iterate over many arrays at once, yielding the same number of entries from a
 
     {blocking}
 
+    {prefetch}
+
+    {prefetchbytes}
+
+    {max_memory}
+
+    {cut}
+
+    {zonemap}
+
+    {processes}
+
+    {ordered}
+
     Returns
     -------
     iterator over (int, int, outputtype) (if *reportentries*) or just outputtype (otherwise)
         aligned array segments from the TTree.
 """.format(**tree_fragments), width=TEXT_WIDTH)
 
+_method(uproot.tree.TTreeMethods.itereval).__doc__ = wrap(
+u"""Iterate over the values of an expression of branches, reading only the branches it refers to, one step at a time.
+
+    Names in the expression are branches, TTree aliases (expanded recursively), or Numpy functions. A dotted name like ``"obj.member"`` may refer to the subbranch ``"obj/member"``, the operators ``&&``, ``||``, and ``!`` of TTree::Draw may be used, and an integer or slice subscript like ``"Muon_Px[0]"`` selects items within each entry of a jagged or multidimensional branch. Each step is evaluated with Numpy ufuncs that overwrite their intermediate results in place, or, if the kernel backend is Numba (see ``uproot.interp.kernels.setbackend``) and all branches are flat numbers, with one compiled loop and no intermediate arrays. The expression must compute one value per entry (or per item) without combining entries, since each step is evaluated separately.
+
+    Parameters
+    ----------
+    {expr}
+
+    {entrysteps_tree}
+
+    {reportentries}
+
+    {entrystart}
+
+    {entrystop}
+
+    {awkwardlib}
+
+    {cache}
+
+    {basketcache}
+
+    {keycache}
+
+    {executor}
+
+    {prefetch}
+
+    {cut}
+
+    {zonemap}
+
+    Returns
+    -------
+    iterator over (int, int, array) (if *reportentries*) or just array (otherwise)
+        values of the expression in each step.
+""".format(**tree_fragments), width=TEXT_WIDTH)
+
+_method(uproot.tree.TTreeMethods.eval).__doc__ = wrap(
+u"""Compute an expression of branches, such as ``"sqrt(px**2 + py**2)"``, reading only the branches it refers to and evaluating it step by step.
+
+    The expression is evaluated as in :py:meth:`itereval <uproot.tree.TTreeMethods.itereval>`, so arrays of the referenced branches and intermediate results are only ever as large as one step. If the values are one per entry and there is no *cut*, each step is written directly into the output array.
+
+    Parameters
+    ----------
+    {expr}
+
+    {entrysteps_tree}
+
+    {entrystart}
+
+    {entrystop}
+
+    {awkwardlib}
+
+    {cache}
+
+    {basketcache}
+
+    {keycache}
+
+    {executor}
+
+    {cut}
+
+    {zonemap}
+
+    Returns
+    -------
+    array
+        values of the expression for all entries (or selected entries), as a Numpy array or a JaggedArray.
+""".format(**tree_fragments), width=TEXT_WIDTH)
+
+_method(uproot.tree.TTreeMethods.histogram).__doc__ = wrap(
+u"""Fill a histogram with an expression of branches, reading the TTree in steps so that the data never have to fit in memory.
+
+    Each step (see :py:meth:`iterate <uproot.tree.TTreeMethods.iterate>`) is binned into partial bin contents before the next is read, and the partial contents are summed. If an *executor* is given, each step is binned on it while the next step is read. The result is a histogram object from uproot-methods, which can be plotted, converted to Numpy, or written to a ROOT file with :py:func:`uproot.recreate <uproot.write.TFile.TFileRecreate>`.
+
+    Parameters
+    ----------
+    {expr}
+        A tuple or list of two expressions (x, y) fills a TH2 instead of a TH1.
+
+    {bins}
+
+    {range}
+
+    {weight}
+
+    {cut}
+
+    {title}
+
+    {entrysteps_tree}
+
+    {entrystart}
+
+    {entrystop}
+
+    {awkwardlib}
+
+    {cache}
+
+    {basketcache}
+
+    {keycache}
+
+    {executor}
+
+    Returns
+    -------
+    ``uproot_methods.classes.TH1.Methods`` or ``uproot_methods.classes.TH2.Methods``
+        histogram with bin contents, sums of squared weights, and ROOT's fit statistics (numbers of entries and sums of weights, weighted values, and weighted squares of values in the bins).
+""".format(**tree_fragments), width=TEXT_WIDTH)
+
+_method(uproot.tree.TTreeMethods.count).__doc__ = wrap(
+u"""Count the entries (or jagged items) that pass a selection, reading the TTree in steps.
+
+    Without *expr* or *cut*, this is the number of entries between *entrystart* and *entrystop* and nothing is read.
+
+    Parameters
+    ----------
+    expr : ``None``, str, or function
+        if ``None`` *(default)*, count entries; otherwise, count the items of this expression (see *expr* in :py:meth:`histogram <uproot.tree.TTreeMethods.histogram>`), which is the number of entries if it is not jagged.
+
+    {cut}
+
+    {entrysteps_tree}
+
+    {entrystart}
+
+    {entrystop}
+
+    {awkwardlib}
+
+    {cache}
+
+    {basketcache}
+
+    {keycache}
+
+    {executor}
+
+    Returns
+    -------
+    int
+        number of selected entries or items.
+""".format(**tree_fragments), width=TEXT_WIDTH)
+
+_method(uproot.tree.TTreeMethods.sum).__doc__ = wrap(
+u"""Sum an expression of branches over the entries (or jagged items) that pass a selection, reading the TTree in steps.
+
+    The TTree is read in steps (see :py:meth:`iterate <uproot.tree.TTreeMethods.iterate>`) and each step is reduced to a partial result before the next is read, so memory use does not grow with the number of entries. If an *executor* is given, each step is reduced on it while the next step is read.
+
+    Parameters
+    ----------
+    {expr}
+
+    {weight}
+
+    {cut}
+
+    {entrysteps_tree}
+
+    {entrystart}
+
+    {entrystop}
+
+    {awkwardlib}
+
+    {cache}
+
+    {basketcache}
+
+    {keycache}
+
+    {executor}
+
+    Returns
+    -------
+    number
+        (weighted) sum of the selected values.
+""".format(**tree_fragments), width=TEXT_WIDTH)
+
+_method(uproot.tree.TTreeMethods.mean).__doc__ = wrap(
+u"""Average an expression of branches over the entries (or jagged items) that pass a selection, reading the TTree in steps.
+
+    The TTree is read in steps (see :py:meth:`iterate <uproot.tree.TTreeMethods.iterate>`) and each step is reduced to a partial result before the next is read, so memory use does not grow with the number of entries. If an *executor* is given, each step is reduced on it while the next step is read.
+
+    Parameters
+    ----------
+    {expr}
+
+    {weight}
+
+    {cut}
+
+    {entrysteps_tree}
+
+    {entrystart}
+
+    {entrystop}
+
+    {awkwardlib}
+
+    {cache}
+
+    {basketcache}
+
+    {keycache}
+
+    {executor}
+
+    Returns
+    -------
+    float
+        (weighted) mean of the selected values; raises ``ValueError`` if nothing is selected.
+""".format(**tree_fragments), width=TEXT_WIDTH)
+
+_method(uproot.tree.TTreeMethods.min).__doc__ = wrap(
+u"""Find the minimum of an expression of branches over the entries (or jagged items) that pass a selection, reading the TTree in steps.
+
+    The TTree is read in steps (see :py:meth:`iterate <uproot.tree.TTreeMethods.iterate>`) and each step is reduced to a partial result before the next is read, so memory use does not grow with the number of entries. If an *executor* is given, each step is reduced on it while the next step is read.
+
+    Parameters
+    ----------
+    {expr}
+
+    {cut}
+
+    {entrysteps_tree}
+
+    {entrystart}
+
+    {entrystop}
+
+    {awkwardlib}
+
+    {cache}
+
+    {basketcache}
+
+    {keycache}
+
+    {executor}
+
+    Returns
+    -------
+    number
+        smallest selected value; raises ``ValueError`` if nothing is selected.
+""".format(**tree_fragments), width=TEXT_WIDTH)
+
+_method(uproot.tree.TTreeMethods.max).__doc__ = wrap(
+u"""Find the maximum of an expression of branches over the entries (or jagged items) that pass a selection, reading the TTree in steps.
+
+    The TTree is read in steps (see :py:meth:`iterate <uproot.tree.TTreeMethods.iterate>`) and each step is reduced to a partial result before the next is read, so memory use does not grow with the number of entries. If an *executor* is given, each step is reduced on it while the next step is read.
+
+    Parameters
+    ----------
+    {expr}
+
+    {cut}
+
+    {entrysteps_tree}
+
+    {entrystart}
+
+    {entrystop}
+
+    {awkwardlib}
+
+    {cache}
+
+    {basketcache}
+
+    {keycache}
+
+    {executor}
+
+    Returns
+    -------
+    number
+        largest selected value; raises ``ValueError`` if nothing is selected.
+""".format(**tree_fragments), width=TEXT_WIDTH)
+
 ################################################################ uproot.tree.TBranchMethods
 
 uproot.tree.TBranchMethods.__doc__ = wrap(
@@ -1494,6 +2002,10 @@ u"""Read the branch into an array (or other object if provided an alternate *int
 
     {blocking}
 
+    {entries}
+
+    {zonemap}
+
     Returns
     -------
     array or other object, depending on *interpretation*
@@ -1517,7 +2029,7 @@ u"""Return entry starts and stops as *(int, int)* pairs of (approximately) equal
     {keycache}
 
     linear : bool
-        if ``True`` *(default)*, the step size is uniform (same number of entries in each step); any variations in entry size as a function of entry number are averaged over. Non-linear steps (``False``), which would take into account bigger entry sizes at the beginning or end of the file, have not been implemented.
+        if ``True`` *(default)*, the step size is uniform (same number of entries in each step); any variations in entry size as a function of entry number are averaged over. If ``False``, steps end where the cumulative uncompressed size of the baskets (interpolated within each basket) crosses each multiple of *numbytes*, so steps have fewer entries where entries are bigger; a step boundary is moved to the nearest cluster or basket boundary if that changes its size by at most a quarter of *numbytes*. Memory size strings passed as *entrysteps* use ``linear=False``.
 
     Returns
     -------
@@ -1554,6 +2066,8 @@ u"""Create a lazy array that would read the branch as needed.
 
     {chunked}
 
+    {max_memory_lazy}
+
     Returns
     -------
     ChunkedArray of VirtualArrays or VirtualArray
@@ -1678,6 +2192,12 @@ u"""Create a Pandas DataFrame from some branches.
 
     {executor}
 
+    {cut}
+
+    {entries}
+
+    {zonemap}
+
     Returns
     -------
     Pandas DataFrame
@@ -1692,8 +2212,8 @@ u"""Create a lazy array that would read from a set of files as needed.
     Parameters
     ----------
 
-    path : str or list of str
-        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order.
+    path : str, list of str, or :py:class:`Manifest <uproot.tree.Manifest>`
+        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order. A :py:class:`Manifest <uproot.tree.Manifest>` from :py:func:`scan <uproot.tree.scan>` stands for the files it describes, so that their numbers of entries are not looked up again and files without the TTree are not opened.
 
     treepath : str
         path within each ROOT file to find the TTree (may include "``/``" for subdirectories or "``;``" for cycle numbers).
@@ -1727,6 +2247,8 @@ u"""Create a lazy array that would read from a set of files as needed.
 
     {httpsource}
 
+    {max_memory_lazy}
+
     {options}
 
     Returns
@@ -1738,11 +2260,13 @@ u"""Create a lazy array that would read from a set of files as needed.
 uproot.tree.lazyarrays.__doc__ = wrap(
 u"""Create a lazy table that would read from a set of files as needed.
 
+    Each column is a ChunkedArray with one chunk per file, made only when it's first used.
+
     Parameters
     ----------
 
-    path : str or list of str
-        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order.
+    path : str, list of str, or :py:class:`Manifest <uproot.tree.Manifest>`
+        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order. A :py:class:`Manifest <uproot.tree.Manifest>` from :py:func:`scan <uproot.tree.scan>` stands for the files it describes, so that their numbers of entries are not looked up again and files without the TTree are not opened.
 
     treepath : str
         path within each ROOT file to find the TTree (may include "``/``" for subdirectories or "``;``" for cycle numbers).
@@ -1775,6 +2299,8 @@ u"""Create a lazy table that would read from a set of files as needed.
 
     {httpsource}
 
+    {max_memory_lazy}
+
     {options}
 
     Returns
@@ -1788,11 +2314,13 @@ u"""Create a lazy table that would read from a set of files as needed.
 uproot.tree.daskarray.__doc__ = wrap(
 u"""Create a Dask array that would read from a set of files as needed.
 
+    The graph has one task per step of *entrysteps* in each file, so a step never crosses a file boundary, and the tasks of a process share each file's open TTree. Chunk sizes are the numbers of entries in the steps, or unknown (``nan``) for a jagged branch with ``flatten=True``. Only branches of numbers (possibly multidimensional) are supported.
+
     Parameters
     ----------
 
-    path : str or list of str
-        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order.
+    path : str, list of str, or :py:class:`Manifest <uproot.tree.Manifest>`
+        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order. A :py:class:`Manifest <uproot.tree.Manifest>` from :py:func:`scan <uproot.tree.scan>` stands for the files it describes, so that their numbers of entries are not looked up again and files without the TTree are not opened.
 
     treepath : str
         path within each ROOT file to find the TTree (may include "``/``" for subdirectories or "``;``" for cycle numbers).
@@ -1829,17 +2357,19 @@ u"""Create a Dask array that would read from a set of files as needed.
     Returns
     -------
     dask.array.core.Array
-        lazy files of lazy baskets.
+        one chunk per step of each file.
 """.format(**dict(list(open_fragments.items()) + list(tree_fragments.items()))), width=TEXT_WIDTH)
 
 uproot.tree.daskframe.__doc__ = wrap(
 u"""Create a Dask DataFrame that would read from a set of files as needed.
 
+    Each partition is one step of *entrysteps* in one file, and reads all of its branches in one task; the tasks of a process share each file's open TTree. The index is the global entry number (counting from the start of the first file), so the divisions are known. With ``flatten=True``, jagged branches are exploded as in :py:meth:`pandas.df <uproot._connect._pandas.TTreeMethods_pandas.df>` and the position within each entry is a ``"subentry"`` column.
+
     Parameters
     ----------
 
-    path : str or list of str
-        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order.
+    path : str, list of str, or :py:class:`Manifest <uproot.tree.Manifest>`
+        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order. A :py:class:`Manifest <uproot.tree.Manifest>` from :py:func:`scan <uproot.tree.scan>` stands for the files it describes, so that their numbers of entries are not looked up again and files without the TTree are not opened.
 
     treepath : str
         path within each ROOT file to find the TTree (may include "``/``" for subdirectories or "``;``" for cycle numbers).
@@ -1873,7 +2403,61 @@ u"""Create a Dask DataFrame that would read from a set of files as needed.
     Returns
     -------
     dask.dataframe.core.DataFrame
-        lazy files of branches of lazy baskets.
+        one partition per step of each file.
+""".format(**dict(list(open_fragments.items()) + list(tree_fragments.items()))), width=TEXT_WIDTH)
+
+################################################################ uproot.reduce.histogram
+
+uproot.reduce.histogram.__doc__ = wrap(
+u"""Fill a histogram with an expression of branches from a series of ROOT files (local or remote), reading them in steps so that the data never have to fit in memory.
+
+    All but the first two parameters are identical to :py:meth:`uproot.tree.TTreeMethods.histogram`, except that the whole of every TTree is used.
+
+    Parameters
+    ----------
+    path : str, list of str, or :py:class:`Manifest <uproot.tree.Manifest>`
+        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order. A :py:class:`Manifest <uproot.tree.Manifest>` from :py:func:`scan <uproot.tree.scan>` stands for the files it describes, so that their numbers of entries are not looked up again and files without the TTree are not opened.
+
+    treepath : str
+        path within each ROOT file to find the TTree (may include "``/``" for subdirectories or "``;``" for cycle numbers).
+
+    {expr}
+        A tuple or list of two expressions (x, y) fills a TH2 instead of a TH1.
+
+    {bins}
+
+    {range}
+
+    {weight}
+
+    {cut}
+
+    {title}
+
+    {entrysteps}
+
+    {awkwardlib}
+
+    {cache}
+
+    {basketcache}
+
+    {keycache}
+
+    {executor}
+
+    {localsource}
+
+    {xrootdsource}
+
+    {httpsource}
+
+    {options}
+
+    Returns
+    -------
+    ``uproot_methods.classes.TH1.Methods`` or ``uproot_methods.classes.TH2.Methods``
+        histogram of the selected values in all of the files.
 """.format(**dict(list(open_fragments.items()) + list(tree_fragments.items()))), width=TEXT_WIDTH)
 
 ################################################################ uproot.tree.numentries
@@ -1887,8 +2471,8 @@ u"""Get the number of entries in a TTree without fully opening the file.
 
     Parameters
     ----------
-    path : str or list of str
-        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order.
+    path : str, list of str, or :py:class:`Manifest <uproot.tree.Manifest>`
+        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order. A :py:class:`Manifest <uproot.tree.Manifest>` from :py:func:`scan <uproot.tree.scan>` stands for the files it describes, so that their numbers of entries are not looked up again and files without the TTree are not opened.
 
     treepath : str
         path within each ROOT file to find the TTree (may include "``/``" for subdirectories or "``;``" for cycle numbers).
@@ -1912,6 +2496,144 @@ u"""Get the number of entries in a TTree without fully opening the file.
         total number of entries or number of entries for each file, depending on *total*.
 """.format(**dict(list(open_fragments.items()) + list(tree_fragments.items()))), width=TEXT_WIDTH)
 
+################################################################ uproot.tree.scan
+
+uproot.tree.scan.__doc__ = wrap(
+u"""Describe a set of files, once, as a :py:class:`Manifest <uproot.tree.Manifest>` that other functions can use instead of opening them to find out the same things.
+
+    For each file, the manifest records its UUID, the number of entries in the TTree (zero if the file does not have it), and, for each selected branch, its interpretation and compressed and uncompressed sizes, as well as the cluster boundaries of the selected branches. All of these come from the TTree metadata; no baskets or basket keys are read, and remote files are read in small chunks, as in :py:func:`numentries <uproot.tree.numentries>`.
+
+    Pass the manifest as the *path* of :py:func:`iterate <uproot.tree.iterate>`, :py:func:`lazyarrays <uproot.tree.lazyarrays>`, :py:func:`daskframe <uproot.tree.daskframe>`, :py:func:`numentries <uproot.tree.numentries>`, or :py:func:`histogram <uproot.reduce.histogram>`. :py:func:`iterate <uproot.tree.iterate>` raises ``ValueError`` for a file whose UUID or number of entries no longer matches.
+
+    Parameters
+    ----------
+    path : str, list of str, or :py:class:`Manifest <uproot.tree.Manifest>`
+        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order. A :py:class:`Manifest <uproot.tree.Manifest>` is scanned again for the files it describes.
+
+    treepath : str
+        path within each ROOT file to find the TTree (may include "``/``" for subdirectories or "``;``" for cycle numbers).
+
+    {branches}
+
+    {awkwardlib}
+
+    {executor}
+
+    {blocking}
+
+    manifest : ``None``, str, or :py:class:`Manifest <uproot.tree.Manifest>`
+        if not ``None``, a manifest (or the path of its JSON file) from an earlier scan: files that were scanned with the same *treepath* and *branches* (``None``, a name, or a list of names) and, for local files, have the same size and modification time, are not opened again. The result is this manifest, updated, and saved to its file if it has one.
+
+    {localsource}
+
+    {xrootdsource}
+
+    {httpsource}
+
+    {options}
+
+    Returns
+    -------
+    :py:class:`Manifest <uproot.tree.Manifest>`
+        description of the files, in the order of *path*.
+""".format(**dict(list(open_fragments.items()) + list(tree_fragments.items()))), width=TEXT_WIDTH)
+
+################################################################ uproot.tree.Manifest
+
+uproot.tree.Manifest.__doc__ = wrap(
+u"""Description of a set of files made by :py:func:`scan <uproot.tree.scan>`: for each file (in order), its UUID, number of entries, the selected branches' interpretations and compressed and uncompressed sizes, and cluster boundaries.
+
+    *files* is an ``OrderedDict`` of path \u2192 description, :py:meth:`numentries <uproot.tree.Manifest.numentries>` gives numbers of entries like :py:func:`numentries <uproot.tree.numentries>`, and *paths* is the list of files.
+
+    Parameters
+    ----------
+    path : ``None`` or str
+        if not ``None``, file (JSON) to load the manifest from, if it exists, and to :py:meth:`save <uproot.tree.Manifest.save>` it to.
+""", width=TEXT_WIDTH)
+
+################################################################ uproot.tree.partitions
+
+uproot.tree.partitions.__doc__ = wrap(
+u"""Plan work units for distributed processing: ranges of entries in the files with roughly equal numbers of bytes of the selected branches.
+
+    Units begin and end at cluster boundaries (see :py:meth:`clusters <uproot.tree.TTreeMethods.clusters>`), so that no basket is read by two units. Clusters are taken in file order, and each unit ends where its size is nearest to *numbytes*, so consecutive small files are packed into one unit and large files are split among several. A cluster larger than *numbytes* is a unit by itself.
+
+    Compressed sizes come from the TBranch metadata, so the files are only opened. Uncompressed sizes come from the TKey of each basket. Baskets that cross a cluster boundary are prorated by number of entries.
+
+    Parameters
+    ----------
+    path : str, list of str, or :py:class:`Manifest <uproot.tree.Manifest>`
+        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order. A :py:class:`Manifest <uproot.tree.Manifest>` from :py:func:`scan <uproot.tree.scan>` stands for the files it describes, and empty files or files without the TTree are not opened.
+
+    treepath : str
+        path within each ROOT file to find the TTree (may include "``/``" for subdirectories or "``;``" for cycle numbers).
+
+    numbytes : positive number or string matching number + /[kMGTPEZY]?B/i
+        target number of bytes in each unit, either as a number or a memory size string.
+
+    {branches}
+
+    compressed : bool
+        if ``False`` *(default)*, balance uncompressed bytes (memory used by reading); if ``True``, balance compressed bytes (bytes transferred).
+
+    {keycache}
+
+    {executor}
+
+    {blocking}
+
+    {localsource}
+
+    {xrootdsource}
+
+    {httpsource}
+
+    {options}
+
+    Returns
+    -------
+    list of lists of *(str, int, int)*
+        each unit is a list of *(path, entrystart, entrystop)* ranges (start inclusive, stop exclusive) in consecutive files.
+""".format(**dict(list(open_fragments.items()) + list(tree_fragments.items()))), width=TEXT_WIDTH)
+
+################################################################ uproot.tree.TTreeMetadata
+
+uproot.tree.TTreeMetadata.__doc__ = wrap(
+u"""What reading some branches of a TTree needs from the TTree, made by :py:meth:`TTreeMethods.metadata <uproot.tree.TTreeMethods.metadata>`: for each branch, the positions, sizes, and entry offsets of its baskets, its compression settings, and its interpretation.
+
+    It pickles to a small, versioned state (the basket arrays of all branches are concatenated), so it can be sent to worker processes that then go straight to reading baskets. Loading a state with another version raises ``ValueError``.
+
+    **Attributes and methods:**
+
+    - **path** (*str*) location of the file.
+    - **name** (*bytes*) name of the TTree.
+    - **numentries** (*int*) number of entries in the TTree.
+    - **branches** (``OrderedDict``) branch name \u2192 what is known about the branch, including its **interpretation**.
+    - :py:meth:`tree <uproot.tree.TTreeMetadata.tree>` open the file's data and return a TTree with these branches.
+""", width=TEXT_WIDTH)
+
+_method(uproot.tree.TTreeMetadata.tree).__doc__ = wrap(
+u"""Open the file's data and return a TTree with the described branches, without reading the file's streamers or TTree.
+
+    Only the file header is read, to check that the file has the same UUID as the one that was described.
+
+    Parameters
+    ----------
+    {localsource}
+
+    {xrootdsource}
+
+    {httpsource}
+
+    options
+        passed to the :py:class:`Source <uproot.source.source.Source>` (such as *chunkbytes* or *limitbytes*).
+
+    Returns
+    -------
+    :py:class:`TTreeMethods <uproot.tree.TTreeMethods>`
+        a TTree whose branches read arrays, lazy arrays, and iterate as usual, with the saved interpretations as their defaults.
+""".format(**open_fragments), width=TEXT_WIDTH)
+
 ################################################################ uproot.interp.interp.Interpretation
 
 uproot.interp.interp.Interpretation.__doc__ = wrap(
@@ -2574,3 +3296,37 @@ u"""An :py:class:`ArrayCache <uproot.cache.ArrayCache>` with locks for thread sa
     method : "LRU" *(default)* or "LFU"
         least recently used or least frequently used
 """, width=TEXT_WIDTH)
+
+################################################################ uproot.cache.MemoryBudget
+
+uproot.cache.MemoryBudget.__doc__ = wrap(
+u"""A thread-safe count of the bytes held by buffers in flight, passed as *max_memory* to bound iteration and lazy reads.
+
+    Readers :py:meth:`acquire <uproot.cache.MemoryBudget.acquire>` their expected size before reading, which blocks while the budget is full, and :py:meth:`release <uproot.cache.MemoryBudget.release>` it when the buffers are dropped. A request is always granted when nothing else is held, so a single oversized read still proceeds.
+
+    Parameters
+    ----------
+    limitbytes : int or string matching number + /[kMGTPEZY]?B/i
+        maximum number of bytes to hold at once.
+
+    Attributes
+    ----------
+    usedbytes : int
+        bytes currently held.
+
+    peakbytes : int
+        largest *usedbytes* so far.
+""", width=TEXT_WIDTH)
+
+################################################################ uproot.cache.ZoneMap
+
+uproot.cache.ZoneMap.__doc__ = wrap(
+u"""Per-basket statistics of numeric branches (minimum, maximum, number of entries and, for jagged branches, number of items), passed as *zonemap* to record them and to skip baskets that cannot pass a *cut*.
+
+    Statistics are recorded for every basket that a read with this *zonemap* decompresses in full. Afterward, comparisons of a branch with a number in a string *cut*, such as ``"run == 316000"`` or ``"(Jet_pt > 50).any()"``, joined by ``&`` or ``and``, exclude the baskets whose range of values cannot satisfy them: the selection branches are not even read there. Statistics are keyed by file UUID, TTree name, branch name and on-disk type, so one ZoneMap can describe many files.
+
+    Parameters
+    ----------
+    path : ``None`` or str
+        if not ``None``, sidecar file (JSON) to load statistics from, if it exists, and to :py:meth:`save <uproot.cache.ZoneMap.save>` them to.
+""", width=TEXT_WIDTH)
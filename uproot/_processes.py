@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import importlib
+import io
+import pickle
+import sys
+import types
+from collections import deque
+from collections import OrderedDict
+
+import numpy
+
+import uproot.rootio
+import uproot.tree
+from uproot.interp.objects import asgenobj
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+try:
+    from multiprocessing import shared_memory
+    from multiprocessing import resource_tracker
+except ImportError:
+    shared_memory = None
+
+# Reading steps of TTrees in worker processes. Each worker opens the files itself (through
+# its own uproot.rootio.filepool, so that streamers and TTree metadata are read once per
+# worker) and reads whole steps. Results come back as a small pickle whose array buffers are
+# written out-of-band into one block of shared memory. Streamer-generated classes, file
+# contexts, and modules can't be pickled; they're passed by name and resolved in the
+# receiving process.
+
+_ALIGNMENT = 64
+
+def _check(processes):
+    if shared_memory is None or sys.version_info < (3, 8):
+        raise NotImplementedError("processes requires Python 3.8 or later (for shared memory and out-of-band pickling)")
+    if not isinstance(processes, (int, numpy.integer)) or isinstance(processes, bool) or processes < 1:
+        raise ValueError("processes must be a positive number of worker processes")
+
+def _generated(obj):
+    # class defined from a file's streamers, which only exists in that file's context
+    return isinstance(obj, type) and obj.__module__ == "uproot.rootio" and getattr(uproot.rootio, obj.__name__, None) is not obj
+
+def _objectarray(awkwardlib, content, generator, args, kwargs):
+    return __import__(awkwardlib).ObjectArray(content, generator, *args, **kwargs)
+
+def _jaggedarray(awkwardlib, starts, stops, content):
+    return __import__(awkwardlib).JaggedArray(starts, stops, content)
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file, awkward, buffer_callback):
+        pickle.Pickler.__init__(self, file, protocol=5, buffer_callback=buffer_callback)
+        self.awkward = awkward
+
+    def persistent_id(self, obj):
+        if isinstance(obj, uproot.rootio.ROOTDirectory._FileContext):
+            return ("context", None)
+        elif _generated(obj):
+            return ("class", obj.__name__)
+        elif isinstance(obj, types.ModuleType):
+            return ("module", obj.__name__)
+        else:
+            return None
+
+    def reducer_override(self, obj):
+        # awkward-array's own pickling can't encode asgenobj generators
+        if type(obj) is self.awkward.ObjectArray and isinstance(obj.generator, asgenobj._Wrapper):
+            return _objectarray, (self.awkward.__name__, obj.content, obj.generator, obj.args, obj.kwargs)
+        elif type(obj) is self.awkward.JaggedArray and isinstance(obj.content, (self.awkward.ObjectArray, self.awkward.JaggedArray)):
+            return _jaggedarray, (self.awkward.__name__, obj.starts, obj.stops, obj.content)
+        else:
+            return NotImplemented
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file, context, buffers):
+        pickle.Unpickler.__init__(self, file, buffers=buffers)
+        self.context = context
+
+    def persistent_load(self, pid):
+        kind, name = pid
+        if kind == "context":
+            return self.context
+        elif kind == "module":
+            return importlib.import_module(name)
+        else:
+            return self.context.classes[name]
+
+def _dumps(obj, awkward, buffers=None):
+    file = io.BytesIO()
+    _Pickler(file, awkward, None if buffers is None else buffers.append).dump(obj)
+    return file.getvalue()
+
+def _loads(data, context, buffers=()):
+    return _Unpickler(io.BytesIO(data), context, buffers).load()
+
+def _send(obj, awkward):
+    # (pickle, name of the shared memory holding its buffers, (offset, size) of each buffer)
+    buffers = []
+    data = _dumps(obj, awkward, buffers)
+    buffers = [x.raw() for x in buffers]
+    spans, total = [], 0
+    for x in buffers:
+        spans.append((total, x.nbytes))
+        total += -(-x.nbytes // _ALIGNMENT) * _ALIGNMENT
+    if total == 0:
+        return data, None, spans
+
+    try:
+        shm = shared_memory.SharedMemory(create=True, size=total, track=False)
+    except TypeError:
+        # before Python 3.13, this process's resource tracker would unlink it at exit
+        shm = shared_memory.SharedMemory(create=True, size=total)
+        resource_tracker.unregister(shm._name, "shared_memory")
+    try:
+        for x, (offset, size) in zip(buffers, spans):
+            shm.buf[offset : offset + size] = x
+    except Exception:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    return data, shm.name, spans
+
+def _receive(message, context):
+    data, name, spans = message
+    if name is None:
+        return _loads(data, context, [memoryview(b"") for x in spans])
+
+    # one copy out of shared memory, which is unlinked right away; arrays are views of the copy
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        total = spans[-1][0] + spans[-1][1]
+        block = numpy.empty(total, dtype=numpy.uint8)
+        source = numpy.frombuffer(shm.buf, dtype=numpy.uint8, count=total)
+        block[:] = source
+        del source
+    finally:
+        shm.close()
+        shm.unlink()
+    view = memoryview(block)
+    return _loads(data, context, [view[offset : offset + size] for offset, size in spans])
+
+def _discard(message):
+    data, name, spans = message
+    if name is not None:
+        shm = shared_memory.SharedMemory(name=name)
+        shm.close()
+        shm.unlink()
+
+################################################################ in the workers
+
+def _plainerror(err):
+    # an error to pickle back to the main process; those that can't be pickled (like uproot's
+    # KeyError, which poses as the builtin) become their nearest builtin exception type
+    try:
+        pickle.loads(pickle.dumps(err))
+        return err
+    except Exception:
+        for cls in type(err).__mro__:
+            if getattr(builtins, cls.__name__, None) is cls:
+                return cls(str(err))
+
+def _readstep(path, treepath, sources, options, interpretations, start, stop, kwargs):
+    try:
+        tree = uproot.rootio.filepool.tree(path, treepath, localsource=sources[0], xrootdsource=sources[1], httpsource=sources[2], **options)
+        try:
+            branches = _loads(interpretations, tree._context)
+            out = tree.arrays(branches, entrystart=start, entrystop=stop, **kwargs)
+            return _send(out, uproot.tree._normalize_awkwardlib(kwargs.get("awkwardlib", None)))
+        finally:
+            uproot.rootio.filepool.release(tree)
+    except Exception as err:
+        raise _plainerror(err)
+
+################################################################ in the main process
+
+class _Job(object):
+    # steps of one TTree to read in worker processes
+    def __init__(self, tree, path, treepath, sources, options, branches, steps, kwargs, tag=None):
+        self.tree = tree
+        self.path = path
+        self.treepath = treepath
+        self.sources = sources
+        self.options = options
+        awkward = uproot.tree._normalize_awkwardlib(kwargs.get("awkwardlib", None))
+        self.branches = branches
+        self.interpretations = _dumps(OrderedDict((branch.name, interpretation) for branch, interpretation in branches), awkward)
+        self.steps = steps
+        self.kwargs = kwargs
+        self.tag = tag
+
+def iterate(processes, jobs, ordered=True, prefetch=0):
+    # yields (job, start, stop, output of TTreeMethods.arrays) for every step of every job
+    import concurrent.futures
+    _check(processes)
+
+    pool = concurrent.futures.ProcessPoolExecutor(processes)
+    pending = deque()
+
+    def finished():
+        # the oldest step if ordered, otherwise every step that is done, received before any is yielded
+        if ordered:
+            items = [pending.popleft()]
+        else:
+            done, notdone = concurrent.futures.wait([x[3] for x in pending], return_when=concurrent.futures.FIRST_COMPLETED)
+            items = [x for x in pending if x[3] in done]
+            for item in items:
+                pending.remove(item)
+        out = []
+        try:
+            while len(items) > 0:
+                job, start, stop, future = items.pop(0)
+                out.append((job, start, stop, _receive(future.result(), job.tree._context)))
+        finally:
+            pending.extend(items)
+        return out
+
+    try:
+        for job in jobs:
+            for start, stop in job.steps:
+                while len(pending) >= processes + prefetch:
+                    for x in finished():
+                        yield x
+                pending.append((job, start, stop, pool.submit(_readstep, job.path, job.treepath, job.sources, job.options, job.interpretations, start, stop, job.kwargs)))
+
+        while len(pending) > 0:
+            for x in finished():
+                yield x
+
+    finally:
+        # also when the caller stops early: don't leave shared memory behind
+        for job, start, stop, future in pending:
+            if not future.cancel():
+                try:
+                    _discard(future.result())
+                except Exception:
+                    pass
+        pool.shutdown(wait=True)
@@ -4,7 +4,10 @@
 
 from __future__ import absolute_import
 
+import base64
+import json
 import math
+import os
 import threading
 try:
     from collections.abc import MutableMapping
@@ -12,6 +15,7 @@ except ImportError:
     from collections import MutableMapping
 
 import cachetools
+import numpy
 
 class ArrayCache(MutableMapping):
     @staticmethod
@@ -78,3 +82,189 @@ class ThreadSafeArrayCache(ArrayCache):
     def __len__(self):
         with self._lock:
             return len(self._cache)
+
+class MemoryBudget(object):
+    # bytes held by buffers in flight; acquire blocks while the budget is full, except that
+    # a request is always granted when nothing else is held (so an oversized step still runs)
+    def __init__(self, limitbytes):
+        from uproot.rootio import _memsize
+        m = _memsize(limitbytes)
+        if m is not None:
+            limitbytes = int(math.ceil(m))
+        if limitbytes <= 0:
+            raise ValueError("limitbytes must be positive")
+        self.limitbytes = limitbytes
+        self.usedbytes = 0
+        self.peakbytes = 0
+        self._condition = threading.Condition()
+
+    def __repr__(self):
+        return "<MemoryBudget {0} of {1} bytes in use (peak {2}) at 0x{3:012x}>".format(self.usedbytes, self.limitbytes, self.peakbytes, id(self))
+
+    def fits(self, numbytes):
+        with self._condition:
+            return self.usedbytes == 0 or self.usedbytes + numbytes <= self.limitbytes
+
+    def acquire(self, numbytes):
+        numbytes = int(math.ceil(numbytes))
+        with self._condition:
+            while self.usedbytes > 0 and self.usedbytes + numbytes > self.limitbytes:
+                self._condition.wait()
+            self.usedbytes += numbytes
+            self.peakbytes = max(self.peakbytes, self.usedbytes)
+        return numbytes
+
+    def resize(self, oldbytes, newbytes):
+        # replaces an estimate with a measurement
+        newbytes = int(math.ceil(newbytes))
+        with self._condition:
+            self.usedbytes += newbytes - oldbytes
+            self.peakbytes = max(self.peakbytes, self.usedbytes)
+            self._condition.notify_all()
+        return newbytes
+
+    def release(self, numbytes):
+        with self._condition:
+            self.usedbytes -= numbytes
+            self._condition.notify_all()
+
+    @staticmethod
+    def nbytes(obj):
+        # size of the arrays in an array, a DataFrame, or a dict/tuple/list of them
+        if isinstance(obj, dict):
+            return sum(MemoryBudget.nbytes(x) for x in obj.values())
+        elif isinstance(obj, (tuple, list)):
+            return sum(MemoryBudget.nbytes(x) for x in obj)
+        elif callable(getattr(obj, "memory_usage", None)):
+            return int(numpy.sum(obj.memory_usage()))
+        else:
+            return getattr(obj, "nbytes", 0)
+
+class ZoneMap(object):
+    # minimum, maximum, number of entries and number of items in each basket of numeric branches,
+    # recorded whenever a basket is read in full and used to skip baskets that cannot pass a cut;
+    # keyed by file UUID, TTree name, branch name and on-disk dtype, so that one sidecar file can
+    # describe many files
+    version = 1
+
+    def __init__(self, path=None):
+        self.path = path
+        self._zones = {}
+        self._lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __repr__(self):
+        return "<ZoneMap of {0} branches at 0x{1:012x}>".format(len(self._zones), id(self))
+
+    def __len__(self):
+        return len(self._zones)
+
+    @staticmethod
+    def _dtype(interpretation):
+        # on-disk dtype of flat or jagged plain numbers; None for anything else
+        from uproot.interp.jagged import asjagged
+        from uproot.interp.numerical import asdtype
+        if isinstance(interpretation, asjagged):
+            interpretation = interpretation.content
+        if isinstance(interpretation, asdtype) and interpretation.fromdtype.shape == interpretation.todtype.shape == () and interpretation.fromdtype.names is None and interpretation.fromdtype.kind in "biuf":
+            return interpretation.fromdtype
+        else:
+            return None
+
+    @staticmethod
+    def _key(branch, dtype):
+        return "{0};{1};{2};{3}".format(base64.b64encode(branch._context.uuid).decode("ascii"), branch._context.treename.decode("ascii"), branch.name.decode("ascii"), dtype.str)
+
+    def record(self, branch, interpretation, i, source):
+        # source is basket i of branch, entirely read and not yet finalized
+        dtype = self._dtype(interpretation)
+        if dtype is None:
+            return
+        content = getattr(source, "content", source)
+        if dtype.kind == "f":
+            content = content[~numpy.isnan(content)]
+
+        if len(content) == 0:
+            low, high = float("inf"), float("-inf")
+        else:
+            low, high = content.min(), content.max()
+            if dtype.kind in "iu":
+                # round outward, so that the float64 bounds still contain every integer
+                low, high = int(low), int(high)
+                if float(low) > low:
+                    low = numpy.nextafter(float(low), float("-inf"))
+                if float(high) < high:
+                    high = numpy.nextafter(float(high), float("inf"))
+
+        key = self._key(branch, dtype)
+        numbaskets = branch.numbaskets
+        with self._lock:
+            zones = self._zones.get(key, None)
+            if zones is None or zones["numbaskets"] != numbaskets:
+                zones = self._zones[key] = {"numbaskets": numbaskets,
+                                            "min": numpy.full(numbaskets, float("inf")),
+                                            "max": numpy.full(numbaskets, float("-inf")),
+                                            "entries": numpy.zeros(numbaskets, dtype=numpy.int64),
+                                            "items": numpy.zeros(numbaskets, dtype=numpy.int64),
+                                            "known": numpy.zeros(numbaskets, dtype=numpy.bool_)}
+            zones["min"][i] = low
+            zones["max"][i] = high
+            zones["entries"][i] = len(source)
+            zones["items"][i] = len(getattr(source, "content", source))
+            zones["known"][i] = True
+
+    def zones(self, branch, interpretation):
+        # dict of per-basket "min", "max", "entries", "items" and "known" arrays, or None
+        dtype = self._dtype(interpretation)
+        if dtype is None:
+            return None
+        with self._lock:
+            zones = self._zones.get(self._key(branch, dtype), None)
+        if zones is None or zones["numbaskets"] != branch.numbaskets:
+            return None
+        return zones
+
+    def select(self, branch, interpretation, op, value):
+        # baskets that may hold an item for which "item op value" is true; None if nothing is known
+        zones = self.zones(branch, interpretation)
+        if zones is None:
+            return None
+        low, high = zones["min"], zones["max"]
+        if op == "==":
+            out = (low <= value) & (value <= high)
+        elif op == "<":
+            out = low < value
+        elif op == "<=":
+            out = low <= value
+        elif op == ">":
+            out = high > value
+        elif op == ">=":
+            out = high >= value
+        else:
+            raise ValueError("unrecognized comparison {0}; comparisons are '==', '<', '<=', '>', '>='".format(repr(op)))
+        return out | ~zones["known"]
+
+    def save(self, path=None):
+        if path is None:
+            path = self.path
+        if path is None:
+            raise ValueError("no path given for the ZoneMap sidecar file")
+        with self._lock:
+            zones = dict((key, dict((name, x.tolist() if isinstance(x, numpy.ndarray) else x) for name, x in value.items())) for key, value in self._zones.items())
+        with open(path, "w") as file:
+            json.dump({"version": self.version, "zones": zones}, file)
+
+    def load(self, path):
+        with open(path) as file:
+            data = json.load(file)
+        if data.get("version", None) != self.version:
+            raise ValueError("ZoneMap file {0} has version {1}, not {2}".format(repr(path), repr(data.get("version", None)), self.version))
+        with self._lock:
+            for key, value in data["zones"].items():
+                self._zones[key] = {"numbaskets": value["numbaskets"],
+                                    "min": numpy.array(value["min"], dtype=numpy.float64),
+                                    "max": numpy.array(value["max"], dtype=numpy.float64),
+                                    "entries": numpy.array(value["entries"], dtype=numpy.int64),
+                                    "items": numpy.array(value["items"], dtype=numpy.int64),
+                                    "known": numpy.array(value["known"], dtype=numpy.bool_)}
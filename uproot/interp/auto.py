@@ -26,6 +26,9 @@ from uproot.interp.objects import STLVector
 from uproot.interp.objects import STLMap
 from uproot.interp.objects import STLString
 from uproot.interp.objects import Pointer
+from uproot.interp.stl import asstlvectorvector
+from uproot.interp.stl import asstlvectorstring
+from uproot.interp.stl import asstlmap
 
 class _NotNumerical(Exception): pass
 
@@ -66,6 +69,14 @@ def _ftype2dtype(fType, awkward):
     else:
         raise _NotNumerical
 
+def _stlmapnumbers(typename):
+    m = interpret._stlmap.match(typename)
+    if m is not None:
+        key, value = m.groups()
+        if key in interpret._stlnumbers and value in interpret._stlnumbers:
+            return asstlmap(asdtype(interpret._stlnumbers[key]), asdtype(interpret._stlnumbers[value]))
+    return None
+
 def _leaf2dtype(leaf, awkward):
     classname = leaf.__class__.__name__
     if classname == "TLeafO":
@@ -134,6 +145,11 @@ def interpret(branch, awkwardlib=None, swapbytes=True, cntvers=False, tobject=Tr
     import uproot.tree
     awkward = uproot.tree._normalize_awkwardlib(awkwardlib)
 
+    # branches restored from TTreeMetadata have no leaves or streamers, only the interpretation that was saved
+    saved = getattr(branch, "_savedinterpretation", None)
+    if saved is not None:
+        return saved if saved.awkward is awkward else saved.awkwardlib(awkward)
+
     dims, isjagged = (), False
     if len(branch._fLeaves) == 1:
         m = interpret._titlehasdims.match(branch._fLeaves[0]._fTitle)
@@ -337,7 +353,7 @@ def interpret(branch, awkwardlib=None, swapbytes=True, cntvers=False, tobject=Tr
                                 return None
 
                             if streamerClass.__name__ == "string":
-                                return asgenobj(STLVector(STLString(awkward)), branch._context, 6)
+                                return asstlvectorstring()
 
                             if len(branch._fBranches) != 0:
                                 return None
@@ -384,13 +400,17 @@ def interpret(branch, awkwardlib=None, swapbytes=True, cntvers=False, tobject=Tr
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<double>" or getattr(branch._streamer, "_fTypeName", None) == b"vector<Double_t>":
                     return asjagged(asdtype("f8"), skipbytes=10)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<string>":
-                    return asgenobj(STLVector(STLString(awkward)), branch._context, 6)
+                    return asstlvectorstring()
                 else:
                     m = interpret._vectorpointer.match(getattr(branch._streamer, "_fTypeName", b""))
                     if m is not None and m.group(1) in branch._context.streamerinfosmap:
                         streamer = branch._context.streamerinfosmap[m.group(1)]
                         return asgenobj(STLVector(Pointer(streamer.pyclass)), branch._context, skipbytes=6)
 
+                out = _stlmapnumbers(getattr(branch._streamer, "_fTypeName", b""))
+                if out is not None:
+                    return out
+
                 if getattr(branch._streamer, "_fTypeName", None) == b"map<string,bool>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,Bool_t>":
                     return asgenobj(STLMap(STLString(awkward), asdtype(awkward.numpy.bool_)), branch._context, 6)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"map<string,char>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,Char_t>":
@@ -421,31 +441,31 @@ def interpret(branch, awkwardlib=None, swapbytes=True, cntvers=False, tobject=Tr
                     return asgenobj(STLMap(STLString(awkward), STLString(awkward)), branch._context, 6)
 
                 if getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<bool> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Bool_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(awkward.numpy.bool_))), branch._context, 6)
+                    return asstlvectorvector(asdtype(awkward.numpy.bool_))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<char> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Char_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype("i1"))), branch._context, 6)
+                    return asstlvectorvector(asdtype("i1"))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<unsigned char> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<UChar_t> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Byte_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype("u1"))), branch._context, 6)
+                    return asstlvectorvector(asdtype("u1"))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<short> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Short_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i2"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">i2"))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<unsigned short> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<UShort_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u2"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">u2"))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<int> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Int_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i4"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">i4"))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<unsigned int> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<UInt_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u4"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">u4"))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<long> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Long_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i8"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">i8"))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<unsigned long> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<ULong_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u8"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">u8"))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<long long> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Long64_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i8"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">i8"))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<unsigned long long> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<ULong64_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u8"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">u8"))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<float> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Float_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">f4"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">f4"))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<double> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Double_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">f8"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">f8"))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<string> >":
                     return asgenobj(STLVector(STLVector(STLString(awkward))), branch._context, 6)
 
@@ -483,37 +503,41 @@ def interpret(branch, awkwardlib=None, swapbytes=True, cntvers=False, tobject=Tr
                 elif branch._fClassName == b"vector<double>" or branch._fClassName == b"vector<Double_t>":
                     return asjagged(asdtype("f8"), skipbytes=10)
                 elif branch._fClassName == b"vector<string>":
-                    return asgenobj(STLVector(STLString(awkward)), branch._context, 6)
+                    return asstlvectorstring()
 
                 if branch._fClassName == b"vector<vector<bool> >" or branch._fClassName == b"vector<vector<Bool_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(awkward.numpy.bool_))), branch._context, 6)
+                    return asstlvectorvector(asdtype(awkward.numpy.bool_))
                 elif branch._fClassName == b"vector<vector<char> >" or branch._fClassName == b"vector<vector<Char_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype("i1"))), branch._context, 6)
+                    return asstlvectorvector(asdtype("i1"))
                 elif branch._fClassName == b"vector<vector<unsigned char> >" or branch._fClassName == b"vector<vector<UChar_t> >" or branch._fClassName == b"vector<vector<Byte_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype("u1"))), branch._context, 6)
+                    return asstlvectorvector(asdtype("u1"))
                 elif branch._fClassName == b"vector<vector<short> >" or branch._fClassName == b"vector<vector<Short_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i2"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">i2"))
                 elif branch._fClassName == b"vector<vector<unsigned short> >" or branch._fClassName == b"vector<vector<UShort_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u2"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">u2"))
                 elif branch._fClassName == b"vector<vector<int> >" or branch._fClassName == b"vector<vector<Int_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i4"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">i4"))
                 elif branch._fClassName == b"vector<vector<unsigned int> >" or branch._fClassName == b"vector<vector<UInt_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u4"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">u4"))
                 elif branch._fClassName == b"vector<vector<long> >" or branch._fClassName == b"vector<vector<Long_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i8"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">i8"))
                 elif branch._fClassName == b"vector<vector<unsigned long> >" or branch._fClassName == b"vector<vector<ULong_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u8"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">u8"))
                 elif branch._fClassName == b"vector<vector<long long> >" or branch._fClassName == b"vector<vector<Long64_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i8"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">i8"))
                 elif branch._fClassName == b"vector<vector<unsigned long long> >" or branch._fClassName == b"vector<vector<ULong64_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u8"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">u8"))
                 elif branch._fClassName == b"vector<vector<float> >" or branch._fClassName == b"vector<vector<Float_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">f4"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">f4"))
                 elif branch._fClassName == b"vector<vector<double> >" or branch._fClassName == b"vector<vector<Double_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">f8"))), branch._context, 6)
+                    return asstlvectorvector(asdtype(">f8"))
                 elif branch._fClassName == b"vector<vector<string> >":
                     return asgenobj(STLVector(STLVector(STLString(awkward))), branch._context, 6)
 
+                out = _stlmapnumbers(branch._fClassName)
+                if out is not None:
+                    return out
+
                 if branch._fClassName == b"map<string,bool>" or branch._fClassName == b"map<string,Bool_t>":
                     return asgenobj(STLMap(STLString(awkward), asdtype(awkward.numpy.bool_)), branch._context, 6)
                 elif branch._fClassName == b"map<string,char>" or branch._fClassName == b"map<string,Char_t>":
@@ -586,6 +610,14 @@ interpret._itemdimpattern = re.compile(br"\[([1-9][0-9]*)\]")
 interpret._itemanypattern = re.compile(br"\[(.*)\]")
 interpret._vectorpointer = re.compile(br"vector\<([^<>]*)\*\>")
 interpret._pairsecond = re.compile(br"pair\<[^<>]*,(.*) \>")
+interpret._stlmap = re.compile(br"map\<([^<>,]*),([^<>,]*)\>$")
+interpret._stlnumbers = {b"bool": "?", b"Bool_t": "?",
+                         b"char": "i1", b"Char_t": "i1", b"unsigned char": "u1", b"UChar_t": "u1", b"Byte_t": "u1",
+                         b"short": "i2", b"Short_t": "i2", b"unsigned short": "u2", b"UShort_t": "u2",
+                         b"int": "i4", b"Int_t": "i4", b"unsigned int": "u4", b"UInt_t": "u4",
+                         b"long": "i8", b"Long_t": "i8", b"unsigned long": "u8", b"ULong_t": "u8",
+                         b"long long": "i8", b"Long64_t": "i8", b"unsigned long long": "u8", b"ULong64_t": "u8",
+                         b"float": "f4", b"Float_t": "f4", b"double": "f8", b"Double_t": "f8"}
 
 streamer_aliases = [
     (re.compile(b'(ROOT::Math::(?:PositionVector3D|DisplacementVector3D)<ROOT::Math::Cartesian3D<(?:[^>,]+)>)\\s+(>)'),
@@ -4,29 +4,15 @@
 
 from __future__ import absolute_import
 
-import math
-
 import uproot.interp.interp
 import uproot.interp.numerical
+import uproot.interp.kernels
 
 class _JaggedArrayPrep(object):
     def __init__(self, counts, content):
         self.counts = counts
         self.content = content
 
-def _destructive_divide(array, divisor, awkward):
-    if divisor == 1:
-        pass
-    elif divisor == 2:
-        awkward.numpy.right_shift(array, 1, out=array)
-    elif divisor == 4:
-        awkward.numpy.right_shift(array, 2, out=array)
-    elif divisor == 8:
-        awkward.numpy.right_shift(array, 3, out=array)
-    else:
-        awkward.numpy.floor_divide(array, divisor, out=array)
-    return array
-
 class asjagged(uproot.interp.interp.Interpretation):
     # makes __doc__ attribute mutable before Python 3.3
     __metaclass__ = type.__new__(type, "type", (uproot.interp.interp.Interpretation.__metaclass__,), {})
@@ -68,24 +54,13 @@ class asjagged(uproot.interp.interp.Interpretation):
             return self.awkward.JaggedArray.fromoffsets([0], self.content.fromroot(data, None, local_entrystart, local_entrystop, keylen))
         else:
             if self.skipbytes == 0:
-                offsets = _destructive_divide(byteoffsets, self.content.itemsize, self.awkward)
+                offsets = uproot.interp.kernels.divide(byteoffsets, self.content.itemsize, self.awkward)
                 starts  = offsets[local_entrystart     : local_entrystop    ]
                 stops   = offsets[local_entrystart + 1 : local_entrystop + 1]
                 content = self.content.fromroot(data, None, starts[0], stops[-1], keylen)
                 return self.awkward.JaggedArray(starts, stops, content)
 
             else:
-                bytestarts = byteoffsets[local_entrystart     : local_entrystop    ] + self.skipbytes
-                bytestops  = byteoffsets[local_entrystart + 1 : local_entrystop + 1]
-
-                mask = self.awkward.numpy.zeros(len(data), dtype=self.awkward.numpy.int8)
-                mask[bytestarts[bytestarts < len(data)]] = 1
-                self.awkward.numpy.add.at(mask, bytestops[bytestops < len(data)], -1)
-                self.awkward.numpy.cumsum(mask, out=mask)
-                data = data[mask.view(self.awkward.numpy.bool_)]
-
-                content = self.content.fromroot(data, None, 0, bytestops[-1], keylen)
-
                 itemsize = 1
                 sub = self.content
                 while hasattr(sub, "content"):
@@ -95,17 +70,8 @@ class asjagged(uproot.interp.interp.Interpretation):
                 if isinstance(sub, uproot.interp.numerical.asstlbitset):
                     itemsize = sub.numbytes + 4
 
-                counts = bytestops - bytestarts
-                shift = math.log(itemsize, 2)
-                if shift == round(shift):
-                    self.awkward.numpy.right_shift(counts, int(shift), out=counts)
-                else:
-                    self.awkward.numpy.floor_divide(counts, itemsize, out=counts)
-
-                offsets = self.awkward.numpy.empty(len(counts) + 1, self.awkward.JaggedArray.INDEXTYPE)
-                offsets[0] = 0
-                self.awkward.numpy.cumsum(counts, out=offsets[1:])
-
+                data, offsets = uproot.interp.kernels.unskip(data, byteoffsets, local_entrystart, local_entrystop, self.skipbytes, itemsize, self.awkward)
+                content = self.content.fromroot(data, None, 0, offsets[-1], keylen)
                 return self.awkward.JaggedArray(offsets[:-1], offsets[1:], content)
 
     def destination(self, numitems, numentries):
@@ -128,7 +94,8 @@ class asjagged(uproot.interp.interp.Interpretation):
         if len(branch._fLeaves) == 1:
             leafcount = branch._fLeaves[0]._fLeafCount
 
-        out = self.awkward.Methods.maybemixin(type(content), self.awkward.JaggedArray).fromcounts(destination.counts, content)
+        offsets = uproot.interp.kernels.counts2offsets(destination.counts, self.awkward)
+        out = self.awkward.Methods.maybemixin(type(content), self.awkward.JaggedArray).fromoffsets(offsets, content)
         out.leafcount = leafcount
         if self.debug_reading:
             print("reading {0}".format(repr(out)))
@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+# Inner loops of the interpretations. Every kernel has a pure-numpy reference
+# implementation; if Numba is importable, single-pass compiled versions are used
+# instead. setbackend("numpy") or setbackend("numba") forces one or the other.
+
+import math
+
+class _NumpyKernels(object):
+    name = "numpy"
+
+    @staticmethod
+    def counts2offsets(counts, awkward):
+        offsets = awkward.numpy.empty(len(counts) + 1, dtype=awkward.JaggedArray.INDEXTYPE)
+        offsets[0] = 0
+        awkward.numpy.cumsum(counts, out=offsets[1:])
+        return offsets
+
+    @staticmethod
+    def divide(array, divisor, awkward):
+        if divisor == 1:
+            pass
+        elif divisor == 2:
+            awkward.numpy.right_shift(array, 1, out=array)
+        elif divisor == 4:
+            awkward.numpy.right_shift(array, 2, out=array)
+        elif divisor == 8:
+            awkward.numpy.right_shift(array, 3, out=array)
+        else:
+            awkward.numpy.floor_divide(array, divisor, out=array)
+        return array
+
+    @staticmethod
+    def gather(data, starts, counts, awkward):
+        # concatenates the spans data[starts[i] : starts[i] + counts[i]] with one fancy-index
+        offsets = _NumpyKernels.counts2offsets(counts, awkward)
+        if offsets[-1] == 0:
+            return data[:0]
+        index = awkward.numpy.repeat(starts - offsets[:-1], counts)
+        index += awkward.numpy.arange(offsets[-1], dtype=index.dtype)
+        return data[index]
+
+    @staticmethod
+    def unskip(data, byteoffsets, entrystart, entrystop, skipbytes, itemsize, awkward):
+        # drops a skipbytes header from each entry; returns the remaining bytes and offsets in items
+        bytestarts = byteoffsets[entrystart     : entrystop    ] + skipbytes
+        bytestops  = byteoffsets[entrystart + 1 : entrystop + 1]
+
+        bytecounts = bytestops - bytestarts
+        awkward.numpy.maximum(bytecounts, 0, out=bytecounts)
+        data = _NumpyKernels.gather(data, bytestarts, bytecounts, awkward)
+
+        counts = bytecounts
+        shift = math.log(itemsize, 2)
+        if shift == round(shift):
+            awkward.numpy.right_shift(counts, int(shift), out=counts)
+        else:
+            awkward.numpy.floor_divide(counts, itemsize, out=counts)
+
+        return data, _NumpyKernels.counts2offsets(counts, awkward)
+
+    @staticmethod
+    def truncated(source, numbits, destination, blocksize, awkward):
+        # ROOT's float with numbits mantissa: 8-bit exponent, then mantissa with its sign bit above it
+        numpy = awkward.numpy
+        blocksize = max(1, min(blocksize, len(source)))
+        mask = (1 << (numbits + 1)) - 1
+        signbit = 1 << (numbits + 1)
+        exponent = source["exponent"]
+        mantissa = source["mantissa"]
+        scratch = numpy.empty((2, blocksize), dtype=numpy.uint32)
+
+        for start in range(0, len(source), blocksize):
+            stop = min(start + blocksize, len(source))
+            bits, tmp = scratch[0, : stop - start], scratch[1, : stop - start]
+
+            tmp[:] = mantissa[start:stop]
+            numpy.bitwise_and(tmp, signbit, out=bits)
+            numpy.left_shift(bits, 30 - numbits, out=bits)
+            numpy.bitwise_and(tmp, mask, out=tmp)
+            numpy.left_shift(tmp, 23 - numbits, out=tmp)
+            numpy.bitwise_or(bits, tmp, out=bits)
+            tmp[:] = exponent[start:stop]
+            numpy.left_shift(tmp, 23, out=tmp)
+            numpy.bitwise_or(bits, tmp, out=bits)
+
+            destination[start:stop] = bits.view(numpy.float32)
+
+    @staticmethod
+    def ranged(source, low, scale, destination, blocksize, awkward):
+        # ROOT's float packed as an unsigned integer over [low, high)
+        numpy = awkward.numpy
+        blocksize = max(1, min(blocksize, len(source)))
+        for start in range(0, len(source), blocksize):
+            stop = min(start + blocksize, len(source))
+            out = destination[start:stop]
+            out[:] = source[start:stop]
+            numpy.multiply(out, scale, out=out)
+            numpy.add(out, low, out=out)
+
+def _numbakernels():
+    import numba
+    import numpy
+
+    @numba.njit
+    def counts2offsets(counts):
+        offsets = numpy.empty(len(counts) + 1, dtype=numpy.int64)
+        offsets[0] = 0
+        for i in range(len(counts)):
+            offsets[i + 1] = offsets[i] + counts[i]
+        return offsets
+
+    @numba.njit
+    def divide(array, divisor):
+        for i in range(len(array)):
+            array[i] //= divisor
+
+    @numba.njit
+    def gather(data, starts, counts):
+        total = 0
+        for i in range(len(counts)):
+            total += counts[i]
+        out = numpy.empty(total, dtype=data.dtype)
+        k = 0
+        for i in range(len(counts)):
+            start = starts[i]
+            for j in range(counts[i]):
+                out[k] = data[start + j]
+                k += 1
+        return out
+
+    @numba.njit
+    def unskip(data, byteoffsets, entrystart, entrystop, skipbytes, itemsize):
+        numentries = entrystop - entrystart
+        offsets = numpy.empty(numentries + 1, dtype=numpy.int64)
+        offsets[0] = 0
+        numbytes = 0
+        for i in range(numentries):
+            count = byteoffsets[entrystart + i + 1] - byteoffsets[entrystart + i] - skipbytes
+            if count < 0:
+                count = 0
+            numbytes += count
+            offsets[i + 1] = offsets[i] + count // itemsize
+
+        out = numpy.empty(numbytes, dtype=data.dtype)
+        k = 0
+        for i in range(numentries):
+            start = byteoffsets[entrystart + i] + skipbytes
+            for j in range(start, byteoffsets[entrystart + i + 1]):
+                out[k] = data[j]
+                k += 1
+        return out, offsets
+
+    @numba.njit
+    def truncated(raw, numbits, destination, scratch):
+        # raw is the packed big-endian records, 3 bytes each
+        mask = (1 << (numbits + 1)) - 1
+        signbit = 1 << (numbits + 1)
+        blocksize = len(scratch)
+        numitems = len(destination)
+        bits = scratch.view(numpy.float32)
+        for start in range(0, numitems, blocksize):
+            stop = min(start + blocksize, numitems)
+            for i in range(start, stop):
+                exponent = numpy.uint32(raw[3*i])
+                mantissa = (numpy.uint32(raw[3*i + 1]) << 8) | numpy.uint32(raw[3*i + 2])
+                scratch[i - start] = ((mantissa & signbit) << (30 - numbits)) | ((mantissa & mask) << (23 - numbits)) | (exponent << 23)
+            for i in range(start, stop):
+                destination[i] = bits[i - start]
+
+    @numba.njit
+    def ranged(raw, low, scale, destination):
+        # raw is the packed big-endian unsigned integers, 4 bytes each
+        for i in range(len(destination)):
+            value = (numpy.uint32(raw[4*i]) << 24) | (numpy.uint32(raw[4*i + 1]) << 16) | (numpy.uint32(raw[4*i + 2]) << 8) | numpy.uint32(raw[4*i + 3])
+            destination[i] = value
+            destination[i] = destination[i] * scale + low
+
+    class _NumbaKernels(_NumpyKernels):
+        name = "numba"
+
+        @staticmethod
+        def counts2offsets(counts, awkward):
+            return counts2offsets(counts).astype(awkward.JaggedArray.INDEXTYPE, copy=False)
+
+        @staticmethod
+        def divide(array, divisor, awkward):
+            if divisor != 1:
+                divide(array, divisor)
+            return array
+
+        @staticmethod
+        def gather(data, starts, counts, awkward):
+            if data.dtype.fields is not None or data.ndim != 1:
+                return _NumpyKernels.gather(data, starts, counts, awkward)
+            return gather(data, starts, counts)
+
+        @staticmethod
+        def unskip(data, byteoffsets, entrystart, entrystop, skipbytes, itemsize, awkward):
+            data, offsets = unskip(data, byteoffsets, entrystart, entrystop, skipbytes, itemsize)
+            return data, offsets.astype(awkward.JaggedArray.INDEXTYPE, copy=False)
+
+        @staticmethod
+        def truncated(source, numbits, destination, blocksize, awkward):
+            if not source.flags.c_contiguous or not destination.flags.c_contiguous:
+                return _NumpyKernels.truncated(source, numbits, destination, blocksize, awkward)
+            blocksize = max(1, min(blocksize, len(source)))
+            truncated(source.view(numpy.uint8).reshape(-1), numbits, destination, numpy.empty(blocksize, dtype=numpy.uint32))
+
+        @staticmethod
+        def ranged(source, low, scale, destination, blocksize, awkward):
+            if not source.flags.c_contiguous or not destination.flags.c_contiguous:
+                return _NumpyKernels.ranged(source, low, scale, destination, blocksize, awkward)
+            # same precision as the numpy implementation, which computes in the destination's dtype
+            ranged(source.view(numpy.uint8).reshape(-1), destination.dtype.type(low), destination.dtype.type(scale), destination)
+
+    return _NumbaKernels
+
+_backends = {"numpy": _NumpyKernels}
+_requested = "auto"
+_active = None
+
+def setbackend(name):
+    """Select the kernel implementation: "auto" (Numba if importable), "numpy", or "numba"."""
+    global _requested, _active
+    if name not in ("auto", "numpy", "numba"):
+        raise ValueError("kernel backend must be \"auto\", \"numpy\", or \"numba\", not {0}".format(repr(name)))
+    if name == "numba" and _backends.get("numba") is None:
+        try:
+            _backends["numba"] = _numbakernels()
+        except ImportError:
+            raise ImportError("install the numba package with:\n    pip install numba\nor\n    conda install numba")
+    _requested = name
+    _active = None
+
+def getbackend():
+    """Name of the kernel implementation in use: "numpy" or "numba"."""
+    return _kernels().name
+
+def _kernels():
+    global _active
+    if _active is None:
+        if _requested == "auto" and "numba" not in _backends:
+            try:
+                _backends["numba"] = _numbakernels()
+            except ImportError:
+                _backends["numba"] = None
+        if _requested == "auto":
+            _active = _backends["numba"] or _backends["numpy"]
+        else:
+            _active = _backends[_requested]
+    return _active
+
+def counts2offsets(counts, awkward):
+    return _kernels().counts2offsets(counts, awkward)
+
+def divide(array, divisor, awkward):
+    return _kernels().divide(array, divisor, awkward)
+
+def gather(data, starts, counts, awkward):
+    return _kernels().gather(data, starts, counts, awkward)
+
+def unskip(data, byteoffsets, entrystart, entrystop, skipbytes, itemsize, awkward):
+    return _kernels().unskip(data, byteoffsets, entrystart, entrystop, skipbytes, itemsize, awkward)
+
+def truncated(source, numbits, destination, blocksize, awkward):
+    _kernels().truncated(source, numbits, destination, blocksize, awkward)
+
+def ranged(source, low, scale, destination, blocksize, awkward):
+    _kernels().ranged(source, low, scale, destination, blocksize, awkward)
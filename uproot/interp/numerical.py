@@ -11,6 +11,7 @@ import math
 import numpy
 
 import uproot.interp.interp
+import uproot.interp.kernels
 
 if sys.version_info[0] <= 2:
     string_types = (unicode, str)
@@ -286,24 +287,36 @@ class asdouble32(_asnumeric):
             assert remainder == 0, "{0} % {1} == {2} != 0".format(len(array), product, len(array) % product)
             array = array.reshape((quotient,) + self.fromdims)
 
-        if self.truncated:
-            array = array[local_entrystart:local_entrystop]
-            # We have to make copies to work with contiguous arrays
-            unpacked = array['exponent'].astype(self.awkward.numpy.int32)
-            mantissa = array['mantissa'].astype(self.awkward.numpy.int32)
+        # still packed: decoding happens in fill, directly into the destination
+        return array[local_entrystart:local_entrystop]
 
-            unpacked <<= 23
-            unpacked |= (mantissa & ((1 << (self.numbits + 1)) - 1)) << (23 - self.numbits)
-            sign = ((1 << (self.numbits + 1)) & mantissa != 0) * -2 + 1
+    def fill(self, source, destination, itemstart, itemstop, entrystart, entrystop):
+        source = source.reshape(-1)
+        destination = destination.reshape(-1)[itemstart:itemstop]
 
-            array = unpacked.view(dtype=self.awkward.numpy.float32) * sign
-            array = array.astype(self.todtypeflat)
+        chunksize = self.parallelitems
+        if self.executor is None or len(source) <= chunksize:
+            self._decode(source, destination)
         else:
-            array = array[local_entrystart:local_entrystop].astype(self.todtypeflat)
-            self.awkward.numpy.multiply(array, float(self.high - self.low) / (1 << self.numbits), out=array)
-            self.awkward.numpy.add(array, self.low, out=array)
+            # must not be the executor that is calling fill: it would wait on itself
+            def task(i):
+                self._decode(source[i : i + chunksize], destination[i : i + chunksize])
+            for x in self.executor.map(task, range(0, len(source), chunksize)):
+                pass
+
+    # packed values are decoded blockwise through one small scratch buffer
+    blocksize = 65536
 
-        return array
+    # baskets with more items than this are split across the executor, if one is set
+    executor = None
+    parallelitems = 1048576
+
+    def _decode(self, source, destination):
+        if self.truncated:
+            uproot.interp.kernels.truncated(source, self.numbits, destination, self.blocksize, self.awkward)
+        else:
+            scale = float(self.high - self.low) / (1 << self.numbits)
+            uproot.interp.kernels.ranged(source, self.low, scale, destination, self.blocksize, self.awkward)
 
 class asfloat16(asdouble32):
     # makes __doc__ attribute mutable before Python 3.3
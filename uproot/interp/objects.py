@@ -14,6 +14,7 @@ import uproot.rootio
 import uproot.interp.interp
 import uproot.interp.numerical
 import uproot.interp.jagged
+import uproot.interp.kernels
 
 from uproot._util import _tobytes
 
@@ -401,18 +402,88 @@ class asgenobj(_variable_withoffsets):
     def __repr__(self):
         return "asgenobj({0})".format(self.generator)
 
+class _StringArrayPrep(object):
+    def __init__(self, starts, stops, content):
+        self.starts = starts
+        self.stops = stops
+        self.content = content
+
 class asstring(_variable):
     # makes __doc__ attribute mutable before Python 3.3
     __metaclass__ = type.__new__(type, "type", (_variable.__metaclass__,), {})
 
     def __init__(self, skipbytes=1):
-        super(asstring, self).__init__(uproot.interp.jagged.asjagged(uproot.interp.numerical.asdtype(self.awkward.ObjectArray.CHARTYPE), skipbytes=skipbytes), lambda array: _tobytes(array))
+        super(asstring, self).__init__(uproot.interp.jagged.asjagged(uproot.interp.numerical.asdtype(self.awkward.ObjectArray.CHARTYPE), skipbytes=skipbytes), _tobytes)
 
     def __repr__(self):
         return "asstring({0})".format("" if self.content.skipbytes == 1 else repr(self.content.skipbytes))
+
     @property
     def identifier(self):
         return "asstring({0})".format("" if self.content.skipbytes == 1 else repr(self.content.skipbytes))
 
+    @property
+    def type(self):
+        return bytes
+
+    def empty(self):
+        return self.awkward.StringArray.fromoffsets(self.awkward.numpy.zeros(1, dtype=self.awkward.JaggedArray.INDEXTYPE), self.awkward.numpy.empty(0, dtype=self.awkward.ObjectArray.CHARTYPE), encoding=None)
+
     def compatible(self, other):
         return isinstance(other, asstring)
+
+    def numitems(self, numbytes, numentries):
+        # an upper bound: strings of 255 bytes or more have 4 more header bytes
+        return numbytes - numentries * self.content.skipbytes
+
+    def source_numitems(self, source):
+        return len(source.content)
+
+    def fromroot(self, data, byteoffsets, local_entrystart, local_entrystop, keylen):
+        numpy = self.awkward.numpy
+        bytestarts = byteoffsets[local_entrystart     : local_entrystop    ] + self.content.skipbytes
+        bytestops  = byteoffsets[local_entrystart + 1 : local_entrystop + 1]
+
+        if self.content.skipbytes != 4:
+            # the last header byte is a TString-style length; 255 means a 4-byte length follows
+            nonempty = numpy.nonzero(bytestops > bytestarts)[0]
+            islong = nonempty[data[bytestarts[nonempty] - 1] == 255]
+            bytestarts[islong] += 4
+
+        counts = bytestops - bytestarts
+        numpy.maximum(counts, 0, out=counts)
+
+        offsets = uproot.interp.kernels.counts2offsets(counts, self.awkward)
+        return self.awkward.JaggedArray(offsets[:-1], offsets[1:], uproot.interp.kernels.gather(data, bytestarts, counts, self.awkward))
+
+    def destination(self, numitems, numentries):
+        starts = self.awkward.numpy.empty(numentries, dtype=self.awkward.JaggedArray.INDEXTYPE)
+        stops = self.awkward.numpy.empty(numentries, dtype=self.awkward.JaggedArray.INDEXTYPE)
+        content = self.awkward.numpy.empty(numitems, dtype=self.awkward.ObjectArray.CHARTYPE)
+        return _StringArrayPrep(starts, stops, content)
+
+    def fill(self, source, destination, itemstart, itemstop, entrystart, entrystop):
+        # a basket may fill less than its item range (long-string headers), so starts/stops are kept explicitly
+        destination.content[itemstart : itemstart + len(source.content)] = source.content
+        destination.starts[entrystart:entrystop] = source.starts
+        destination.starts[entrystart:entrystop] += itemstart
+        destination.stops[entrystart:entrystop] = source.stops
+        destination.stops[entrystart:entrystop] += itemstart
+
+    def clip(self, destination, itemstart, itemstop, entrystart, entrystop):
+        destination.starts = destination.starts[entrystart:entrystop] - itemstart
+        destination.stops = destination.stops[entrystart:entrystop] - itemstart
+        destination.content = destination.content[itemstart:itemstop]
+        return destination
+
+    def finalize(self, destination, branch):
+        numpy = self.awkward.numpy
+        counts = destination.stops - destination.starts
+        content = destination.content
+        if len(counts) > 0 and (destination.starts[0] != 0 or not numpy.array_equal(destination.starts[1:], destination.stops[:-1])):
+            content = uproot.interp.kernels.gather(content, destination.starts, counts, self.awkward)
+        offsets = uproot.interp.kernels.counts2offsets(counts, self.awkward)
+        out = self.awkward.StringArray.fromoffsets(offsets, content[:offsets[-1]], encoding=None)
+        if self.debug_reading:
+            print("reading {0}".format(repr(out)))
+        return out
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import uproot.interp.interp
+import uproot.interp.numerical
+import uproot.interp.jagged
+import uproot.interp.kernels
+from uproot.interp.objects import STLString
+
+# Columnar readers for common STL containers. Each entry's serialized bytes are
+# collected by an asjagged(asdtype("u1")) content, then the whole array is parsed
+# at once in finalize. Loops below run over the position of an item within its
+# entry (at most the largest container size), never over entries.
+
+def _int32(data, positions, awkward):
+    index = awkward.numpy.add.outer(positions, awkward.numpy.arange(4, dtype=positions.dtype))
+    return data[index].view(">i4").reshape(-1).astype(awkward.numpy.int64)
+
+def _numbers(data, starts, counts, asdtype, awkward):
+    itemsize = asdtype.fromdtype.itemsize
+    out = uproot.interp.kernels.gather(data, starts, counts * itemsize, awkward).view(asdtype.fromdtype)
+    if out.dtype != asdtype.todtype:
+        out = out.astype(asdtype.todtype)
+    return out
+
+def _stringheaders(data, positions, awkward):
+    # std::string length: one byte, or 255 followed by a 4-byte length
+    counts = data[positions].astype(awkward.numpy.int64)
+    headers = awkward.numpy.ones(len(positions), dtype=awkward.numpy.int64)
+    islong = (counts == 255)
+    if islong.any():
+        counts[islong] = _int32(data, positions[islong] + 1, awkward)
+        headers[islong] = 5
+    return counts, headers
+
+def _strings(data, starts, counts, awkward):
+    content = uproot.interp.kernels.gather(data, starts, counts, awkward)
+    return awkward.StringArray.fromoffsets(uproot.interp.kernels.counts2offsets(counts, awkward), content, encoding=None)
+
+def _entrysizes(raw, awkward):
+    # first four bytes of each non-empty entry: the number of items in the container
+    starts = raw.starts.astype(awkward.numpy.int64)
+    counts = awkward.numpy.zeros(len(starts), dtype=awkward.numpy.int64)
+    nonempty = (raw.stops > raw.starts)
+    counts[nonempty] = _int32(raw.content, starts[nonempty], awkward)
+    return starts + 4, counts
+
+class _asstlcontainer(uproot.interp.interp.Interpretation):
+    def __init__(self, skipbytes=6):
+        self.content = uproot.interp.jagged.asjagged(uproot.interp.numerical.asdtype(self.awkward.numpy.uint8), skipbytes=skipbytes)
+
+    def numitems(self, numbytes, numentries):
+        return self.content.numitems(numbytes, numentries)
+
+    def source_numitems(self, source):
+        return self.content.source_numitems(source)
+
+    def fromroot(self, data, byteoffsets, local_entrystart, local_entrystop, keylen):
+        return self.content.fromroot(data, byteoffsets, local_entrystart, local_entrystop, keylen)
+
+    def destination(self, numitems, numentries):
+        return self.content.destination(numitems, numentries)
+
+    def fill(self, source, destination, itemstart, itemstop, entrystart, entrystop):
+        self.content.fill(source, destination, itemstart, itemstop, entrystart, entrystop)
+
+    def clip(self, destination, itemstart, itemstop, entrystart, entrystop):
+        return self.content.clip(destination, itemstart, itemstop, entrystart, entrystop)
+
+    def finalize(self, destination, branch):
+        out = self._parse(self.content.finalize(destination, branch))
+        if self.debug_reading:
+            print("reading {0}".format(repr(out)))
+        return out
+
+    def empty(self):
+        return self._parse(self.content.empty())
+
+    @property
+    def _skipbytes_repr(self):
+        return "" if self.content.skipbytes == 6 else "skipbytes={0}".format(self.content.skipbytes)
+
+class asstlvectorvector(_asstlcontainer):
+    # makes __doc__ attribute mutable before Python 3.3
+    __metaclass__ = type.__new__(type, "type", (uproot.interp.interp.Interpretation.__metaclass__,), {})
+
+    def __init__(self, content, skipbytes=6):
+        super(asstlvectorvector, self).__init__(skipbytes)
+        self.inner = content
+
+    def __repr__(self):
+        return "asstlvectorvector({0})".format(", ".join(x for x in [repr(self.inner), self._skipbytes_repr] if x != ""))
+
+    @property
+    def identifier(self):
+        return "asstlvectorvector({0}{1})".format(self.inner.identifier, "" if self.content.skipbytes == 6 else ",{0}".format(self.content.skipbytes))
+
+    @property
+    def type(self):
+        return self.awkward.type.ArrayType(self.awkward.numpy.inf, self.awkward.numpy.inf, self.inner.type)
+
+    def compatible(self, other):
+        return isinstance(other, asstlvectorvector) and self.inner.compatible(other.inner)
+
+    def _parse(self, raw):
+        awkward = self.awkward
+        data = raw.content
+        positions, outercounts = _entrysizes(raw, awkward)
+        outeroffsets = uproot.interp.kernels.counts2offsets(outercounts, awkward)
+
+        innerstarts = awkward.numpy.empty(outeroffsets[-1], dtype=awkward.numpy.int64)
+        innercounts = awkward.numpy.empty(outeroffsets[-1], dtype=awkward.numpy.int64)
+        itemsize = self.inner.fromdtype.itemsize
+
+        active = awkward.numpy.nonzero(outercounts)[0]
+        i = 0
+        while len(active) > 0:
+            where = positions[active]
+            counts = _int32(data, where, awkward)
+            slots = outeroffsets[active] + i
+            innerstarts[slots] = where + 4
+            innercounts[slots] = counts
+            positions[active] = where + 4 + counts * itemsize
+            i += 1
+            active = active[outercounts[active] > i]
+
+        content = _numbers(data, innerstarts, innercounts, self.inner, awkward)
+        return awkward.JaggedArray.fromoffsets(outeroffsets, awkward.JaggedArray.fromcounts(innercounts, content))
+
+class asstlvectorstring(_asstlcontainer):
+    # makes __doc__ attribute mutable before Python 3.3
+    __metaclass__ = type.__new__(type, "type", (uproot.interp.interp.Interpretation.__metaclass__,), {})
+
+    def __repr__(self):
+        return "asstlvectorstring({0})".format(self._skipbytes_repr)
+
+    @property
+    def identifier(self):
+        return "asstlvectorstring({0})".format("" if self.content.skipbytes == 6 else self.content.skipbytes)
+
+    @property
+    def type(self):
+        return self.awkward.type.ArrayType(self.awkward.numpy.inf, bytes)
+
+    def compatible(self, other):
+        return isinstance(other, asstlvectorstring)
+
+    def _parse(self, raw):
+        awkward = self.awkward
+        data = raw.content
+        positions, outercounts = _entrysizes(raw, awkward)
+        outeroffsets = uproot.interp.kernels.counts2offsets(outercounts, awkward)
+
+        stringstarts = awkward.numpy.empty(outeroffsets[-1], dtype=awkward.numpy.int64)
+        stringcounts = awkward.numpy.empty(outeroffsets[-1], dtype=awkward.numpy.int64)
+
+        active = awkward.numpy.nonzero(outercounts)[0]
+        i = 0
+        while len(active) > 0:
+            where = positions[active]
+            counts, headers = _stringheaders(data, where, awkward)
+            slots = outeroffsets[active] + i
+            stringstarts[slots] = where + headers
+            stringcounts[slots] = counts
+            positions[active] = where + headers + counts
+            i += 1
+            active = active[outercounts[active] > i]
+
+        return awkward.JaggedArray.fromoffsets(outeroffsets, _strings(data, stringstarts, stringcounts, awkward))
+
+class asstlmap(_asstlcontainer):
+    # makes __doc__ attribute mutable before Python 3.3
+    __metaclass__ = type.__new__(type, "type", (uproot.interp.interp.Interpretation.__metaclass__,), {})
+
+    def __init__(self, keys, values, skipbytes=6):
+        super(asstlmap, self).__init__(skipbytes)
+        if not isinstance(keys, (uproot.interp.numerical.asdtype, STLString)):
+            raise TypeError("asstlmap keys must be asdtype or STLString")
+        if not isinstance(values, uproot.interp.numerical.asdtype):
+            raise TypeError("asstlmap values must be asdtype")
+        self.keys = keys
+        self.values = values
+
+    def __repr__(self):
+        return "asstlmap({0})".format(", ".join(x for x in [repr(self.keys), repr(self.values), self._skipbytes_repr] if x != ""))
+
+    @property
+    def identifier(self):
+        keys = "STLString()" if isinstance(self.keys, STLString) else self.keys.identifier
+        return "asstlmap({0},{1}{2})".format(keys, self.values.identifier, "" if self.content.skipbytes == 6 else ",{0}".format(self.content.skipbytes))
+
+    @property
+    def type(self):
+        keys = bytes if isinstance(self.keys, STLString) else self.keys.type
+        return self.awkward.type.ArrayType(self.awkward.numpy.inf, self.awkward.type.TableType(first=keys, second=self.values.type))
+
+    def compatible(self, other):
+        if not isinstance(other, asstlmap) or not self.values.compatible(other.values):
+            return False
+        if isinstance(self.keys, STLString):
+            return isinstance(other.keys, STLString)
+        else:
+            return isinstance(other.keys, uproot.interp.numerical.asdtype) and self.keys.compatible(other.keys)
+
+    def _parse(self, raw):
+        awkward = self.awkward
+        data = raw.content
+        positions, counts = _entrysizes(raw, awkward)
+
+        if isinstance(self.keys, STLString):
+            offsets = uproot.interp.kernels.counts2offsets(counts, awkward)
+            keystarts = awkward.numpy.empty(offsets[-1], dtype=awkward.numpy.int64)
+            keycounts = awkward.numpy.empty(offsets[-1], dtype=awkward.numpy.int64)
+            valuestarts = awkward.numpy.empty(offsets[-1], dtype=awkward.numpy.int64)
+            valuesize = self.values.fromdtype.itemsize
+
+            active = awkward.numpy.nonzero(counts)[0]
+            i = 0
+            while len(active) > 0:
+                where = positions[active]
+                lengths, headers = _stringheaders(data, where, awkward)
+                slots = offsets[active] + i
+                keystarts[slots] = where + headers
+                keycounts[slots] = lengths
+                valuestarts[slots] = where + headers + lengths
+                positions[active] = where + headers + lengths + valuesize
+                i += 1
+                active = active[counts[active] > i]
+
+            keys = _strings(data, keystarts, keycounts, awkward)
+            values = _numbers(data, valuestarts, awkward.numpy.ones(len(valuestarts), dtype=awkward.numpy.int64), self.values, awkward)
+
+        else:
+            # fixed-size pairs: the whole map is one contiguous block of (key, value) records
+            pairs = awkward.numpy.dtype([("first", self.keys.fromdtype), ("second", self.values.fromdtype)])
+            records = uproot.interp.kernels.gather(data, positions, counts * pairs.itemsize, awkward).view(pairs)
+            keys = records["first"].astype(self.keys.todtype)
+            values = records["second"].astype(self.values.todtype)
+
+        return awkward.JaggedArray.fromcounts(counts, awkward.Table(first=keys, second=values))
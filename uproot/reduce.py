@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import numbers
+from collections import deque
+from collections import OrderedDict
+
+import numpy
+import uproot_methods.classes.TH1
+import uproot_methods.classes.TH2
+
+from uproot.rootio import _bytesid
+from uproot.tree import _exprfunction
+from uproot.tree import _iterate
+from uproot.tree import _normalize_awkwardlib
+from uproot.tree import _normalize_entrystartstop
+from uproot.tree import string_types
+from uproot.source.memmap import MemmapSource
+from uproot.source.xrootd import XRootDSource
+from uproot.source.http import HTTPSource
+
+# Reductions of expressions over the entries of TTrees that pass a cut. Each step of
+# TTreeMethods.iterate is reduced to a small partial result (on the executor, while the next
+# step is being read) and partial results are merged in order, so memory is bounded by the
+# size of the partial results and a few steps, not by the size of the dataset.
+
+################################################################ reducers
+
+class _Count(object):
+    def partial(self, values, weights, numentries):
+        return numentries if len(values) == 0 else len(values[0])
+
+    def merge(self, one, two):
+        return one + two
+
+    def result(self, state):
+        return state
+
+class _Sum(object):
+    def partial(self, values, weights, numentries):
+        if weights is None:
+            return values[0].sum()
+        else:
+            return (values[0] * weights).sum()
+
+    def merge(self, one, two):
+        return one + two
+
+    def result(self, state):
+        return state
+
+class _Mean(object):
+    def partial(self, values, weights, numentries):
+        if weights is None:
+            return [values[0].sum(dtype=numpy.float64), float(len(values[0]))]
+        else:
+            return [(values[0] * weights).sum(dtype=numpy.float64), weights.sum(dtype=numpy.float64)]
+
+    def merge(self, one, two):
+        return [x + y for x, y in zip(one, two)]
+
+    def result(self, state):
+        sumwx, sumw = state
+        if sumw == 0:
+            raise ValueError("mean of an empty selection")
+        return sumwx / sumw
+
+class _MinMax(object):
+    # (minimum, maximum) of each expression, or None for no values
+    def partial(self, values, weights, numentries):
+        if len(values[0]) == 0:
+            return None
+        return [(x.min(), x.max()) for x in values]
+
+    def merge(self, one, two):
+        if one is None:
+            return two
+        if two is None:
+            return one
+        return [(min(x[0], y[0]), max(x[1], y[1])) for x, y in zip(one, two)]
+
+    def result(self, state):
+        return state
+
+class _Min(_MinMax):
+    def result(self, state):
+        if state is None:
+            raise ValueError("min of an empty selection")
+        return state[0][0]
+
+class _Max(_MinMax):
+    def result(self, state):
+        if state is None:
+            raise ValueError("max of an empty selection")
+        return state[0][1]
+
+def _binindex(edges, values):
+    # 0 for underflow, 1 through len(edges) - 1 for the bins, len(edges) for overflow (including the upper edge, as in ROOT)
+    return numpy.searchsorted(edges, values, side="right")
+
+class _Histogram1(object):
+    def __init__(self, edges, title):
+        self.edges = edges
+        self.title = title
+
+    def partial(self, values, weights, numentries):
+        x = numpy.asarray(values[0], dtype=numpy.float64)
+        w = numpy.ones(len(x), dtype=numpy.float64) if weights is None else numpy.asarray(weights, dtype=numpy.float64)
+        index = _binindex(self.edges, x)
+        numbins = len(self.edges) + 1
+        inrange = (index > 0) & (index < numbins - 1)
+        x, w2 = x[inrange], w[inrange]
+        return [numpy.bincount(index, weights=w, minlength=numbins),
+                numpy.bincount(index, weights=w*w, minlength=numbins),
+                len(index),
+                w2.sum(),
+                (w2*w2).sum(),
+                (w2*x).sum(),
+                (w2*x*x).sum()]
+
+    def merge(self, one, two):
+        return [x + y for x, y in zip(one, two)]
+
+    def result(self, state):
+        sumw, sumw2, entries, tsumw, tsumw2, tsumwx, tsumwx2 = state
+        out = uproot_methods.classes.TH1.from_numpy((sumw[1:-1], self.edges, self.title))
+        out[:] = sumw.tolist()
+        out._fSumw2 = sumw2
+        out._fEntries = float(entries)
+        out._fTsumw, out._fTsumw2, out._fTsumwx, out._fTsumwx2 = tsumw, tsumw2, tsumwx, tsumwx2
+        return out
+
+class _Histogram2(object):
+    def __init__(self, xedges, yedges, title):
+        self.xedges = xedges
+        self.yedges = yedges
+        self.title = title
+
+    def partial(self, values, weights, numentries):
+        x = numpy.asarray(values[0], dtype=numpy.float64)
+        y = numpy.asarray(values[1], dtype=numpy.float64)
+        w = numpy.ones(len(x), dtype=numpy.float64) if weights is None else numpy.asarray(weights, dtype=numpy.float64)
+        xindex = _binindex(self.xedges, x)
+        yindex = _binindex(self.yedges, y)
+        numxbins, numybins = len(self.xedges) + 1, len(self.yedges) + 1
+        index = xindex * numybins + yindex
+        inrange = (xindex > 0) & (xindex < numxbins - 1) & (yindex > 0) & (yindex < numybins - 1)
+        x, y, w2 = x[inrange], y[inrange], w[inrange]
+        return [numpy.bincount(index, weights=w, minlength=numxbins*numybins),
+                numpy.bincount(index, weights=w*w, minlength=numxbins*numybins),
+                len(index),
+                w2.sum(),
+                (w2*w2).sum(),
+                (w2*x).sum(),
+                (w2*x*x).sum(),
+                (w2*y).sum(),
+                (w2*y*y).sum(),
+                (w2*x*y).sum()]
+
+    def merge(self, one, two):
+        return [x + y for x, y in zip(one, two)]
+
+    def result(self, state):
+        sumw, sumw2, entries, tsumw, tsumw2, tsumwx, tsumwx2, tsumwy, tsumwy2, tsumwxy = state
+        shape = (len(self.xedges) + 1, len(self.yedges) + 1)
+        sumw, sumw2 = sumw.reshape(shape), sumw2.reshape(shape)
+        out = uproot_methods.classes.TH2.from_numpy((sumw[1:-1, 1:-1], self.xedges, self.yedges, self.title))
+        out[:] = sumw.T.flatten().tolist()
+        out._fSumw2 = sumw2.T.flatten()
+        out._fEntries = float(entries)
+        out._fTsumw, out._fTsumw2, out._fTsumwx, out._fTsumwx2 = tsumw, tsumw2, tsumwx, tsumwx2
+        out._fTsumwy, out._fTsumwy2, out._fTsumwxy = tsumwy, tsumwy2, tsumwxy
+        return out
+
+################################################################ streaming
+
+def _flatten(arrays, awkward):
+    # flat Numpy arrays of the items, broadcasting per-entry values to the items of jagged arrays
+    jagged = [x for x in arrays if isinstance(x, awkward.JaggedArray)]
+    if len(jagged) == 0:
+        return [numpy.asarray(x) for x in arrays]
+    out = [x.flatten() if isinstance(x, awkward.JaggedArray) else jagged[0].tojagged(x).flatten() for x in arrays]
+    if any(len(x) != len(out[0]) for x in out):
+        raise ValueError("expressions have different jagged structure, such as electrons and muons; reduce them to one value per entry or select compatible branches")
+    return [numpy.asarray(x) for x in out]
+
+def _reduce(trees, reducer, exprs, weight, cut, entrysteps, entrystart, entrystop, awkward, cache, basketcache, keycache, executor):
+    state = []
+    pending = deque()
+
+    def merge(partial):
+        if len(state) == 0:
+            state.append(partial)
+        else:
+            state[0] = reducer.merge(state[0], partial)
+
+    try:
+        for tree in trees:
+            functions = [_exprfunction(x, tree, "expression") for x in exprs]
+            if weight is not None:
+                functions.append(_exprfunction(weight, tree, "weight"))
+            names = list(OrderedDict.fromkeys(name for branchnames, function in functions for name in branchnames))
+
+            start, stop = _normalize_entrystartstop(tree.numentries, entrystart, entrystop)
+            if len(names) == 0 and cut is None:
+                merge(reducer.partial([], None, stop - start))
+                continue
+            elif len(names) == 0:
+                names = _exprfunction(cut, tree)[0]
+
+            def task(arrays, functions=functions):
+                values = [function(*[arrays[name] for name in branchnames]) for branchnames, function in functions]
+                values = _flatten(values, awkward)
+                if weight is None:
+                    return reducer.partial(values[:len(exprs)], None, len(arrays[names[0]]))
+                else:
+                    return reducer.partial(values[:-1], values[-1], len(arrays[names[0]]))
+
+            for arrays in tree.iterate(names, entrysteps=entrysteps, outputtype=dict, entrystart=start, entrystop=stop, awkwardlib=awkward, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, prefetch=(0 if executor is None else 1), cut=cut):
+                if executor is None:
+                    merge(task(arrays))
+                else:
+                    # reduce this step on the executor while the next step is read
+                    pending.append(executor.submit(task, arrays))
+                    while len(pending) > 1:
+                        merge(pending.popleft().result())
+                del arrays
+
+            while len(pending) > 0:
+                merge(pending.popleft().result())
+
+    finally:
+        for future in pending:
+            future.cancel()
+
+    if len(state) == 0:
+        return reducer.partial([numpy.empty(0)] * max(len(exprs), 1), None if weight is None else numpy.empty(0), 0)
+    return state[0]
+
+def _edges(bins, range, lowhigh):
+    if isinstance(bins, (numbers.Integral, numpy.integer)):
+        if bins < 1:
+            raise ValueError("number of bins must be positive")
+        auto = range is None
+        if auto:
+            range = lowhigh()
+        low, high = float(range[0]), float(range[1])
+        if low > high:
+            raise ValueError("range must be (low, high) with low <= high")
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+        elif auto:
+            # the maximum would be at the upper edge, which goes to overflow
+            high = numpy.nextafter(high, numpy.inf)
+        return numpy.linspace(low, high, bins + 1)
+    else:
+        edges = numpy.array(bins, dtype=numpy.float64)
+        if len(edges.shape) != 1 or len(edges) < 2 or (edges[1:] <= edges[:-1]).any():
+            raise ValueError("bins must be a positive integer or a one-dimensional, strictly increasing array of bin edges")
+        return edges
+
+def _histogram(trees, expr, bins, range, weight, cut, title, entrysteps, entrystart, entrystop, awkward, cache, basketcache, keycache, executor):
+    # trees is a function returning an iterable of TTrees, in case a first pass finds the range
+    if isinstance(expr, (tuple, list)):
+        if len(expr) != 2:
+            raise ValueError("expr must be one expression (for a TH1) or a pair of expressions (for a TH2)")
+        if isinstance(bins, (numbers.Integral, numpy.integer)):
+            bins = (bins, bins)
+        if range is None:
+            range = (None, None)
+        exprs = list(expr)
+    else:
+        bins, range, exprs = [bins], [range], [expr]
+
+    lowhighs = []
+    def lowhigh(i):
+        if len(lowhighs) == 0:
+            found = _reduce(trees(), _MinMax(), exprs, None, cut, entrysteps, entrystart, entrystop, awkward, cache, basketcache, keycache, executor)
+            lowhighs.extend([(0.0, 1.0)] * len(exprs) if found is None else found)
+        return lowhighs[i]
+
+    edges = [_edges(bins[i], range[i], lambda: lowhigh(i)) for i in [0, 1][:len(exprs)]]
+
+    if title is None:
+        title = b" vs ".join(_bytesid(x) if isinstance(x, string_types) else _bytesid(getattr(x, "__name__", "")) for x in exprs[::-1])
+    title = _bytesid(title)
+
+    if len(exprs) == 1:
+        reducer = _Histogram1(edges[0], title)
+    else:
+        reducer = _Histogram2(edges[0], edges[1], title)
+    return reducer.result(_reduce(trees(), reducer, exprs, weight, cut, entrysteps, entrystart, entrystop, awkward, cache, basketcache, keycache, executor))
+
+################################################################ high-level interface
+
+def histogram(path, treepath, expr, bins=10, range=None, weight=None, cut=None, title=None, entrysteps=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, **options):
+    awkward = _normalize_awkwardlib(awkwardlib)
+    def trees():
+        for tree, branchesinterp, globalentrystart, thispath, thisfile in _iterate(path, treepath, [], awkward, localsource, xrootdsource, httpsource, close=True, **options):
+            yield tree
+    return _histogram(trees, expr, bins, range, weight, cut, title, entrysteps, None, None, awkward, cache, basketcache, keycache, executor)
@@ -10,6 +10,8 @@ import os
 import re
 import struct
 import sys
+import threading
+from collections import OrderedDict
 try:
     from urlparse import urlparse
 except ImportError:
@@ -29,20 +31,22 @@ import uproot_methods.classes
 
 ################################################################ high-level interface
 
-def open(path, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, **options):
-    if isinstance(path, getattr(os, "PathLike", ())):
-        path = os.fspath(path)
-    elif hasattr(path, "__fspath__"):
-        path = path.__fspath__()
-    elif path.__class__.__module__ == "pathlib":
-        import pathlib
-        if isinstance(path, pathlib.Path):
-             path = str(path)
+def open(path, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, pool=None, **options):
+    path = _fspath(path)
+    if pool is True:
+        pool = filepool
+    if pool is not None and pool is not False:
+        return pool.open(path, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, **options)
+
+    source = _opensource(path, localsource, xrootdsource, httpsource, options)
+    return ROOTDirectory.read(source, **options)
 
+def _opensource(path, localsource, xrootdsource, httpsource, options):
+    # the Source for a path; options meant for the Source are removed from options
     parsed = urlparse(path)
-    if _bytesid(parsed.scheme) == b"file" or len(parsed.scheme) == 0 or (os.name == "nt" and open._windows_absolute.match(path) is not None):
-        if not (os.name == "nt" and open._windows_absolute.match(path) is not None):
-            path = parsed.netloc + parsed.path
+    localpath = _localpath(path)
+    if localpath is not None:
+        path = localpath
         if isinstance(localsource, dict):
             kwargs = dict(MemmapSource.defaults)
             kwargs.update(localsource)
@@ -52,20 +56,45 @@ def open(path, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defa
             openfcn = lambda path: MemmapSource(path, **kwargs)
         else:
             openfcn = localsource
-        return ROOTDirectory.read(openfcn(path), **options)
+        return openfcn(path)
 
     elif _bytesid(parsed.scheme) == b"root":
-        return xrootd(path, xrootdsource=xrootdsource, **options)
+        return _xrootdsource(path, xrootdsource, options)
 
     elif _bytesid(parsed.scheme) == b"http" or _bytesid(parsed.scheme) == b"https":
-        return http(path, httpsource=httpsource, **options)
+        return _httpsource(path, httpsource, options)
 
     else:
         raise ValueError("URI scheme not recognized: {0}".format(path))
 
 open._windows_absolute = re.compile(r"^[A-Za-z]:\\")
 
+def _fspath(path):
+    if isinstance(path, getattr(os, "PathLike", ())):
+        return os.fspath(path)
+    elif hasattr(path, "__fspath__"):
+        return path.__fspath__()
+    elif path.__class__.__module__ == "pathlib":
+        import pathlib
+        if isinstance(path, pathlib.Path):
+             return str(path)
+    return path
+
+def _localpath(path):
+    # path on the local filesystem, or None for a URL of another scheme
+    parsed = urlparse(path)
+    if os.name == "nt" and open._windows_absolute.match(path) is not None:
+        return path
+    elif _bytesid(parsed.scheme) == b"file" or len(parsed.scheme) == 0:
+        return parsed.netloc + parsed.path
+    else:
+        return None
+
 def xrootd(path, xrootdsource=XRootDSource.defaults, **options):
+    source = _xrootdsource(path, xrootdsource, options)
+    return ROOTDirectory.read(source, **options)
+
+def _xrootdsource(path, xrootdsource, options):
     if isinstance(xrootdsource, dict):
         kwargs = dict(XRootDSource.defaults)
         kwargs.update(xrootdsource)
@@ -75,9 +104,13 @@ def xrootd(path, xrootdsource=XRootDSource.defaults, **options):
         openfcn = lambda path: XRootDSource(path, **kwargs)
     else:
         openfcn = xrootdsource
-    return ROOTDirectory.read(openfcn(path), **options)
+    return openfcn(path)
 
 def http(path, httpsource=HTTPSource.defaults, **options):
+    source = _httpsource(path, httpsource, options)
+    return ROOTDirectory.read(source, **options)
+
+def _httpsource(path, httpsource, options):
     if isinstance(httpsource, dict):
         kwargs = dict(HTTPSource.defaults)
         kwargs.update(httpsource)
@@ -87,7 +120,141 @@ def http(path, httpsource=HTTPSource.defaults, **options):
         openfcn = lambda path: HTTPSource(path, **kwargs)
     else:
         openfcn = httpsource
-    return ROOTDirectory.read(openfcn(path), **options)
+    return openfcn(path)
+
+################################################################ FilePool
+
+class FilePool(object):
+    # makes __doc__ attribute mutable before Python 3.3
+    __metaclass__ = type.__new__(type, "type", (type,), {})
+
+    class _Entry(object):
+        def __init__(self, path, file):
+            self.path = path
+            self.file = file
+            self.refcount = 0
+            self.trees = {}
+
+    def __init__(self, capacity=16):
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()           # least recently used first
+        self.capacity = capacity
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value):
+        if not isinstance(value, (numbers.Integral, numpy.integer)) or isinstance(value, bool) or value < 0:
+            raise ValueError("capacity must be a non-negative number of files")
+        with self._lock:
+            self._capacity = int(value)
+            self._shrink()
+
+    @staticmethod
+    def _hashable(x):
+        if isinstance(x, dict):
+            return tuple(sorted((n, FilePool._hashable(v)) for n, v in x.items()))
+        try:
+            hash(x)
+        except TypeError:
+            return id(x)
+        else:
+            return x
+
+    def _key(self, path, localsource, xrootdsource, httpsource, options):
+        # local files are known by their size and modification time as well as their path, so that a changed file is opened again
+        localpath = _localpath(path)
+        if localpath is None:
+            version = None
+        else:
+            try:
+                stat = os.stat(os.path.expanduser(localpath))
+            except OSError:
+                version = None
+            else:
+                version = (stat.st_size, stat.st_mtime)
+        return (path, version, self._hashable(localsource), self._hashable(xrootdsource), self._hashable(httpsource), self._hashable(options))
+
+    @staticmethod
+    def _close(file):
+        try:
+            file._context.source.close()
+        except Exception:
+            pass    # e.g. a memory map that arrays still point into is left for the garbage collector
+
+    def _shrink(self):
+        # closes files nobody is using, least recently used first, until within capacity (or only files in use are left)
+        if len(self._entries) > self._capacity:
+            for key in [key for key, entry in self._entries.items() if entry.refcount == 0][:len(self._entries) - self._capacity]:
+                self._close(self._entries.pop(key).file)
+
+    def open(self, path, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, **options):
+        path = _fspath(path)
+        key = self._key(path, localsource, xrootdsource, httpsource, options)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                # an earlier version of this file is closed as soon as nobody is using it
+                for otherkey in [otherkey for otherkey, other in self._entries.items() if other.path == path and other.refcount == 0]:
+                    self._close(self._entries.pop(otherkey).file)
+            else:
+                entry.refcount += 1
+                self._entries[key] = entry
+                return entry.file
+
+        # opened outside the lock, so that other files can be used in the meantime
+        file = open(path, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, **options)
+        file._context.pool, file._context.poolkey = self, key
+        file._context.poolargs = dict(options, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource)
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                entry = FilePool._Entry(path, file)
+            else:
+                self._close(file)               # another thread opened it first
+            entry.refcount += 1
+            self._entries[key] = entry
+            self._shrink()
+            return entry.file
+
+    def tree(self, path, treepath, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, **options):
+        file = self.open(path, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, **options)
+        try:
+            with self._lock:
+                trees = self._entries[file._context.poolkey].trees
+                tree = trees.get(treepath, None)
+            if tree is None:
+                tree = file[treepath]
+                with self._lock:
+                    tree = trees.setdefault(treepath, tree)
+        except Exception:
+            self.release(file)
+            raise
+        return tree
+
+    def release(self, obj):
+        with self._lock:
+            entry = self._entries.get(getattr(obj._context, "poolkey", None), None)
+            if entry is not None and entry.refcount > 0:
+                entry.refcount -= 1
+                self._shrink()
+
+    def clear(self):
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry.refcount == 0]:
+                self._close(self._entries.pop(key).file)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, path):
+        with self._lock:
+            return any(entry.path == _fspath(path) for entry in self._entries.values())
+
+filepool = FilePool()
 
 def nofilter(x): return True
 
@@ -195,6 +362,12 @@ class ROOTDirectory(object):
                     nkeys = subcursor.field(source, ROOTDirectory._format5)
                     keys = [TKey.read(source, subcursor, context, None) for i in range(nkeys)]
 
+                    # path of this directory in the file, so that objects can be found again by path
+                    dirpath = getattr(mykey, "_dirpath", None)
+                    dirpath = b"" if dirpath is None else dirpath + mykey._fName + b"/"
+                    for key in keys:
+                        key._dirpath = dirpath
+
                     out = ROOTDirectory(mykey._fName, context, keys)
 
                 out._fVersion, out._fDatimeC, out._fDatimeM, out._fNbytesKeys, out._fNbytesName, out._fSeekDir, out._fSeekParent, out._fSeekKeys = fVersion, fDatimeC, fDatimeM, fNbytesKeys, fNbytesName, fSeekDir, fSeekParent, fSeekKeys
@@ -375,7 +548,11 @@ class ROOTDirectory(object):
                 raise _KeyError("not found: {0} with cycle {1}\n in file: {2}".format(repr(name), cycle, self._context.sourcepath))
 
     def close(self):
-        self._context.source.close()
+        pool = getattr(self._context, "pool", None)
+        if pool is None:
+            self._context.source.close()
+        else:
+            pool.release(self)
 
     def __contains__(self, name):
         try:
@@ -436,11 +613,19 @@ def _bytesid(x):
         else:
             return x
 
+# plain Python ints: mixing numpy scalars into per-object header checks is slow
+_kByteCountMask  = int(uproot.const.kByteCountMask)
+_kByteCountVMask = int(uproot.const.kByteCountVMask)
+_kClassMask      = int(uproot.const.kClassMask)
+_kNewClassTag    = int(uproot.const.kNewClassTag)
+_kIsOnHeap       = int(uproot.const.kIsOnHeap)
+_kIsReferenced   = int(uproot.const.kIsReferenced)
+
 def _startcheck(source, cursor):
     start = cursor.index
     cnt, vers = cursor.fields(source, _startcheck._format_cntvers)
-    if numpy.int64(cnt) & uproot.const.kByteCountMask:
-        cnt = int(numpy.int64(cnt) & ~uproot.const.kByteCountMask)
+    if cnt & _kByteCountMask:
+        cnt = cnt & ~_kByteCountMask
         return start, cnt + 4, vers
     else:
         cursor.index = start
@@ -457,11 +642,11 @@ def _endcheck(start, cursor, cnt):
 
 def _skiptobj(source, cursor):
     version = cursor.field(source, _skiptobj._format1)
-    if numpy.int64(version) & uproot.const.kByteCountVMask:
+    if version & _kByteCountVMask:
         cursor.skip(4)
     fUniqueID, fBits = cursor.fields(source, _skiptobj._format2)
-    fBits = numpy.uint32(fBits) | uproot.const.kIsOnHeap
-    if fBits & uproot.const.kIsReferenced:
+    fBits = fBits | _kIsOnHeap
+    if fBits & _kIsReferenced:
         cursor.skip(2)
 _skiptobj._format1 = struct.Struct(">h")
 _skiptobj._format2 = struct.Struct(">II")
@@ -491,9 +676,9 @@ def _readobjany(source, cursor, context, parent, asclass=None):
     # https://github.com/root-project/root/blob/c4aa801d24d0b1eeb6c1623fd18160ef2397ee54/io/io/src/TBufferFile.cxx#L2404
 
     beg = cursor.index - cursor.origin
-    bcnt = cursor.field(source, struct.Struct(">I"))
+    bcnt = cursor.field(source, _readobjany._format1)
 
-    if numpy.int64(bcnt) & uproot.const.kByteCountMask == 0 or numpy.int64(bcnt) == uproot.const.kNewClassTag:
+    if bcnt & _kByteCountMask == 0 or bcnt == _kNewClassTag:
         vers = 0
         start = 0
         tag = bcnt
@@ -501,9 +686,9 @@ def _readobjany(source, cursor, context, parent, asclass=None):
     else:
         vers = 1
         start = cursor.index - cursor.origin
-        tag = cursor.field(source, struct.Struct(">I"))
+        tag = cursor.field(source, _readobjany._format1)
 
-    if numpy.int64(tag) & uproot.const.kClassMask == 0:
+    if tag & _kClassMask == 0:
         # reference object
         if tag == 0:
             return None                                         # return null
@@ -519,7 +704,7 @@ def _readobjany(source, cursor, context, parent, asclass=None):
         else:
             return cursor.refs[tag]                             # return object
 
-    elif tag == uproot.const.kNewClassTag:
+    elif tag == _kNewClassTag:
         # new class and object
         cname = _safename(cursor.cstring(source))
 
@@ -546,7 +731,7 @@ def _readobjany(source, cursor, context, parent, asclass=None):
 
     else:
         # reference class, new object
-        ref = int(numpy.int64(tag) & ~uproot.const.kClassMask)
+        ref = tag & ~_kClassMask
 
         if asclass is None:
             if ref not in cursor.refs:
@@ -569,6 +754,8 @@ def _readobjany(source, cursor, context, parent, asclass=None):
 
         return obj                                              # return object
 
+_readobjany._format1 = struct.Struct(">I")
+
 def _classof(context, classname):
     if classname == b"TDirectory" or classname == b"TDirectoryFile":
         cls = ROOTDirectory
@@ -720,6 +907,9 @@ def _resolveversion(cls, self, classversion):
         raise ValueError("attempting to read {0} object with version {1}, but there is no streamer in this ROOT file with that class name and version (versions available: {2})".format(cls.__name__, classversion, list(cls._versions.keys())))
     self.__class__ = cls._versions[classversion]
 
+def _isfixedarray(elements, i):
+    return i < len(elements) and isinstance(elements[i], TStreamerBasicType) and elements[i]._fArrayLength != 0 and _ftype2dtype(elements[i]._fType) != "None"
+
 def _defineclasses(streamerinfos, classes):
     skip = dict(builtin_skip)
 
@@ -749,6 +939,7 @@ def _defineclasses(streamerinfos, classes):
             dtypes = {}
             basicnames = []
             basicletters = ""
+            arrayrun = []
             for elementi, element in enumerate(streamerinfo._fElements):
                 if isinstance(element, TStreamerArtificial):
                     code.append("        _raise_notimplemented({0}, {1}, source, cursor)".format(repr(element.__class__.__name__), repr(repr(element.__dict__))))
@@ -802,15 +993,31 @@ def _defineclasses(streamerinfos, classes):
                             basicletters = ""
 
                     else:
-                        dtypename = "_dtype{0}".format(len(dtypes) + 1)
-                        fielddtype = dtypes[dtypename] = _ftype2dtype(element._fType)
-                        code.append("        self._{0} = cursor.array(source, {1}, cls.{2})".format(_safename(element._fName), element._fArrayLength, dtypename))
+                        fielddtype = _ftype2dtype(element._fType)
                         fields.append(_safename(element._fName))
                         if fielddtype == "None":
                             recarray.append("raise ValueError('not a recarray')")
                         else:
                             recarray.append("out.append(({0}, {1}, {2}))".format(repr(str(element._fName.decode("ascii"))), fielddtype, element._fArrayLength))
 
+                        if fielddtype != "None":
+                            arrayrun.append(element)
+
+                        if fielddtype == "None" or not _isfixedarray(streamerinfo._fElements, elementi + 1):
+                            if len(arrayrun) > 1:
+                                # consecutive fixed-size arrays are read as one record and sliced into views
+                                dtypename = "_dtype{0}".format(len(dtypes) + 1)
+                                dtypes[dtypename] = "numpy.dtype([{0}])".format(", ".join("({0}, {1}, {2})".format(repr(str(x._fName.decode("ascii"))), _ftype2dtype(x._fType), x._fArrayLength) for x in arrayrun))
+                                code.append("        record = cursor.array(source, 1, cls.{0})[0]".format(dtypename))
+                                for x in arrayrun:
+                                    code.append("        self._{0} = record[{1}]".format(_safename(x._fName), repr(str(x._fName.decode("ascii")))))
+                            else:
+                                for x in arrayrun + ([element] if fielddtype == "None" else []):
+                                    dtypename = "_dtype{0}".format(len(dtypes) + 1)
+                                    dtypes[dtypename] = _ftype2dtype(x._fType)
+                                    code.append("        self._{0} = cursor.array(source, {1}, cls.{2})".format(_safename(x._fName), x._fArrayLength, dtypename))
+                            arrayrun = []
+
                 elif isinstance(element, TStreamerLoop):
                     code.extend(["        cursor.skip(6)",
                                  "        for index in range(self._{0}):".format(_safename(element._fCountName)),
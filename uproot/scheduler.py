@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import heapq
+import itertools
+import multiprocessing
+import sys
+import threading
+
+try:
+    import concurrent.futures
+    _Executor = concurrent.futures.Executor
+except ImportError:
+    concurrent = None
+    _Executor = object
+
+# One pool of worker threads for every stage of reading. Tasks belong to a stage
+# ("fetch", "decompress", "interpret"), may depend on the results of other tasks,
+# and run in order of priority: tasks opened in an earlier step() come first,
+# whatever their stage, so the earliest entry step finishes before later ones.
+
+class Scheduler(_Executor):
+    stages = ("fetch", "decompress", "interpret")
+
+    def __init__(self, workers=None, limits=None):
+        if concurrent is None:
+            raise ImportError("Install futures package (for Scheduler) with:\n    pip install futures\nor\n    conda install -c conda-forge futures")
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+
+        self.limits = dict((stage, workers) for stage in self.stages)
+        if limits is not None:
+            for stage, limit in limits.items():
+                if stage not in self.limits:
+                    raise ValueError("unrecognized stage {0}; stages are {1}".format(repr(stage), ", ".join(repr(x) for x in self.stages)))
+                if limit < 1:
+                    raise ValueError("limit for stage {0} must be at least 1".format(repr(stage)))
+                self.limits[stage] = limit
+
+        self._condition = threading.Condition()
+        self._ready = dict((stage, []) for stage in self.stages)
+        self._running = dict((stage, 0) for stage in self.stages)
+        self._sequence = itertools.count()
+        self._priorities = itertools.count()
+        self._local = threading.local()
+        self._shutdown = False
+        self._threads = []
+        for i in range(workers):
+            thread = threading.Thread(target=self._work, name="uproot-scheduler-{0}".format(i))
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def __repr__(self):
+        return "<Scheduler with {0} workers, limits {1} at 0x{2:012x}>".format(self.workers, ", ".join("{0}={1}".format(x, self.limits[x]) for x in self.stages), id(self))
+
+    class _Step(object):
+        def __init__(self, scheduler):
+            self.scheduler = scheduler
+
+        def __enter__(self):
+            local = self.scheduler._local
+            self.previous = getattr(local, "priority", None)
+            if self.previous is None:
+                local.priority = next(self.scheduler._priorities)
+            return local.priority
+
+        def __exit__(self, type, value, traceback):
+            self.scheduler._local.priority = self.previous
+
+    def step(self):
+        # everything scheduled inside a (possibly nested) step shares one priority
+        return self._Step(self)
+
+    def _priority(self):
+        out = getattr(self._local, "priority", None)
+        if out is None:
+            out = next(self._priorities)
+        return out
+
+    def schedule(self, stage, fn, args=(), after=(), priority=None):
+        # fn(*(args + results of after)) runs once every future in after has succeeded
+        if stage not in self._ready:
+            raise ValueError("unrecognized stage {0}; stages are {1}".format(repr(stage), ", ".join(repr(x) for x in self.stages)))
+        if priority is None:
+            priority = self._priority()
+
+        future = concurrent.futures.Future()
+        task = [priority, next(self._sequence), stage, fn, tuple(args), list(after), future, len(after)]
+
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new tasks after shutdown")
+            if len(after) == 0:
+                self._push(task)
+
+        for dependency in after:
+            dependency.add_done_callback(lambda dependency: self._resolved(task))
+        return future
+
+    def _push(self, task):
+        heapq.heappush(self._ready[task[2]], task)
+        self._condition.notify()
+
+    def _resolved(self, task):
+        with self._condition:
+            task[7] -= 1
+            if task[7] == 0:
+                self._push(task)
+
+    def submit(self, fn, *args, **kwargs):
+        if len(kwargs) == 0:
+            return self.schedule("fetch", fn, args)
+        else:
+            return self.schedule("fetch", lambda *args: fn(*args, **kwargs), args)
+
+    def map(self, fn, *iterables, **kwargs):
+        # same as Executor.map, but all tasks of one call share a priority; each task calls fn on chunksize items
+        timeout = kwargs.pop("timeout", None)
+        chunksize = kwargs.pop("chunksize", 1)
+        if len(kwargs) > 0:
+            raise TypeError("unrecognized options: {0}".format(", ".join(kwargs)))
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1")
+        items = list(zip(*iterables))
+        with self.step():
+            futures = [self.submit(_mapchunk, fn, items[i : i + chunksize]) for i in range(0, len(items), chunksize)]
+        def results():
+            for future in futures:
+                for out in future.result(timeout):
+                    yield out
+        return results()
+
+    def shutdown(self, wait=True):
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _next(self):
+        best = None
+        for stage in self.stages:
+            ready = self._ready[stage]
+            if len(ready) > 0 and self._running[stage] < self.limits[stage]:
+                if best is None or ready[0] < self._ready[best][0]:
+                    best = stage
+        if best is None:
+            return None
+        return heapq.heappop(self._ready[best])
+
+    def _work(self):
+        while True:
+            with self._condition:
+                task = self._next()
+                while task is None:
+                    if self._shutdown and all(len(x) == 0 for x in self._ready.values()):
+                        return
+                    self._condition.wait()
+                    task = self._next()
+                self._running[task[2]] += 1
+
+            priority, sequence, stage, fn, args, after, future, numwaiting = task
+            if future.set_running_or_notify_cancel():
+                failed = [x for x in after if x.cancelled() or x.exception() is not None]
+                if len(failed) > 0:
+                    if failed[0].cancelled():
+                        future.set_exception(concurrent.futures.CancelledError())
+                    else:
+                        future.set_exception(failed[0].exception())
+                else:
+                    try:
+                        out = fn(*(args + tuple(x.result() for x in after)))
+                    except BaseException:
+                        future.set_exception(sys.exc_info()[1])
+                    else:
+                        future.set_result(out)
+            del task, fn, args, after, future
+
+            with self._condition:
+                self._running[stage] -= 1
+                self._condition.notify_all()
+
+def _mapchunk(fn, chunk):
+    return [fn(*args) for args in chunk]
+
+class _NoStep(object):
+    def __enter__(self):
+        return None
+
+    def __exit__(self, type, value, traceback):
+        pass
+
+def step(executor):
+    # groups everything scheduled on a Scheduler into one priority; does nothing for other executors
+    if isinstance(executor, Scheduler):
+        return executor.step()
+    else:
+        return _NoStep()
@@ -57,7 +57,11 @@ class ChunkedSource(uproot.source.source.Source):
             self._futures = {}
 
     def _setup_futures(self, parallel):
-        if parallel is not None and parallel > 1:
+        if hasattr(parallel, "submit"):
+            # a shared executor, such as uproot.Scheduler, instead of a pool per source
+            self._executor = parallel
+            self._futures = {}
+        elif parallel is not None and parallel > 1:
             try:
                 import concurrent.futures
             except ImportError:
@@ -109,7 +113,8 @@ class ChunkedSource(uproot.source.source.Source):
             chunk = None
             if self._futures is not None:
                 future = self._futures.pop(chunkindex, None)
-                if future is not None:
+                if future is not None and not future.cancel():
+                    # still queued: read it here rather than wait behind other tasks
                     chunk = future.result()
 
             if chunk is None:
@@ -75,14 +75,32 @@ class Cursor(object):
         return _tobytes(source.data(start, stop))
 
     def cstring(self, source):
-        char = None
+        # scan ahead in blocks for the null terminator, falling back to single bytes near the end of the source
         chars = []
-        while char != 0:
-            char = source.data(self.index, self.index + 1)
-            if char != 0:
-                chars.append(chr(char[0]).encode("ascii"))
-            self.index += 1
-        return b"".join(chars)
+        start = self.index
+        step = self._cstringblock
+        while True:
+            try:
+                data = _tobytes(source.data(start, start + step))
+            except IndexError:
+                if step == 1:
+                    raise
+                step = 1
+                continue
+
+            end = data.find(b"\x00")
+            if end >= 0:
+                chars.append(data[:end])
+                self.index = start + end + 1
+                return b"".join(chars)
+
+            chars.append(data)
+            start += len(data)
+            if len(data) < step:
+                self.index = start + 1
+                return b"".join(chars)
+
+    _cstringblock = 64
 
     def skipstring(self, source):
         length = source.data(self.index, self.index + 1)[0]
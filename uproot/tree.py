@@ -4,19 +4,26 @@
 
 from __future__ import absolute_import
 
+import ast
 import base64
 import codecs
 import glob
 import importlib
 import inspect
+import io
 import itertools
+import json
 import math
 import numbers
 import os
+import pickle
 import re
 import struct
 import sys
 import threading
+import types
+import zlib
+from collections import deque
 from collections import namedtuple
 from collections import OrderedDict
 try:
@@ -35,11 +42,15 @@ from uproot.rootio import _bytesid
 from uproot.rootio import _memsize
 from uproot.rootio import nofilter
 from uproot.rootio import _safename
+from uproot.cache import MemoryBudget
 from uproot.interp.auto import interpret
 from uproot.interp.numerical import asdtype
 from uproot.interp.jagged import asjagged
 from uproot.interp.objects import asobj
 from uproot.interp.objects import asgenobj
+from uproot.scheduler import Scheduler
+from uproot.scheduler import step as _schedulerstep
+from uproot._expr import expression as _expression
 from uproot.source.cursor import Cursor
 from uproot.source.memmap import MemmapSource
 from uproot.source.xrootd import XRootDSource
@@ -84,6 +95,14 @@ def _filename_explode(x):
 
 _filename_explode._windows_absolute = re.compile(r"^[A-Za-z]:\\")
 
+def _paths(path):
+    if isinstance(path, Manifest):
+        return path.paths
+    elif isinstance(path, string_types):
+        return _filename_explode(path)
+    else:
+        return [y for x in path for y in _filename_explode(x)]
+
 def _normalize_awkwardlib(awkwardlib):
     if awkwardlib is None:
         return awkward
@@ -92,6 +111,221 @@ def _normalize_awkwardlib(awkwardlib):
     else:
         return awkwardlib
 
+def _normalize_max_memory(max_memory):
+    if max_memory is None or isinstance(max_memory, MemoryBudget):
+        return max_memory
+    else:
+        return MemoryBudget(max_memory)
+
+class _BasketBytes(object):
+    # cumulative uncompressed bytes of each branch's baskets as a function of entry number, exact at
+    # basket boundaries and linear within baskets; read once, then looked up for any entry range
+    def __init__(self, branches, keycache):
+        self.curves = []
+        for branch, interpretation in branches:
+            if branch._recoveredbaskets is None:
+                branch._tryrecover()
+            sizes = numpy.array([key._fObjlen for key in branch._threadsafe_iterate_keys(keycache, False)], dtype=numpy.float64)
+            offsets = numpy.array(branch._entryoffsets[: len(sizes) + 1], dtype=numpy.float64)
+            cumulative = numpy.zeros(len(offsets), dtype=numpy.float64)
+            numpy.cumsum(sizes, out=cumulative[1:])
+            self.curves.append((offsets, cumulative))
+
+    def __call__(self, entrystart, entrystop, overlapping=0.0):
+        # bytes in an entry range, prorated within baskets, plus overlapping times the full size of every basket
+        # it touches (overlapping=1 is the expected peak of reading it: baskets decompressed plus destination arrays)
+        out = 0.0
+        if entrystart >= entrystop:
+            return out
+        for offsets, cumulative in self.curves:
+            out += float(numpy.interp(entrystop, offsets, cumulative) - numpy.interp(entrystart, offsets, cumulative))
+            if overlapping != 0:
+                first = max(numpy.searchsorted(offsets, entrystart, side="right") - 1, 0)
+                last = min(numpy.searchsorted(offsets, entrystop, side="left"), len(offsets) - 1)
+                if last > first:
+                    out += overlapping * float(cumulative[last] - cumulative[first])
+        return out
+
+def _mempartitions(branches, numbytes, entrystart, entrystop, keycache, alignments):
+    # steps end where the total of the branches' _BasketBytes curves crosses each multiple of numbytes,
+    # moved to the nearest boundary in alignments (most preferred first) if that is within numbytes/4
+    curves = _BasketBytes(branches, keycache).curves
+    edges = [numpy.array([entrystart, entrystop], dtype=numpy.float64)] + [offsets for offsets, cumulative in curves]
+
+    points = numpy.unique(numpy.concatenate(edges))
+    points = points[(entrystart <= points) & (points <= entrystop)]
+    total = numpy.zeros(len(points), dtype=numpy.float64)
+    for offsets, cumulative in curves:
+        total += numpy.interp(points, offsets, cumulative)
+    total -= total[0]
+
+    aligned = []
+    for boundaries in alignments:
+        boundaries = numpy.unique(numpy.asarray(boundaries, dtype=numpy.float64))
+        boundaries = boundaries[(entrystart < boundaries) & (boundaries < entrystop)]
+        aligned.append((boundaries, numpy.interp(boundaries, points, total)))
+
+    start = entrystart
+    target = numbytes
+    while target < total[-1]:
+        stop = None
+        for boundaries, reached in aligned:
+            index = numpy.searchsorted(reached, target)
+            nearby = [i for i in (index - 1, index) if 0 <= i < len(boundaries) and boundaries[i] > start]
+            if len(nearby) > 0:
+                i = min(nearby, key=lambda i: abs(reached[i] - target))
+                if abs(reached[i] - target) <= numbytes / 4.0:
+                    stop = int(boundaries[i])
+                    break
+        if stop is None:
+            stop = max(start + 1, int(round(numpy.interp(target, total, points))))
+        if stop >= entrystop:
+            break
+        yield start, stop
+        start = stop
+        target = numbytes * (math.floor(numpy.interp(stop, points, total) / numbytes + 0.5) + 1)
+
+    if start < entrystop:
+        yield start, entrystop
+
+def _exprfunction(expr, tree, what="cut"):
+    # (names of the branches in an expression, function from their arrays, in that order, to its value)
+    if isinstance(expr, string_types) and expr in tree:
+        names = [expr]
+        function = lambda array: array
+
+    elif isinstance(expr, string_types):
+        names, function = _expression(expr, tree, what)
+
+    elif callable(expr):
+        if hasattr(inspect, "getfullargspec"):
+            names = inspect.getfullargspec(expr).args
+        else:
+            names = inspect.getargspec(expr).args
+        if inspect.ismethod(expr):
+            names = names[1:]
+        for name in names:
+            if name not in tree:
+                raise ValueError("{0} argument {1} is not a branch".format(what, repr(name)))
+        function = expr
+
+    else:
+        raise TypeError("{0} must be a callable whose arguments are branch names or a string expression of branch names".format(what))
+
+    if len(names) == 0:
+        raise ValueError("{0} must depend on at least one branch".format(what))
+    return [tree.get(name).name for name in names], function
+
+def _selectentries(interpretation, array, selection, flatten):
+    # array[selection] with contiguous jagged structure, as though it had been read directly
+    out = array[selection]
+    if isinstance(interpretation, asjagged):
+        out = out.compact()
+        if flatten:
+            return out.content
+    return out
+
+_cutcomparisons = {ast.Eq: ("==", "=="), ast.Lt: ("<", ">"), ast.LtE: ("<=", ">="), ast.Gt: (">", "<"), ast.GtE: (">=", "<=")}
+
+def _cutconstant(node):
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        out = _cutconstant(node.operand)
+        return None if out is None else -out
+    value = getattr(node, "value", getattr(node, "n", None)) if type(node).__name__ in ("Constant", "Num") else None
+    return value if isinstance(value, (numbers.Real, numpy.number)) else None
+
+def _cutconjuncts(node):
+    # (name, op, value) comparisons of a branch with a number that an entry must satisfy (for at least one item, if jagged) to pass
+    if isinstance(node, ast.Expression):
+        return _cutconjuncts(node.body)
+    elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitAnd):
+        return _cutconjuncts(node.left) + _cutconjuncts(node.right)
+    elif isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And):
+        return [x for value in node.values for x in _cutconjuncts(value)]
+    elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "any" and len(node.args) == 0 and len(node.keywords) == 0:
+        return _cutconjuncts(node.func.value)
+    elif isinstance(node, ast.Compare):
+        out = []
+        operands = [node.left] + node.comparators
+        for left, op, right in zip(operands[:-1], node.ops, operands[1:]):
+            if type(op) in _cutcomparisons:
+                if isinstance(left, ast.Name) and _cutconstant(right) is not None:
+                    out.append((left.id, _cutcomparisons[type(op)][0], _cutconstant(right)))
+                elif isinstance(right, ast.Name) and _cutconstant(left) is not None:
+                    out.append((right.id, _cutcomparisons[type(op)][1], _cutconstant(left)))
+        return out
+    else:
+        return []
+
+def _inintervals(x, starts, stops):
+    # whether each x is in one of the sorted, disjoint [start, stop) intervals
+    index = numpy.searchsorted(starts, x, side="right") - 1
+    if len(starts) == 0:
+        return numpy.zeros(len(x), dtype=numpy.bool_)
+    return (index >= 0) & (x < stops[numpy.maximum(index, 0)])
+
+def _runintervals(mask, edges):
+    # [start, stop) intervals of edges spanned by runs of True in mask (len(edges) == len(mask) + 1)
+    steps = numpy.diff(numpy.concatenate([[0], mask.astype(numpy.int8), [0]]))
+    return edges[numpy.nonzero(steps == 1)[0]], edges[numpy.nonzero(steps == -1)[0]]
+
+def _cutzones(cut, tree, zonemap, entrystart, entrystop, awkward):
+    # entry intervals outside of which no entry can pass a string cut, according to zonemap; None if that rules nothing out
+    if not isinstance(cut, string_types):
+        return None
+    starts = numpy.array([entrystart], dtype=numpy.int64)
+    stops = numpy.array([entrystop], dtype=numpy.int64)
+    for name, op, value in _cutconjuncts(ast.parse(cut, mode="eval")):
+        if name not in tree:
+            continue
+        branch = tree.get(name)
+        possible = zonemap.select(branch, branch._normalize_interpretation(None, awkward), op, value)
+        if possible is None:
+            continue
+        branchstarts, branchstops = _runintervals(possible, branch._entryoffsetsarray())
+        edges = numpy.unique(numpy.concatenate([starts, stops, branchstarts, branchstops]))
+        keep = _inintervals(edges[:-1], starts, stops) & _inintervals(edges[:-1], branchstarts, branchstops)
+        starts, stops = _runintervals(keep, edges)
+    if len(starts) == 1 and starts[0] == entrystart and stops[0] == entrystop:
+        return None
+    return starts, stops
+
+class _DeferredStep(object):
+    # output of a step from iterate(blocking=False, max_memory=...), which holds the step's
+    # reservation in max_memory until it is first called; later calls return the same output
+    def __init__(self, function, max_memory, numbytes):
+        self.function = function
+        self.max_memory = max_memory
+        self.numbytes = numbytes
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            if self.function is not None:
+                try:
+                    self.out = self.function()
+                    self.function = None
+                finally:
+                    if self.numbytes is not None:
+                        self.max_memory.release(self.numbytes)
+                        self.numbytes = None
+            return self.out
+
+class _budgeted(object):
+    # holds a read's expected peak in max_memory (if any) while it runs
+    def __init__(self, max_memory, branches, entrystart, entrystop, keycache):
+        self.max_memory = max_memory
+        if max_memory is not None:
+            self.numbytes = _BasketBytes(branches, keycache)(entrystart, entrystop, 1.0)
+
+    def __enter__(self):
+        if self.max_memory is not None:
+            self.numbytes = self.max_memory.acquire(self.numbytes)
+
+    def __exit__(self, type, value, traceback):
+        if self.max_memory is not None:
+            self.max_memory.release(self.numbytes)
+
 def _normalize_entrystartstop(numentries, entrystart, entrystop):
     if entrystart is None:
         entrystart = 0
@@ -110,68 +344,351 @@ def _normalize_entrystartstop(numentries, entrystart, entrystop):
 
     return int(entrystart), int(entrystop)
 
+def _normalize_entries(numentries, entries, entrystart, entrystop):
+    # sorted int64 entry numbers within [entrystart, entrystop) from a boolean mask over all entries or sorted entry numbers
+    entries = numpy.asarray(entries)
+    if len(entries.shape) != 1:
+        raise ValueError("entries must be a one-dimensional array")
+    if entries.dtype == numpy.bool_:
+        if len(entries) != numentries:
+            raise ValueError("entries as a boolean mask must have one value per entry ({0}), not {1}".format(numentries, len(entries)))
+        entries = numpy.nonzero(entries)[0].astype(numpy.int64)
+    elif len(entries) == 0 or issubclass(entries.dtype.type, numpy.integer):
+        entries = entries.astype(numpy.int64)
+        if len(entries) > 0 and (entries[0] < 0 or entries[-1] >= numentries):
+            raise IndexError("entries must be between 0 and the number of entries ({0})".format(numentries))
+        if (entries[1:] < entries[:-1]).any():
+            raise ValueError("entries must be sorted")
+    else:
+        raise TypeError("entries must be an array of integer entry numbers or a boolean mask")
+    start, stop = numpy.searchsorted(entries, [entrystart, entrystop])
+    return entries[start:stop]
+
 ################################################################ high-level interface
 
-def iterate(path, treepath, branches=None, entrysteps=float("inf"), outputtype=dict, namedecode=None, reportpath=False, reportfile=False, reportentries=False, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, **options):
+def iterate(path, treepath, branches=None, entrysteps=float("inf"), outputtype=dict, namedecode=None, reportpath=False, reportfile=False, reportentries=False, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, prefetch=0, prefetchbytes=None, max_memory=None, cut=None, zonemap=None, processes=None, ordered=True, prefetchfiles=0, acrossfiles=False, **options):
     awkward = _normalize_awkwardlib(awkwardlib)
-    for tree, branchesinterp, globalentrystart, thispath, thisfile in _iterate(path, treepath, branches, awkward, localsource, xrootdsource, httpsource, **options):
-        for start, stop, arrays in tree.iterate(branches=branchesinterp, entrysteps=entrysteps, outputtype=outputtype, namedecode=namedecode, reportentries=True, entrystart=0, entrystop=tree.numentries, flatten=flatten, flatname=flatname, awkwardlib=awkward, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=blocking):
+    max_memory = _normalize_max_memory(max_memory)
 
-            if getattr(outputtype, "__name__", None) == "DataFrame" and getattr(outputtype, "__module__", None) == "pandas.core.frame":
-                if type(arrays.index).__name__ == "MultiIndex":
-                    if hasattr(arrays.index.levels[0], "array"):
-                        index = arrays.index.levels[0].array   # pandas>=0.24.0
-                    else:
-                        index = arrays.index.levels[0].values  # pandas<0.24.0
-                    awkward.numpy.add(index, globalentrystart, out=index)
+    if prefetchfiles < 0:
+        raise ValueError("prefetchfiles must be a non-negative number of files")
+    if prefetchfiles > 0 and executor is None:
+        raise ValueError("prefetchfiles requires an executor to open files on")
 
-                elif type(arrays.index).__name__ == "RangeIndex":
-                    if hasattr(arrays.index, "start") and hasattr(arrays.index, "stop"):
-                        indexstart = arrays.index.start        # pandas>=0.25.0
-                        indexstop = arrays.index.stop
-                    else:
-                        indexstart = arrays.index._start       # pandas<0.25.0
-                        indexstop = arrays.index._stop
-                    arrays.index = type(arrays.index)(indexstart + globalentrystart, indexstop + globalentrystart)
+    if acrossfiles and processes is not None:
+        raise ValueError("acrossfiles can't be used with processes")
 
-                else:
-                    if hasattr(arrays.index, "array"):
-                        index = arrays.index.array             # pandas>=0.24.0
-                    else:
-                        index = arrays.index.values            # pandas<0.24.0
-                    awkward.numpy.add(index, globalentrystart, out=index)
+    if acrossfiles:
+        steps = lambda: _acrossfiles(path, treepath, branches, entrysteps, outputtype, namedecode, flatten, flatname, awkward, cache, basketcache, keycache, executor, blocking, localsource, xrootdsource, httpsource, prefetch, prefetchbytes, max_memory, cut, zonemap, prefetchfiles, reportfile, options)
 
-            out = (arrays,)
-            if reportentries:
-                out = (globalentrystart + start, globalentrystart + stop) + out
-            if reportfile:
-                out = (thisfile,) + out
-            if reportpath:
-                out = (thispath,) + out
-            if len(out) == 1:
-                yield out[0]
+    elif processes is None:
+        def steps():
+            # files are closed when their last step has been used, unless the caller gets them or evaluates steps later
+            warm = lambda tree, branchesinterp: _warmfirststep(tree, branchesinterp, entrysteps, awkward, basketcache, keycache)
+            for tree, branchesinterp, globalentrystart, thispath, thisfile in _iterate(path, treepath, branches, awkward, localsource, xrootdsource, httpsource, prefetchfiles=prefetchfiles, executor=executor, warm=(warm if prefetchfiles > 0 else None), close=(blocking and not reportfile), **options):
+                for start, stop, arrays in tree.iterate(branches=branchesinterp, entrysteps=entrysteps, outputtype=outputtype, namedecode=namedecode, reportentries=True, entrystart=0, entrystop=tree.numentries, flatten=flatten, flatname=flatname, awkwardlib=awkward, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=blocking, prefetch=prefetch, prefetchbytes=prefetchbytes, max_memory=max_memory, cut=cut, zonemap=zonemap):
+                    yield globalentrystart, thispath, thisfile, start, stop, arrays
+                    del arrays
+
+    else:
+        # one pool of worker processes reads the steps of all files
+        steps = lambda: _processiterate(path, treepath, branches, entrysteps, outputtype, namedecode, flatten, flatname, awkward, keycache, executor, blocking, localsource, xrootdsource, httpsource, prefetch, cut, zonemap, processes, ordered, options)
+
+    ispandas = getattr(outputtype, "__name__", None) == "DataFrame" and getattr(outputtype, "__module__", None) == "pandas.core.frame"
+    for globalentrystart, thispath, thisfile, start, stop, arrays in steps():
+        if ispandas and globalentrystart != 0:
+            arrays = _shiftindex(arrays, globalentrystart, awkward)
+
+        out = (arrays,)
+        if reportentries:
+            out = (globalentrystart + start, globalentrystart + stop) + out
+        if reportfile:
+            out = (thisfile,) + out
+        if reportpath:
+            out = (thispath,) + out
+        if len(out) == 1:
+            yield out[0]
+        else:
+            yield out
+        # don't hold the last step while the next one is read
+        del arrays, out
+
+def _shiftindex(arrays, globalentrystart, awkward):
+    # a DataFrame's index from entry numbers in its file to entry numbers in all files
+    if type(arrays.index).__name__ == "MultiIndex":
+        if hasattr(arrays.index.levels[0], "array"):
+            index = arrays.index.levels[0].array   # pandas>=0.24.0
+        else:
+            index = arrays.index.levels[0].values  # pandas<0.24.0
+        awkward.numpy.add(index, globalentrystart, out=index)
+
+    elif type(arrays.index).__name__ == "RangeIndex":
+        if hasattr(arrays.index, "start") and hasattr(arrays.index, "stop"):
+            indexstart = arrays.index.start        # pandas>=0.25.0
+            indexstop = arrays.index.stop
+        else:
+            indexstart = arrays.index._start       # pandas<0.25.0
+            indexstop = arrays.index._stop
+        arrays.index = type(arrays.index)(indexstart + globalentrystart, indexstop + globalentrystart)
+
+    else:
+        if hasattr(arrays.index, "array"):
+            index = arrays.index.array             # pandas>=0.24.0
+        else:
+            index = arrays.index.values            # pandas<0.24.0
+        awkward.numpy.add(index, globalentrystart, out=index)
+    return arrays
+
+def _acrossfiles(path, treepath, branches, entrysteps, outputtype, namedecode, flatten, flatname, awkward, cache, basketcache, keycache, executor, blocking, localsource, xrootdsource, httpsource, prefetch, prefetchbytes, max_memory, cut, zonemap, prefetchfiles, reportfile, options):
+    # steps of a uniform number of entries (or bytes) that continue from one file into the next;
+    # each file is read in pieces that end at step boundaries, and the pieces of a step are stitched
+    numbytes = _memsize(entrysteps)
+    if numbytes is not None:
+        target = float(numbytes)
+    elif isinstance(entrysteps, (numbers.Integral, numpy.integer)) or (isinstance(entrysteps, float) and entrysteps == float("inf")):
+        target = float(entrysteps)
+    else:
+        raise ValueError("acrossfiles requires entrysteps to be a number of entries, a memory size string (number followed by B/kB/MB/GB/etc.), or inf")
+    if target <= 0:
+        raise ValueError("entrysteps must be positive")
+
+    ispandas = getattr(outputtype, "__name__", None) == "DataFrame" and getattr(outputtype, "__module__", None) == "pandas.core.frame"
+    pieces = []     # (globalentrystart, path, file, branches, arrays or function) of the step being filled
+    filled = 0.0    # entries (or bytes) in it so far
+
+    def step(stepstart):
+        first, last = pieces[0], pieces[-1]
+        stitch = lambda pieces: _stitch(pieces, outputtype, ispandas, namedecode, awkward)
+        if blocking:
+            out = stitch(pieces)
+        else:
+            out = lambda pieces=list(pieces): stitch([x[:4] + (x[4](),) for x in pieces])
+        return 0, first[1], first[2], stepstart, last[0], out
+
+    stepstart = 0
+    for tree, branchesinterp, globalentrystart, thispath, thisfile in _iterate(path, treepath, branches, awkward, localsource, xrootdsource, httpsource, prefetchfiles=prefetchfiles, executor=executor, close=(blocking and not reportfile), **options):
+        numentries = tree.numentries
+        if numentries == 0:
+            continue
+        treebranches = list(tree._normalize_branches(branchesinterp, awkward))
+        if numbytes is None:
+            perentry = 1.0
+        else:
+            perentry = path._bytesperentry(thispath, [branch.name for branch, interpretation in treebranches]) if isinstance(path, Manifest) else None
+            if perentry is None:
+                perentry = tree._numbytes(treebranches, 0, numentries, keycache) / numentries
+
+        # this file's pieces and whether each one completes a step
+        bounds, complete = [], []
+        start = 0
+        while start < numentries:
+            room = target - filled
+            if room >= (numentries - start) * perentry:
+                stop = numentries
             else:
-                yield out
+                stop = start + max(1, int(math.ceil(room / perentry)))
+            filled += (stop - start) * perentry
+            bounds.append((start, stop))
+            complete.append(filled >= target)
+            if filled >= target:
+                filled = 0.0
+            start = stop
 
-def _iterate(path, treepath, branches, awkward, localsource, xrootdsource, httpsource, **options):
-    if isinstance(path, string_types):
-        paths = _filename_explode(path)
+        for (start, stop, arrays), done in zip(tree.iterate(branches=branchesinterp, entrysteps=bounds, outputtype=(outputtype if ispandas else tuple), namedecode=namedecode, reportentries=True, entrystart=0, entrystop=numentries, flatten=flatten, flatname=flatname, awkwardlib=awkward, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=blocking, prefetch=prefetch, prefetchbytes=prefetchbytes, max_memory=max_memory, cut=cut, zonemap=zonemap), complete):
+            if ispandas and globalentrystart != 0:
+                if blocking:
+                    arrays = _shiftindex(arrays, globalentrystart, awkward)
+                else:
+                    arrays = lambda arrays=arrays, globalentrystart=globalentrystart: _shiftindex(arrays(), globalentrystart, awkward)
+            pieces.append((globalentrystart + stop, thispath, thisfile, treebranches, arrays))
+            del arrays
+            if done:
+                yield step(stepstart)
+                stepstart = pieces[-1][0]
+                del pieces[:]
+
+    if len(pieces) > 0:
+        yield step(stepstart)
+
+def _stitch(pieces, outputtype, ispandas, namedecode, awkward):
+    # the pieces of one step, read from consecutive files, as one outputtype
+    if ispandas:
+        if len(pieces) == 1:
+            return pieces[0][4]
+        import pandas
+        return pandas.concat([x[4] for x in pieces])
+
+    branches = pieces[0][3]
+    names = [branch.name for branch, interpretation in branches]
+    for x in pieces[1:]:
+        if [branch.name for branch, interpretation in x[3]] != names:
+            raise ValueError("can't stitch a step from files whose selected branches differ:\n\n    {0}\n\nand\n\n    {1}\n\nin file: {2}".format(names, [branch.name for branch, interpretation in x[3]], x[1]))
+    arrays = [_concatenate([x[4][i] for x in pieces], awkward) for i in range(len(names))]
+    return _wrapoutput(_namedtuple(branches, namedecode) if outputtype == namedtuple else outputtype, namedecode, branches, arrays)
+
+def _concatenate(arrays, awkward):
+    # a single piece is returned as-is, without a copy
+    if len(arrays) == 1:
+        return arrays[0]
+    elif all(isinstance(x, numpy.ndarray) for x in arrays):
+        return numpy.concatenate(arrays)
+    elif all(type(x) is awkward.ObjectArray and isinstance(x.content, numpy.ndarray) for x in arrays):
+        # objects from fixed-size records, such as TLorentzVectors
+        return awkward.ObjectArray(numpy.concatenate([x.content for x in arrays]), arrays[0].generator, *arrays[0].args, **arrays[0].kwargs)
     else:
-        paths = [y for x in path for y in _filename_explode(x)]
+        return awkward.concatenate(arrays)
+
+def _processiterate(path, treepath, branches, entrysteps, outputtype, namedecode, flatten, flatname, awkward, keycache, executor, blocking, localsource, xrootdsource, httpsource, prefetch, cut, zonemap, processes, ordered, options):
+    import uproot._processes
+    if executor is not None:
+        raise ValueError("processes and executor can't be used together: worker processes read and decompress their own baskets")
+    ispandas = getattr(outputtype, "__name__", None) == "DataFrame" and getattr(outputtype, "__module__", None) == "pandas.core.frame"
+    kwargs = {"outputtype": (outputtype if ispandas else tuple), "namedecode": namedecode, "flatten": flatten, "flatname": flatname, "awkwardlib": awkward.__name__, "cut": cut, "zonemap": zonemap}
+
+    def jobs():
+        for tree, branchesinterp, globalentrystart, thispath, thisfile in _iterate(path, treepath, branches, awkward, localsource, xrootdsource, httpsource, close=True, **options):
+            treebranches = list(tree._normalize_branches(branchesinterp, awkward))
+            steps = [(start, stop) for start, stop in tree._normalize_entrysteps(entrysteps, branchesinterp, 0, tree.numentries, {} if keycache is None else keycache) if start <= stop]
+            thisoutputtype = _namedtuple(treebranches, namedecode) if outputtype == namedtuple else outputtype
+            yield uproot._processes._Job(tree, thispath, treepath, (localsource, xrootdsource, httpsource), options, treebranches, steps, kwargs, (globalentrystart, thispath, thisfile, thisoutputtype))
+
+    for job, start, stop, out in uproot._processes.iterate(processes, jobs(), ordered, prefetch):
+        globalentrystart, thispath, thisfile, thisoutputtype = job.tag
+        out = out if ispandas else _wrapoutput(thisoutputtype, namedecode, job.branches, out)
+        yield globalentrystart, thispath, thisfile, start, stop, (out if blocking else lambda out=out: out)
+        del out
+
+def _namedtuple(branches, namedecode):
+    return namedtuple("Arrays", [codecs.ascii_decode(branch.name, "replace")[0] if namedecode is None else branch.name.decode(namedecode) for branch, interpretation in branches])
+
+def _wrapoutput(outputtype, namedecode, branches, arrays):
+    # the arrays of one step read by a worker process, in the order of branches, as an outputtype of iterate
+    if isinstance(outputtype, type) and issubclass(outputtype, tuple) and hasattr(outputtype, "_fields"):
+        return outputtype(*arrays)
+    elif isinstance(outputtype, type) and issubclass(outputtype, dict):
+        return outputtype((branch.name if namedecode is None else branch.name.decode(namedecode), array) for (branch, interpretation), array in zip(branches, arrays))
+    elif isinstance(outputtype, type) and issubclass(outputtype, (list, tuple)):
+        return outputtype(arrays)
+    else:
+        return outputtype(*arrays)
 
-    globalentrystart = 0
-    for path in paths:
+def _opentree(path, treepath, branches, awkward, localsource, xrootdsource, httpsource, warm, pooled, options):
+    # (tree, branchesinterp, file), or None if the file has no treepath; a tree from the process-wide pool has no file
+    if pooled:
+        try:
+            tree = uproot.rootio.filepool.tree(path, treepath, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, **options)
+        except KeyError:
+            return None
+        file = None
+    else:
         file = uproot.rootio.open(path, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, **options)
         try:
             tree = file[treepath]
         except KeyError:
-            continue
-        branchesinterp = OrderedDict()
-        for branch, interpretation in tree._normalize_branches(branches, awkward):
-            branchesinterp[branch.name] = interpretation
+            _closefile(file)
+            return None
+    branchesinterp = OrderedDict()
+    for branch, interpretation in tree._normalize_branches(branches, awkward):
+        branchesinterp[branch.name] = interpretation
+    if warm is not None:
+        warm(tree, branchesinterp)
+    return tree, branchesinterp, file
+
+def _closefile(file):
+    try:
+        file.close()
+    except Exception:
+        pass    # e.g. a memory map that arrays still point into is left for the garbage collector
+
+def _stalekey(key):
+    # a cached TKey that reads from a file that has since been closed (and perhaps opened again)
+    source = getattr(key, "source", None)
+    while source is not None and source.parent() is not None and source.parent() is not source:
+        source = source.parent()
+    return getattr(source, "closed", False)
+
+def _closetree(opened):
+    tree, branchesinterp, file = opened
+    if file is None:
+        uproot.rootio.filepool.release(tree)
+    else:
+        _closefile(file)
+
+def _warmfirststep(tree, branchesinterp, entrysteps, awkward, basketcache, keycache):
+    # reads the baskets of the first step of a file that is opened ahead of time: decompressed into
+    # basketcache if there is one, otherwise as raw bytes, which remote sources keep in their chunk cache
+    branches = list(tree._normalize_branches(branchesinterp, awkward))
+    for start, stop in tree._normalize_entrysteps(entrysteps, branchesinterp, 0, tree.numentries, keycache):
+        break
+    else:
+        return
+    try:
+        for branch, interpretation in branches:
+            basketstart, basketstop = branch._basketstartstop(start, stop)
+            if basketstart is None:
+                continue
+            for i in range(basketstart, basketstop):
+                key = branch._threadsafe_key(i, keycache, True)
+                if basketcache is None:
+                    key.basketfetch()
+                else:
+                    basketcache[branch._basketcachekey(i)] = key.basketdata()
+    except (IOError, OSError, IndexError, ValueError, ImportError, NotImplementedError, zlib.error):
+        pass    # only an optimization: reading the step raises the error where it can be reported
+
+def _iterate(path, treepath, branches, awkward, localsource, xrootdsource, httpsource, prefetchfiles=0, executor=None, warm=None, close=False, **options):
+    if isinstance(path, Manifest):
+        # files without the TTree aren't opened again
+        manifest = path
+        paths = [x for x, entry in manifest.files.items() if entry["hastree"]]
+        manifest._checktreepath(treepath)
+    else:
+        manifest = None
+        paths = _paths(path)
+
+    def opentree(path):
+        # files that are closed after use come from (and go back to) the process-wide pool
+        return _opentree(path, treepath, branches, awkward, localsource, xrootdsource, httpsource, warm, close, options)
+
+    # files being opened on the executor while the caller works on the current one
+    upcoming = iter(paths)
+    opening = deque()
+    opened = None
 
-        yield tree, branchesinterp, globalentrystart, path, file
-        globalentrystart += tree.numentries
+    globalentrystart = 0
+    try:
+        for path in paths:
+            if prefetchfiles > 0:
+                for nextpath in itertools.islice(upcoming, prefetchfiles + 1 - len(opening)):
+                    opening.append(executor.submit(opentree, nextpath))
+                opened = opening.popleft().result()
+            else:
+                opened = opentree(path)
+            if opened is None:
+                continue
+            tree, branchesinterp, file = opened
+            if manifest is not None:
+                manifest._check(path, tree)
+
+            yield tree, branchesinterp, globalentrystart, path, file
+            globalentrystart += tree.numentries
+
+            if close:
+                _closetree(opened)
+            opened = None
+
+    finally:
+        # also when the caller stops early: close the files that were opened ahead
+        if close and opened is not None:
+            _closetree(opened)
+        for future in opening:
+            if not future.cancel():
+                try:
+                    ahead = future.result()
+                except Exception:
+                    ahead = None
+                if ahead is not None:
+                    _closetree(ahead)
 
 ################################################################ methods for TTree
 
@@ -298,6 +815,11 @@ class TTreeMethods(object):
     def _postprocess(self, source, cursor, context, parent):
         self._context = context
         self._context.treename = self.name
+        if getattr(parent, "_dirpath", None) is None:
+            self._context.treepath = self.name
+        else:
+            # the path and cycle of its key, to open this TTree again in another process
+            self._context.treepath = parent._dirpath + parent._fName + b";" + str(parent._fCycle).encode("ascii")
         self._context.speedbump = True
 
         for branch in self._fBranches:
@@ -434,18 +956,13 @@ class TTreeMethods(object):
         entrystart, entrystop = _normalize_entrystartstop(self.numentries, entrystart, entrystop)
 
         if not linear:
-            raise NotImplementedError("non-linear mempartition has not been implemented")
+            clusters = [stop for start, stop in self.clusters([branch.name for branch, interpretation in branches], entrystart=entrystart, entrystop=entrystop)]
+            baskets = [x for branch, interpretation in branches if branch._entryoffsets is not None for x in branch._entryoffsets]
+            for start, stop in _mempartitions(branches, numbytes, entrystart, entrystop, keycache, [clusters, baskets]):
+                yield start, stop
+            return
 
-        relevant_numbytes = 0.0
-        for branch, interpretation in branches:
-            if branch._recoveredbaskets is None:
-                branch._tryrecover()
-            for i, key in enumerate(branch._threadsafe_iterate_keys(keycache, False)):
-                start, stop = branch._entryoffsets[i], branch._entryoffsets[i + 1]
-                if entrystart < stop and start < entrystop:
-                    this_numbytes = key._fObjlen * (min(stop, entrystop) - max(start, entrystart)) / float(stop - start)
-                    assert this_numbytes >= 0.0
-                    relevant_numbytes += this_numbytes
+        relevant_numbytes = self._numbytes(branches, entrystart, entrystop, keycache)
 
         entrysteps = max(1, int(round(math.ceil((entrystop - entrystart) * numbytes / relevant_numbytes))))
 
@@ -456,69 +973,90 @@ class TTreeMethods(object):
                 yield start, stop
             start = stop
 
+    def _numbytes(self, branches, entrystart, entrystop, keycache):
+        # uncompressed bytes of the given (branch, interpretation) pairs in an entry range, prorated within baskets
+        return _BasketBytes(branches, keycache)(entrystart, entrystop)
+
     def clusters(self, branches=None, entrystart=None, entrystop=None, strict=False):
         awkward = _normalize_awkwardlib(None)
         branches = list(self._normalize_branches(branches, awkward))
 
-        # convenience class; simplifies presentation of the algorithm
-        class BranchCursor(object):
-            def __init__(self, branch):
-                self.branch = branch
-                self.basketstart = 0
-                self.basketstop = 0
-            @property
-            def entrystart(self):
-                return self.branch.basket_entrystart(self.basketstart)
-            @property
-            def entrystop(self):
-                return self.branch.basket_entrystop(self.basketstop)
-
-        cursors = [BranchCursor(branch) for branch, interpretation in branches if branch.numbaskets > 0]
-
-        if len(cursors) == 0:
+        boundaries = self._clusterboundaries(branches)
+        if boundaries is None:
             yield _normalize_entrystartstop(self.numentries, entrystart, entrystop)
 
         else:
-            # everybody starts at the same entry number; if there is no such place before someone runs out of baskets, there will be an exception
-            leadingstart = max(cursor.entrystart for cursor in cursors)
-            while not all(cursor.entrystart == leadingstart for cursor in cursors):
-                for cursor in cursors:
-                    while cursor.entrystart < leadingstart:
-                        cursor.basketstart += 1
-                        cursor.basketstop += 1
-                leadingstart = max(cursor.entrystart for cursor in cursors)
-
             entrystart, entrystop = _normalize_entrystartstop(self.numentries, entrystart, entrystop)
+            starts, stops = boundaries[:-1], boundaries[1:]
 
-            # move all cursors forward, yielding a (start, stop) pair if their baskets line up
-            while any(cursor.basketstop < cursor.branch.numbaskets for cursor in cursors):
-                # move all subleading baskets forward until they are no longer subleading
-                leadingstop = max(cursor.entrystop for cursor in cursors)
-                for cursor in cursors:
-                    while cursor.entrystop < leadingstop:
-                        cursor.basketstop += 1
-
-                # if they all line up, this is a good cluster
-                if all(cursor.entrystop == leadingstop for cursor in cursors):
-                    # check to see if it's within the bounds the user requested (strictly or not strictly)
-                    if strict:
-                        if entrystart <= leadingstart and leadingstop <= entrystop:
-                            yield leadingstart, leadingstop
-                    else:
-                        if entrystart < leadingstop and leadingstart < entrystop:
-                            yield leadingstart, leadingstop
+            # check to see if it's within the bounds the user requested (strictly or not strictly)
+            if strict:
+                mask = (entrystart <= starts) & (stops <= entrystop)
+            else:
+                mask = (entrystart < stops) & (starts < entrystop)
+
+            for start, stop in zip(starts[mask].tolist(), stops[mask].tolist()):
+                yield start, stop
+
+    def _clusterboundaries(self, branches):
+        # entry numbers at which all of the given branches start a new basket, cached for each set of branches;
+        # None if none of them have baskets
+        key = tuple(sorted(branch.name for branch, interpretation in branches))
+        try:
+            return self._clustercache[key]
+        except AttributeError:
+            self._clustercache = {}
+        except KeyError:
+            pass
 
-                    # anyway, move all the starts to the new stopping position and move all stops forward by one
-                    leadingstart = leadingstop
-                    for cursor in cursors:
-                        cursor.basketstart = cursor.basketstop
-                        cursor.basketstop += 1
+        offsets = [numpy.array(branch._entryoffsets, dtype=numpy.int64) for branch, interpretation in branches if branch.numbaskets > 0]
+        if len(offsets) == 0:
+            out = None
 
-                # stop iterating if we're past all acceptable clusters
-                if leadingstart >= entrystop:
-                    break
+        else:
+            # trust the TTree's own cluster boundaries if every branch's baskets respect them
+            out = self._clustermetadata()
+            if out is None or not all(numpy.isin(out, x, assume_unique=True).all() for x in offsets):
+                out = offsets[0]
+                for x in offsets[1:]:
+                    out = numpy.intersect1d(out, x, assume_unique=True)
+
+        self._clustercache[key] = out
+        return out
+
+    def _clustermetadata(self):
+        # cluster boundaries from fClusterRangeEnd/fClusterSize/fAutoFlush; None if clusters were sized in bytes
+        autoflush = getattr(self, "_fAutoFlush", None)
+        numranges = getattr(self, "_fNClusterRange", None) or 0
+        if autoflush is None:
+            return None
+
+        out = [numpy.array([0], dtype=numpy.int64)]
+        start = 0
+        for i in range(numranges):
+            stop = min(int(self._fClusterRangeEnd[i]) + 1, self.numentries)
+            size = int(self._fClusterSize[i])
+            if size <= 0:
+                size = autoflush
+            if size <= 0:
+                return None
+            out.append(numpy.arange(start + size, stop, size, dtype=numpy.int64))
+            out.append(numpy.array([stop], dtype=numpy.int64))
+            start = stop
+
+        if start < self.numentries:
+            if autoflush <= 0:
+                return None
+            out.append(numpy.arange(start + autoflush, self.numentries, autoflush, dtype=numpy.int64))
+            out.append(numpy.array([self.numentries], dtype=numpy.int64))
 
-    def array(self, branch, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True):
+        return numpy.unique(numpy.concatenate(out))
+
+    def metadata(self, branches=None):
+        awkward = _normalize_awkwardlib(None)
+        return _treemetadata(self._context, self.name, self.title, self.numentries, self._clustermetadata(), self.aliases, list(self._normalize_branches(branches, awkward)))
+
+    def array(self, branch, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, entries=None, zonemap=None):
         awkward = _normalize_awkwardlib(awkwardlib)
         branches = list(self._normalize_branches(branch, awkward))
         if len(branches) == 1:
@@ -528,9 +1066,9 @@ class TTreeMethods(object):
                 tbranch, _ = branches[0]
         else:
             raise ValueError("list of branch names or glob/regex matches more than one branch; use TTree.arrays (plural)")
-        return tbranch.array(interpretation=interpretation, entrystart=entrystart, entrystop=entrystop, flatten=flatten, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=blocking)
+        return tbranch.array(interpretation=interpretation, entrystart=entrystart, entrystop=entrystop, flatten=flatten, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=blocking, entries=entries, zonemap=zonemap)
 
-    def arrays(self, branches=None, outputtype=dict, namedecode=None, entrystart=None, entrystop=None, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, recursive=True):
+    def arrays(self, branches=None, outputtype=dict, namedecode=None, entrystart=None, entrystop=None, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, recursive=True, cut=None, entries=None, zonemap=None):
         awkward = _normalize_awkwardlib(awkwardlib)
         branches = list(self._normalize_branches(branches, awkward))
         for branch, interpretation in branches:
@@ -544,21 +1082,41 @@ class TTreeMethods(object):
         ispandas = getattr(outputtype, "__name__", None) == "DataFrame" and getattr(outputtype, "__module__", None) == "pandas.core.frame"
         entrystart, entrystop = _normalize_entrystartstop(self.numentries, entrystart, entrystop)
 
+        # with entries or a cut (whose selection branches are read first), read only the baskets of the selected entries
+        selected = {}
+        if entries is not None or cut is not None:
+            if keycache is None:
+                keycache = {}
+        if entries is not None:
+            entries = _normalize_entries(self.numentries, entries, entrystart, entrystop)
+        if cut is not None:
+            entries, positions, selected = self._cutentries(cut, entrystart, entrystop, awkward, cache, basketcache, keycache, executor, entries, zonemap)
+
+        def read(branch, interpretation):
+            if entries is None:
+                return branch.array(interpretation=interpretation, entrystart=entrystart, entrystop=entrystop, flatten=(flatten and not ispandas), awkwardlib=awkward, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=False, zonemap=zonemap)
+            elif branch.name in selected and selected[branch.name][0] == interpretation.identifier:
+                out = _selectentries(interpretation, selected[branch.name][1], positions, flatten and not ispandas)
+                return lambda: out
+            else:
+                return branch._sparsearray(interpretation, entries, flatten and not ispandas, awkward, basketcache, keycache, executor, zonemap)
+
         # start the job of filling the arrays
         futures = None
-        if recursive and recursive is not True:
-            def wrap_name(branch, namedecode):
-                if len(branch._provenance) != 0:
-                    if namedecode is None:
-                        return recursive.join(branch._provenance + [branch.name])
+        with _schedulerstep(executor):
+            if recursive and recursive is not True:
+                def wrap_name(branch, namedecode):
+                    if len(branch._provenance) != 0:
+                        if namedecode is None:
+                            return recursive.join(branch._provenance + [branch.name])
+                        else:
+                            return recursive.join([p.decode(namedecode) for p in (branch._provenance + [branch.name])])
                     else:
-                        return recursive.join([p.decode(namedecode) for p in (branch._provenance + [branch.name])])
-                else:
-                    return branch.name if namedecode is None else branch.name.decode(namedecode)
+                        return branch.name if namedecode is None else branch.name.decode(namedecode)
 
-            futures = [(wrap_name(branch, namedecode), interpretation, branch.array(interpretation=interpretation, entrystart=entrystart, entrystop=entrystop, flatten=(flatten and not ispandas), awkwardlib=awkward, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=False)) for branch, interpretation in branches]
-        else:
-            futures = [(branch.name if namedecode is None else branch.name.decode(namedecode), interpretation, branch.array(interpretation=interpretation, entrystart=entrystart, entrystop=entrystop, flatten=(flatten and not ispandas), awkwardlib=awkward, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=False)) for branch, interpretation in branches]
+                futures = [(wrap_name(branch, namedecode), interpretation, read(branch, interpretation)) for branch, interpretation in branches]
+            else:
+                futures = [(branch.name if namedecode is None else branch.name.decode(namedecode), interpretation, read(branch, interpretation)) for branch, interpretation in branches]
 
         # make functions that wait for the filling job to be done and return the right outputtype
         if outputtype == namedtuple:
@@ -569,7 +1127,7 @@ class TTreeMethods(object):
         elif ispandas:
             import uproot._connect._pandas
             def wait():
-                return uproot._connect._pandas.futures2df(futures, outputtype, entrystart, entrystop, flatten, flatname, awkward)
+                return uproot._connect._pandas.futures2df(futures, outputtype, entrystart, entrystop, flatten, flatname, awkward, entries)
 
         elif isinstance(outputtype, type) and issubclass(outputtype, dict):
             def wait():
@@ -589,7 +1147,38 @@ class TTreeMethods(object):
         else:
             return wait
 
-    def lazyarray(self, branch, interpretation=None, entrysteps=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, persistvirtual=False, chunked=True):
+    def _cutentries(self, cut, entrystart, entrystop, awkward, cache, basketcache, keycache, executor, entries, zonemap):
+        # global entry numbers that pass the cut (among entries, if not None), their positions in the
+        # selection branches' arrays, and {name: (interpretation identifier, array)} of the selection branches
+        names, function = _exprfunction(cut, self)
+        interpretations = OrderedDict((branch.name, interpretation) for branch, interpretation in self._normalize_branches(list(OrderedDict.fromkeys(names)), awkward))
+
+        # entries in baskets that the zone map rules out are not even read for the selection
+        if zonemap is not None:
+            zones = _cutzones(cut, self, zonemap, entrystart, entrystop, awkward)
+            if zones is not None:
+                starts, stops = zones
+                if entries is None:
+                    entries = numpy.concatenate([numpy.arange(start, stop, dtype=numpy.int64) for start, stop in zip(starts, stops)] + [numpy.empty(0, dtype=numpy.int64)])
+                else:
+                    entries = entries[_inintervals(entries, starts, stops)]
+
+        arrays = self.arrays(interpretations, outputtype=dict, entrystart=entrystart, entrystop=entrystop, awkwardlib=awkward, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, entries=entries, zonemap=zonemap)
+
+        numentries = entrystop - entrystart if entries is None else len(entries)
+        selection = numpy.asarray(function(*[arrays[name] for name in names]))
+        if selection.dtype != numpy.bool_ or selection.shape != (numentries,):
+            raise ValueError("cut must return one boolean per entry ({0} entries), not an array of shape {1} and dtype {2}".format(numentries, selection.shape, selection.dtype))
+        positions = numpy.nonzero(selection)[0]
+        if entries is None:
+            entries = positions + entrystart
+        else:
+            entries = entries[positions]
+
+        selected = dict((name, (interpretation.identifier, arrays[name])) for name, interpretation in interpretations.items())
+        return entries, positions, selected
+
+    def lazyarray(self, branch, interpretation=None, entrysteps=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, persistvirtual=False, chunked=True, max_memory=None):
         awkward = _normalize_awkwardlib(awkwardlib)
         branches = list(self._normalize_branches(branch, awkward))
         if len(branches) == 1:
@@ -599,10 +1188,12 @@ class TTreeMethods(object):
                 tbranch, _ = branches[0]
         else:
             raise ValueError("list of branch names or glob/regex matches more than one branch; use TTree.lazyarrays (plural)")
-        return tbranch.lazyarray(interpretation=interpretation, entrysteps=entrysteps, entrystart=entrystart, entrystop=entrystop, flatten=flatten, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, persistvirtual=persistvirtual, chunked=chunked)
+        return tbranch.lazyarray(interpretation=interpretation, entrysteps=entrysteps, entrystart=entrystart, entrystop=entrystop, flatten=flatten, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, persistvirtual=persistvirtual, chunked=chunked, max_memory=max_memory)
 
-    def lazyarrays(self, branches=None, namedecode="utf-8", entrysteps=None, entrystart=None, entrystop=None, flatten=False, profile=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, persistvirtual=False, chunked=True):
+    def lazyarrays(self, branches=None, namedecode="utf-8", entrysteps=None, entrystart=None, entrystop=None, flatten=False, profile=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, persistvirtual=False, chunked=True, max_memory=None, entries=None):
         entrystart, entrystop = _normalize_entrystartstop(self.numentries, entrystart, entrystop)
+        if entries is not None:
+            entries = _normalize_entries(self.numentries, entries, entrystart, entrystop)
         if not chunked and entrysteps is None:
             entrysteps = float('inf')
         entrysteps = list(self._normalize_entrysteps(entrysteps, branches, entrystart, entrystop, keycache))
@@ -612,7 +1203,19 @@ class TTreeMethods(object):
             if branch._recoveredbaskets is None:
                 branch._tryrecover()
 
-        lazytree = _LazyTree(self._context.sourcepath, self._context.treename, self, dict((b.name, x) for b, x in branches), flatten, awkward.__name__, basketcache, keycache, executor)
+        lazytree = _LazyTree(self._context.sourcepath, self._context.treepath, self, dict((b.name, x) for b, x in branches), flatten, awkward.__name__, basketcache, keycache, executor, _normalize_max_memory(max_memory), entries)
+
+        def length(start, stop):
+            if entries is None:
+                return stop - start
+            else:
+                return int(numpy.searchsorted(entries, stop) - numpy.searchsorted(entries, start))
+
+        if chunked:
+            steps = numpy.array(entrysteps, dtype=numpy.int64).reshape(-1, 2)
+            counts = [length(start, stop) for start, stop in entrysteps]
+            offsets = awkward.JaggedArray.counts2offsets(counts)
+            LazyChunkedArray = _lazychunkedarray(awkward)
 
         out = awkward.Table()
         for branch, interpretation in branches:
@@ -628,16 +1231,13 @@ class TTreeMethods(object):
 
             name = branch.name.decode("ascii") if namedecode is None else branch.name.decode(namedecode)
             if chunked:
-                chunks = []
-                counts = []
-                for start, stop in entrysteps:
-                    chunks.append(VirtualArray(lazytree, (branch.name, start, stop), cache=cache, type=awkward.type.ArrayType(stop - start, interpretation.type), persistvirtual=persistvirtual))
-                    counts.append(stop - start)
-                out[name] = awkward.ChunkedArray(chunks, counts)
+                # adjacent chunks are read together unless flattening changes their lengths or memory is budgeted per chunk
+                entrybytes = None if flatten or max_memory is not None else branch._fTotBytes / max(branch.numentries, 1)
+                out[name] = LazyChunkedArray(_LazyChunks(awkward, lazytree, branch.name, steps, counts, VirtualArray, interpretation.type, cache, persistvirtual, entrybytes), counts, offsets)
                 out[name].__doc__ = branch.title.decode('ascii')
             else:
                 start, stop = entrysteps[0]
-                out[name] = VirtualArray(lazytree, (branch.name, start, stop), cache=cache, type=awkward.type.ArrayType(stop - start, interpretation.type), persistvirtual=persistvirtual)
+                out[name] = VirtualArray(lazytree, (branch.name, start, stop), cache=cache, type=awkward.type.ArrayType(length(start, stop), interpretation.type), persistvirtual=persistvirtual)
                 out[name].__doc__ = branch.title.decode('ascii')
 
         if profile is not None:
@@ -647,7 +1247,7 @@ class TTreeMethods(object):
     def _normalize_entrysteps(self, entrysteps, branches, entrystart, entrystop, keycache):
         numbytes = _memsize(entrysteps)
         if numbytes is not None:
-            return self.mempartitions(numbytes, branches=branches, entrystart=entrystart, entrystop=entrystop, keycache=keycache, linear=True)
+            return self.mempartitions(numbytes, branches=branches, entrystart=entrystart, entrystop=entrystop, keycache=keycache, linear=False)
         if isinstance(entrysteps, string_types):
             raise ValueError("string {0} does not match the memory size pattern (number followed by B/kB/MB/GB/etc.)".format(repr(entrysteps)))
 
@@ -674,7 +1274,21 @@ class TTreeMethods(object):
                 raise TypeError("entrysteps must be None for cluster iteration, a positive integer for equal steps in number of entries (inf for maximal), a memory size string (number followed by B/kB/MB/GB/etc.), or an iterable of 2-tuples for explicit entry starts (inclusive) and stops (exclusive)")
             return entrysteps
 
-    def iterate(self, branches=None, entrysteps=None, outputtype=dict, namedecode=None, reportentries=False, entrystart=None, entrystop=None, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True):
+    def iterate(self, branches=None, entrysteps=None, outputtype=dict, namedecode=None, reportentries=False, entrystart=None, entrystop=None, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, prefetch=0, prefetchbytes=None, max_memory=None, cut=None, zonemap=None, processes=None, ordered=True):
+        if prefetch < 0:
+            raise ValueError("prefetch must be a non-negative number of steps")
+        if processes is not None and executor is not None:
+            raise ValueError("processes and executor can't be used together: worker processes read and decompress their own baskets")
+        if prefetch > 0 and executor is None and processes is None:
+            raise ValueError("prefetch requires an executor to read ahead on")
+        if prefetchbytes is not None:
+            m = _memsize(prefetchbytes)
+            if m is not None:
+                prefetchbytes = m
+            if prefetchbytes <= 0:
+                raise ValueError("prefetchbytes must be positive")
+        max_memory = _normalize_max_memory(max_memory)
+
         if keycache is None:
             keycache = {}
 
@@ -710,7 +1324,7 @@ class TTreeMethods(object):
                     return out
 
         if outputtype == namedtuple:
-            outputtype = namedtuple("Arrays", [codecs.ascii_decode(branch.name, "replace")[0] if namedecode is None else branch.name.decode(namedecode) for branch, interpretation in branches])
+            outputtype = _namedtuple(branches, namedecode)
             def wrap_for_python_scope(futures, start, stop):
                 return lambda: outputtype(*[evaluate(branch, interpretation, future, past, cachekey, False) for branch, interpretation, future, past, cachekey in futures])
 
@@ -733,12 +1347,13 @@ class TTreeMethods(object):
             def wrap_for_python_scope(futures, start, stop):
                 return lambda: outputtype(*[evaluate(branch, interpretation, future, past, cachekey, False) for branch, interpretation, future, past, cachekey in futures])
 
-        for start, stop in entrysteps:
-            start = max(start, entrystart)
-            stop = min(stop, entrystop)
-            if start > stop:
-                continue
+        def submit(start, stop):
+            with _schedulerstep(executor):
+                if cut is not None:
+                    return self.arrays(OrderedDict((branch.name, interpretation) for branch, interpretation in branches), outputtype=outputtype, namedecode=namedecode, entrystart=start, entrystop=stop, flatten=flatten, flatname=flatname, awkwardlib=awkward, cache=cache, basketcache=(basketcache if explicit_basketcache else None), keycache=keycache, executor=executor, blocking=False, cut=cut, zonemap=zonemap)
+                return wrap_for_python_scope(step_futures(start, stop), start, stop)
 
+        def step_futures(start, stop):
             futures = []
             for branch, interpretation in branches:
                 cachekey = branch._cachekey(interpretation, start, stop)
@@ -756,19 +1371,166 @@ class TTreeMethods(object):
                         if out is not None:
                             futures.append((branch, interpretation, None, out, cachekey))
                             continue
-                    future = branch._step_array(interpretation, basket_itemoffset, basket_entryoffset, start, stop, awkward, basketcache, keycache, executor, explicit_basketcache)
+                    future = branch._step_array(interpretation, basket_itemoffset, basket_entryoffset, start, stop, awkward, basketcache, keycache, executor, explicit_basketcache, zonemap)
                     futures.append((branch, interpretation, future, None, cachekey))
 
-            out = wrap_for_python_scope(futures, start, stop)
+            return futures
+
+        def steps():
+            for start, stop in entrysteps:
+                start = max(start, entrystart)
+                stop = min(stop, entrystop)
+                if start > stop:
+                    continue
+                yield start, stop
 
+        def report(start, stop, out, reserved=None):
             if blocking:
                 out = out()
+                if reserved is not None:
+                    # the step's baskets are gone; only its output is still held
+                    reserved[0] = max_memory.resize(reserved[0], MemoryBudget.nbytes(out))
+            if reportentries:
+                return start, stop, out
+            else:
+                return out
+
+        if processes is not None:
+            import uproot._processes
+            kwargs = {"outputtype": (outputtype if ispandas else tuple), "namedecode": namedecode, "flatten": flatten, "flatname": flatname, "awkwardlib": awkward.__name__, "cut": cut, "zonemap": zonemap}
+            job = uproot._processes._Job(self, self._context.sourcepath, self._context.treepath, (MemmapSource.defaults, XRootDSource.defaults, HTTPSource.defaults), {}, branches, steps(), kwargs)
+            for job, start, stop, out in uproot._processes.iterate(processes, [job], ordered, prefetch):
+                out = out if ispandas else _wrapoutput(outputtype, namedecode, branches, out)
+                yield report(start, stop, lambda out=out: out)
+                del out
+
+        elif prefetch == 0 and max_memory is None:
+            for start, stop in steps():
+                yield report(start, stop, submit(start, stop))
+
+        else:
+            # keep up to prefetch steps reading on the executor while the caller works on the current one;
+            # finalizing stays in this thread so that no executor task waits on another. With max_memory,
+            # a step is only submitted once its expected peak fits in the budget, and a yielded step's
+            # output counts against the budget until the caller asks for the next one (if blocking) or
+            # until its deferred output is called (if not blocking; the oldest are called here if their
+            # reservations are in the way of the next step).
+            inflight = deque()
+            inflightbytes = 0.0
+            deferred = deque()
+
+            def first():
+                start0, stop0, out0, numbytes0, reserved0 = inflight[0]
+                if blocking or reserved0 is None:
+                    return report(start0, stop0, out0, reserved0)
+                out0 = _DeferredStep(out0, max_memory, reserved0[0])
+                deferred.append(out0)
+                return report(start0, stop0, out0)
+
+            def release():
+                start0, stop0, out0, numbytes0, reserved0 = inflight.popleft()
+                if reserved0 is not None and blocking:
+                    max_memory.release(reserved0[0])
+
+            # basket sizes are read once, not once per step
+            basketbytes = None if prefetchbytes is None and max_memory is None else _BasketBytes(branches, keycache)
+
+            try:
+                for start, stop in steps():
+                    numbytes = 0.0 if prefetchbytes is None else basketbytes(start, stop)
+                    stepbytes = 0.0 if max_memory is None else basketbytes(start, stop, 1.0)
+                    while len(inflight) > 0 and (len(inflight) > prefetch or (prefetchbytes is not None and inflightbytes + numbytes > prefetchbytes) or (max_memory is not None and not max_memory.fits(stepbytes))):
+                        inflightbytes -= inflight[0][3]
+                        yield first()
+                        release()
+                    deferred = deque(x for x in deferred if x.numbytes is not None)
+                    while len(deferred) > 0 and not max_memory.fits(stepbytes):
+                        deferred.popleft()()
+
+                    reserved = None if max_memory is None else [max_memory.acquire(stepbytes)]
+                    inflight.append((start, stop, submit(start, stop), numbytes, reserved))
+                    inflightbytes += numbytes
+
+                while len(inflight) > 0:
+                    yield first()
+                    release()
 
+            finally:
+                # also when the caller stops early; deferred outputs that were yielded keep theirs until called
+                for start0, stop0, out0, numbytes0, reserved0 in inflight:
+                    if reserved0 is not None:
+                        max_memory.release(reserved0[0])
+
+    def itereval(self, expr, entrysteps=None, reportentries=False, entrystart=None, entrystop=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, prefetch=0, cut=None, zonemap=None):
+        names, function = _exprfunction(expr, self, "expression")
+        for start, stop, arrays in self.iterate(names, entrysteps=entrysteps, outputtype=tuple, reportentries=True, entrystart=entrystart, entrystop=entrystop, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, prefetch=prefetch, cut=cut, zonemap=zonemap):
+            out = function(*arrays)
+            del arrays
+            if not hasattr(out, "__len__"):
+                raise ValueError("expression {0} produces {1}, not one value per entry".format(repr(expr), repr(out)))
             if reportentries:
                 yield start, stop, out
             else:
                 yield out
 
+    def eval(self, expr, entrysteps=None, entrystart=None, entrystop=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, cut=None, zonemap=None):
+        awkward = _normalize_awkwardlib(awkwardlib)
+        entrystart, entrystop = _normalize_entrystartstop(self.numentries, entrystart, entrystop)
+
+        out, pieces = None, []
+        for start, stop, piece in self.itereval(expr, entrysteps=entrysteps, reportentries=True, entrystart=entrystart, entrystop=entrystop, awkwardlib=awkward, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, prefetch=(0 if executor is None else 1), cut=cut, zonemap=zonemap):
+            if cut is None and isinstance(piece, numpy.ndarray) and len(piece) == stop - start and (out is not None or len(pieces) == 0):
+                # one value per entry: fill the output directly, so that only one step is held at a time
+                if out is None:
+                    out = numpy.empty((entrystop - entrystart,) + piece.shape[1:], dtype=piece.dtype)
+                out[start - entrystart : stop - entrystart] = piece
+            else:
+                if out is not None:
+                    pieces.append(out[: start - entrystart])
+                    out = None
+                pieces.append(piece)
+
+        if out is not None:
+            return out
+        elif len(pieces) == 0:
+            names, function = _exprfunction(expr, self, "expression")
+            return function(*self.arrays(names, outputtype=tuple, entrystart=entrystart, entrystop=entrystart, awkwardlib=awkward))
+        elif len(pieces) == 1:
+            return pieces[0]
+        elif all(isinstance(x, numpy.ndarray) for x in pieces):
+            return numpy.concatenate(pieces)
+        else:
+            return awkward.concatenate(pieces)
+
+    def histogram(self, expr, bins=10, range=None, weight=None, cut=None, title=None, entrysteps=None, entrystart=None, entrystop=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None):
+        import uproot.reduce
+        return uproot.reduce._histogram(lambda: [self], expr, bins, range, weight, cut, title, entrysteps, entrystart, entrystop, _normalize_awkwardlib(awkwardlib), cache, basketcache, keycache, executor)
+
+    def count(self, expr=None, cut=None, entrysteps=None, entrystart=None, entrystop=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None):
+        import uproot.reduce
+        reducer = uproot.reduce._Count()
+        return reducer.result(uproot.reduce._reduce([self], reducer, [] if expr is None else [expr], None, cut, entrysteps, entrystart, entrystop, _normalize_awkwardlib(awkwardlib), cache, basketcache, keycache, executor))
+
+    def sum(self, expr, weight=None, cut=None, entrysteps=None, entrystart=None, entrystop=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None):
+        import uproot.reduce
+        reducer = uproot.reduce._Sum()
+        return reducer.result(uproot.reduce._reduce([self], reducer, [expr], weight, cut, entrysteps, entrystart, entrystop, _normalize_awkwardlib(awkwardlib), cache, basketcache, keycache, executor))
+
+    def mean(self, expr, weight=None, cut=None, entrysteps=None, entrystart=None, entrystop=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None):
+        import uproot.reduce
+        reducer = uproot.reduce._Mean()
+        return reducer.result(uproot.reduce._reduce([self], reducer, [expr], weight, cut, entrysteps, entrystart, entrystop, _normalize_awkwardlib(awkwardlib), cache, basketcache, keycache, executor))
+
+    def min(self, expr, cut=None, entrysteps=None, entrystart=None, entrystop=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None):
+        import uproot.reduce
+        reducer = uproot.reduce._Min()
+        return reducer.result(uproot.reduce._reduce([self], reducer, [expr], None, cut, entrysteps, entrystart, entrystop, _normalize_awkwardlib(awkwardlib), cache, basketcache, keycache, executor))
+
+    def max(self, expr, cut=None, entrysteps=None, entrystart=None, entrystop=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None):
+        import uproot.reduce
+        reducer = uproot.reduce._Max()
+        return reducer.result(uproot.reduce._reduce([self], reducer, [expr], None, cut, entrysteps, entrystart, entrystop, _normalize_awkwardlib(awkwardlib), cache, basketcache, keycache, executor))
+
     def _format(self, indent=""):
         # TODO: add TTree data to the bottom of this
         out = []
@@ -1055,6 +1817,8 @@ class TBranchMethods(object):
         key = None
         if keycache is not None:
             key = keycache.get(self._keycachekey(i), None)
+            if key is not None and ((complete and not hasattr(key, "border")) or _stalekey(key)):
+                key = None
 
         if key is None:
             keysource = self._source.threadlocal()
@@ -1076,7 +1840,7 @@ class TBranchMethods(object):
         done = False
         if keycache is not None:
             keys = [keycache.get(self._keycachekey(i), None) for i in range(basketstart, basketstop)]
-            if all(x is not None for x in keys):
+            if all(x is not None and not _stalekey(x) for x in keys):
                 if not complete or all(hasattr(x, "border") for x in keys):
                     for key in keys:
                         yield key
@@ -1087,7 +1851,7 @@ class TBranchMethods(object):
             try:
                 for i in range(basketstart, basketstop):
                     key = None if keycache is None else keycache.get(self._keycachekey(i), None)
-                    if key is None or (complete and not hasattr(key, "border")):
+                    if key is None or (complete and not hasattr(key, "border")) or _stalekey(key):
                         key = self._basketkey(keysource, i, complete)
                         if keycache is not None:
                             keycache[self._keycachekey(i)] = key
@@ -1212,19 +1976,53 @@ class TBranchMethods(object):
         local_entrystop  = max(0, min(entrystop - self.basket_entrystart(i), self.basket_entrystop(i) - self.basket_entrystart(i)))
         return local_entrystart, local_entrystop
 
-    def _basket(self, i, interpretation, local_entrystart, local_entrystop, awkward, basketcache, keycache):
-        basketdata = None
+    def _fetchbasket(self, i, basketcache, keycache):
+        key = self._threadsafe_key(i, keycache, True)
         if basketcache is not None:
-            basketcachekey = self._basketcachekey(i)
-            basketdata = basketcache.get(basketcachekey, None)
+            basketdata = basketcache.get(self._basketcachekey(i), None)
+            if basketdata is not None:
+                return key, None, basketdata
+        return key, key.basketfetch(), None
 
-        key = self._threadsafe_key(i, keycache, True)
+    def _decompressbasket(self, fetched):
+        key, raw, basketdata = fetched
+        if basketdata is None:
+            basketdata = key.basketdecompress(raw)
+        return key, basketdata
+
+    def _fillbaskets(self, fill, basketstart, basketstop, basketcache, keycache, executor):
+        # runs fill(j, decompressed) for each basket; returns the excinfos to raise (possibly lazily)
+        if executor is None:
+            for j in range(basketstop - basketstart):
+                _delayedraise(fill(j))
+            return ()
+
+        elif isinstance(executor, Scheduler):
+            excinfos = []
+            with executor.step():
+                for j in range(basketstop - basketstart):
+                    fetched = executor.schedule("fetch", self._fetchbasket, (j + basketstart, basketcache, keycache))
+                    decompressed = executor.schedule("decompress", self._decompressbasket, after=[fetched])
+                    excinfos.append(executor.schedule("interpret", fill, (j,), after=[decompressed]))
+            return (x.result() for x in excinfos)
+
+        else:
+            return executor.map(fill, range(basketstop - basketstart))
+
+    def _basket(self, i, interpretation, local_entrystart, local_entrystop, awkward, basketcache, keycache, decompressed=None):
+        basketdata = None
+        if decompressed is not None:
+            key, basketdata = decompressed
+        else:
+            if basketcache is not None:
+                basketdata = basketcache.get(self._basketcachekey(i), None)
+            key = self._threadsafe_key(i, keycache, True)
 
         if basketdata is None:
             basketdata = key.basketdata()
 
         if basketcache is not None:
-            basketcache[basketcachekey] = basketdata
+            basketcache[self._basketcachekey(i)] = basketdata
 
         if key._fObjlen == key.border:
             data, byteoffsets = basketdata, None
@@ -1289,20 +2087,23 @@ class TBranchMethods(object):
         else:
             return out
 
-    def _basketstartstop(self, entrystart, entrystop):
-        basketstart, basketstop = None, None
-        for i in range(self.numbaskets):
-            if basketstart is None:
-                if entrystart < self.basket_entrystop(i) and self.basket_entrystart(i) < entrystop:
-                    basketstart = i
-                    basketstop = i
-            else:
-                if self.basket_entrystart(i) < entrystop:
-                    basketstop = i
-
-        if basketstop is not None:
-            basketstop += 1    # stop is exclusive
+    def _entryoffsetsarray(self):
+        # _entryoffsets as a Numpy array, rebuilt only when recovery replaces the list
+        if self._recoveredbaskets is None:
+            self._tryrecover()
+        cached = getattr(self, "_entryoffsetscache", None)
+        if cached is None or cached[0] is not self._entryoffsets:
+            offsets = self._fBasketEntry if self._entryoffsets is None else self._entryoffsets
+            cached = self._entryoffsetscache = (self._entryoffsets, numpy.array(offsets[: self.numbaskets + 1], dtype=numpy.int64))
+        return cached[1]
 
+    def _basketstartstop(self, entrystart, entrystop):
+        # first basket that ends after entrystart and starts before entrystop, up to the last that starts before entrystop
+        offsets = self._entryoffsetsarray()
+        basketstart = int(numpy.searchsorted(offsets[1:], entrystart, side="right"))
+        if basketstart >= len(offsets) - 1 or offsets[basketstart] >= entrystop:
+            return None, None
+        basketstop = int(numpy.searchsorted(offsets[:-1], entrystop, side="left"))
         return basketstart, basketstop
 
     def baskets(self, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, reportentries=False, executor=None, blocking=True):
@@ -1394,7 +2195,7 @@ class TBranchMethods(object):
             basket_entryoffset.append(basket_entryoffset[-1] + self.basket_numentries(i))
         return basket_entryoffset
 
-    def array(self, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True):
+    def array(self, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, entries=None, zonemap=None):
         if self._recoveredbaskets is None:
             self._tryrecover()
         awkward = _normalize_awkwardlib(awkwardlib)
@@ -1402,6 +2203,15 @@ class TBranchMethods(object):
         if interpretation is None:
             raise ValueError("cannot interpret branch {0} as a Python type\n   in file: {1}".format(repr(self.name), self._context.sourcepath))
         entrystart, entrystop = _normalize_entrystartstop(self.numentries, entrystart, entrystop)
+
+        if entries is not None:
+            if keycache is None:
+                keycache = {}
+            wait = self._sparsearray(interpretation, _normalize_entries(self.numentries, entries, entrystart, entrystop), flatten, awkward, basketcache, keycache, executor, zonemap)
+            if blocking:
+                return wait()
+            else:
+                return wait
         basketstart, basketstop = self._basketstartstop(entrystart, entrystop)
 
         if basketstart is not None and basketstop is not None and self._source.parent() is not None:
@@ -1434,11 +2244,13 @@ class TBranchMethods(object):
 
         destination = interpretation.destination(basket_itemoffset[-1], basket_entryoffset[-1])
 
-        def fill(j):
+        def fill(j, decompressed=None):
             try:
                 i = j + basketstart
                 local_entrystart, local_entrystop = self._localentries(i, entrystart, entrystop)
-                source = self._basket(i, interpretation, local_entrystart, local_entrystop, awkward, basketcache, keycache)
+                source = self._basket(i, interpretation, local_entrystart, local_entrystop, awkward, basketcache, keycache, decompressed)
+                if zonemap is not None and local_entrystart == 0 and local_entrystop == self.basket_numentries(i):
+                    zonemap.record(self, interpretation, i, source)
 
                 expecteditems = basket_itemoffset[j + 1] - basket_itemoffset[j]
                 source_numitems = interpretation.source_numitems(source)
@@ -1468,12 +2280,7 @@ class TBranchMethods(object):
             except Exception:
                 return sys.exc_info()
 
-        if executor is None:
-            for j in range(basketstop - basketstart):
-                _delayedraise(fill(j))
-            excinfos = ()
-        else:
-            excinfos = executor.map(fill, range(basketstop - basketstart))
+        excinfos = self._fillbaskets(fill, basketstart, basketstop, basketcache, keycache, executor)
 
         def wait():
             for excinfo in excinfos:
@@ -1498,7 +2305,34 @@ class TBranchMethods(object):
         else:
             return wait
 
-    def _step_array(self, interpretation, basket_itemoffset, basket_entryoffset, entrystart, entrystop, awkward, basketcache, keycache, executor, explicit_basketcache):
+    def _sparsearray(self, interpretation, entries, flatten, awkward, basketcache, keycache, executor, zonemap=None):
+        # reads only the baskets that contain at least one of the (sorted, global) entries: each run of
+        # such baskets is one array call from its first to its last entry, indexed down to the entries
+        baskets = numpy.searchsorted(self._entryoffsetsarray(), entries, side="right") - 1
+        breaks = numpy.nonzero(baskets[1:] - baskets[:-1] > 1)[0] + 1
+        edges = numpy.concatenate([[0], breaks, [len(entries)]]) if len(entries) > 0 else []
+
+        pieces = []
+        for lo, hi in zip(edges[:-1], edges[1:]):
+            start, stop = entries[lo], entries[hi - 1] + 1
+            future = self.array(interpretation=interpretation, entrystart=start, entrystop=stop, flatten=False, awkwardlib=awkward, cache=None, basketcache=basketcache, keycache=keycache, executor=executor, blocking=False, zonemap=zonemap)
+            pieces.append((future, entries[lo:hi] - start))
+
+        def wait():
+            arrays = [future()[local] for future, local in pieces]
+            if len(arrays) == 0:
+                out = interpretation.empty()
+            elif len(arrays) == 1:
+                out = arrays[0]
+            elif all(isinstance(x, numpy.ndarray) for x in arrays):
+                out = numpy.concatenate(arrays)
+            else:
+                out = awkward.concatenate(arrays)
+            return _selectentries(interpretation, out, slice(None), flatten)
+
+        return wait
+
+    def _step_array(self, interpretation, basket_itemoffset, basket_entryoffset, entrystart, entrystop, awkward, basketcache, keycache, executor, explicit_basketcache, zonemap=None):
         if interpretation is None:
             raise ValueError("cannot interpret branch {0} as a Python type\n   in file: {1}".format(repr(self.name), self._context.sourcepath))
         if self._recoveredbaskets is None:
@@ -1511,11 +2345,13 @@ class TBranchMethods(object):
 
         destination = interpretation.destination(basket_itemoffset[-1], basket_entryoffset[-1])
 
-        def fill(j):
+        def fill(j, decompressed=None):
             try:
                 i = j + basketstart
                 local_entrystart, local_entrystop = self._localentries(i, entrystart, entrystop)
-                source = self._basket(i, interpretation, local_entrystart, local_entrystop, awkward, basketcache, keycache)
+                source = self._basket(i, interpretation, local_entrystart, local_entrystop, awkward, basketcache, keycache, decompressed)
+                if zonemap is not None and local_entrystart == 0 and local_entrystop == self.basket_numentries(i):
+                    zonemap.record(self, interpretation, i, source)
 
                 expecteditems = basket_itemoffset[j + 1] - basket_itemoffset[j]
                 source_numitems = interpretation.source_numitems(source)
@@ -1545,12 +2381,7 @@ class TBranchMethods(object):
             except Exception:
                 return sys.exc_info()
 
-        if executor is None:
-            for j in range(basketstop - basketstart):
-                _delayedraise(fill(j))
-            excinfos = ()
-        else:
-            excinfos = executor.map(fill, range(basketstop - basketstart))
+        excinfos = self._fillbaskets(fill, basketstart, basketstop, basketcache, keycache, executor)
 
         def wait():
             for excinfo in excinfos:
@@ -1583,7 +2414,11 @@ class TBranchMethods(object):
         entrystart, entrystop = _normalize_entrystartstop(self.numentries, entrystart, entrystop)
 
         if not linear:
-            raise NotImplementedError("non-linear mempartition has not been implemented")
+            if self._recoveredbaskets is None:
+                self._tryrecover()
+            for start, stop in _mempartitions([(self, None)], numbytes, entrystart, entrystop, keycache, [self._entryoffsets]):
+                yield start, stop
+            return
 
         relevant_numbytes = 0.0
         if self._recoveredbaskets is None:
@@ -1607,7 +2442,7 @@ class TBranchMethods(object):
     def _normalize_entrysteps(self, entrysteps, entrystart, entrystop, keycache):
         numbytes = _memsize(entrysteps)
         if numbytes is not None:
-            return self.mempartitions(numbytes, entrystart=entrystart, entrystop=entrystop, keycache=keycache, linear=True)
+            return self.mempartitions(numbytes, entrystart=entrystart, entrystop=entrystop, keycache=keycache, linear=False)
         if isinstance(entrysteps, string_types):
             raise ValueError("string {0} does not match the memory size pattern (number followed by B/kB/MB/GB/etc.)".format(repr(entrysteps)))
 
@@ -1636,7 +2471,7 @@ class TBranchMethods(object):
                 raise TypeError("entrysteps must be None for cluster iteration, a positive integer for equal steps in number of entries (inf for maximal), a memory size string (number followed by B/kB/MB/GB/etc.), or an iterable of 2-tuples for explicit entry starts (inclusive) and stops (exclusive)")
             return entrysteps
 
-    def lazyarray(self, interpretation=None, entrysteps=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, persistvirtual=False, chunked=True):
+    def lazyarray(self, interpretation=None, entrysteps=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, persistvirtual=False, chunked=True, max_memory=None):
         if self._recoveredbaskets is None:
             self._tryrecover()
         awkward = _normalize_awkwardlib(awkwardlib)
@@ -1661,7 +2496,7 @@ class TBranchMethods(object):
             VirtualArray = awkward.VirtualArray
             chunkedarray = awkward.ChunkedArray
 
-        lazybranch = _LazyBranch(self._context.sourcepath, self._context.treename, self.name, self, interpretation, flatten, awkward.__name__, basketcache, keycache, executor)
+        lazybranch = _LazyBranch(self._context.sourcepath, self._context.treepath, self.name, self, interpretation, flatten, awkward.__name__, basketcache, keycache, executor, _normalize_max_memory(max_memory))
 
         if chunked:
             chunks = []
@@ -1732,6 +2567,22 @@ class TBranchMethods(object):
             finally:
                 datasource.dismiss()
 
+        def basketfetch(self):
+            # the bytes as stored in the file; basketdecompress turns them into basketdata
+            if not isinstance(self.source, uproot.source.compressed.CompressedSource):
+                return self.basketdata()
+            datasource = self.source.parent().threadlocal()
+            try:
+                return Cursor(self._fSeekKey + self._fKeylen).bytes(datasource, self._fNbytes - self._fKeylen)
+            finally:
+                datasource.dismiss()
+
+        def basketdecompress(self, raw):
+            if not isinstance(self.source, uproot.source.compressed.CompressedSource):
+                return raw
+            datasource = uproot.source.compressed.CompressedSource(self.source.compression, uproot.source.source.Source(raw), Cursor(0), len(raw), self._fObjlen)
+            return Cursor(0).bytes(datasource, self._fObjlen)
+
     class _RecoveredTBasket(uproot.rootio.ROOTObject):
         @classmethod
         def _readinto(cls, self, source, cursor, context, parent):
@@ -1774,6 +2625,12 @@ class TBranchMethods(object):
         def basketdata(self):
             return self.contents
 
+        def basketfetch(self):
+            return self.contents
+
+        def basketdecompress(self, raw):
+            return raw
+
         @property
         def numentries(self):
             return self._fNevBuf
@@ -1848,10 +2705,205 @@ class TBranchMethods(object):
         # prevent Python's attempt to interpret __len__ and __getitem__ as iteration
         raise TypeError("'TBranch' object is not iterable")
 
+################################################################ for shipping TTree metadata to workers
+
+class _MetadataPickler(pickle.Pickler):
+    # interpretations may refer to awkward-array modules, but not to a file's context or the classes defined by its streamers
+    def persistent_id(self, obj):
+        if isinstance(obj, types.ModuleType):
+            return obj.__name__
+        elif isinstance(obj, uproot.rootio.ROOTDirectory._FileContext) or (isinstance(obj, type) and obj.__module__ == "uproot.rootio" and getattr(uproot.rootio, obj.__name__, None) is not obj):
+            raise ValueError("its interpretation needs the classes defined by the file's streamers")
+        else:
+            return None
+
+class _MetadataUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        return importlib.import_module(pid)
+
+def _treemetadata(context, name, title, numentries, clusters, aliases, branchesinterp):
+    # TTreeMetadata of some (TBranch, interpretation) pairs, and the count branches they need
+    awkward = _normalize_awkwardlib(None)
+    branchesinterp = OrderedDict((branch.name, (branch, interpretation)) for branch, interpretation in branchesinterp)
+    for branch, interpretation in list(branchesinterp.values()):
+        countbranch = branch._countbranch
+        if countbranch is not None and countbranch.name not in branchesinterp:
+            branchesinterp[countbranch.name] = (countbranch, interpret(countbranch, awkward))
+
+    out = TTreeMetadata.__new__(TTreeMetadata)
+    out.path = context.sourcepath
+    out.name = name
+    out.title = title
+    out.uuid = context.uuid
+    out.numentries = numentries
+    out.compression = context.tfile["_fCompress"]
+    out.clusters = clusters
+    out.aliases = dict((alias, branchname) for alias, branchname in aliases.items() if branchname in branchesinterp)
+    out.branches = OrderedDict()
+    for branchname, (branch, interpretation) in branchesinterp.items():
+        if interpretation is None:
+            raise ValueError("cannot interpret branch {0} as a Python type\n   in file: {1}".format(repr(branchname), context.sourcepath))
+        entryoffsets = branch._entryoffsetsarray()     # also recovers baskets that were never written out
+        out.branches[branchname] = {"title": branch.title,
+                                    "numentries": branch.numentries,
+                                    "compression": branch._fCompress,
+                                    "iofeatures": branch._tree_iofeatures,
+                                    "provenance": list(branch._provenance),
+                                    "countbranch": None if branch._countbranch is None else branch._countbranch.name,
+                                    "totbytes": int(getattr(branch, "_fTotBytes", 0)),
+                                    "zipbytes": int(getattr(branch, "_fZipBytes", 0)),
+                                    "seek": numpy.array(branch._fBasketSeek[: branch._numgoodbaskets], dtype=numpy.int64),
+                                    "bytes": numpy.array(branch._fBasketBytes[: branch._numgoodbaskets], dtype=numpy.int32),
+                                    "entryoffsets": entryoffsets,
+                                    "recovered": [dict(x.__dict__) for x in branch._recoveredbaskets],
+                                    "interpretation": interpretation}
+    out._interpretations = out._dumpinterpretations()
+    return out
+
+class TTreeMetadata(object):
+    # what reading some branches of a TTree needs from the TTree (basket positions and entry offsets, compression,
+    # interpretations), without the file's streamers or the rest of the TTree; pickles compactly, and tree() reads
+    # baskets directly, checking only the file's UUID in its header
+    __metaclass__ = type.__new__(type, "type", (type,), {})
+
+    version = 1
+
+    def __repr__(self):
+        return "<TTreeMetadata {0} with {1} branches at 0x{2:012x}>".format(repr(self.name), len(self.branches), id(self))
+
+    def _dumpinterpretations(self):
+        file = io.BytesIO()
+        pickler = _MetadataPickler(file, 2)
+        for branchname, fields in self.branches.items():
+            try:
+                pickler.dump(fields["interpretation"])
+            except ValueError as err:
+                raise ValueError("branch {0} can't be described without its file: {1}".format(repr(branchname), err))
+        return file.getvalue()
+
+    _scalars = ("title", "numentries", "compression", "iofeatures", "provenance", "countbranch", "totbytes", "zipbytes", "recovered")
+    _arrays = (("seek", numpy.int64), ("bytes", numpy.int32), ("entryoffsets", numpy.int64))
+
+    def __getstate__(self):
+        # one tuple of scalars per branch, and the basket arrays of all branches concatenated
+        branches = [(branchname, len(fields["seek"])) + tuple(fields[n] for n in self._scalars) for branchname, fields in self.branches.items()]
+        arrays = [numpy.concatenate([numpy.empty(0, dtype)] + [fields[n] for fields in self.branches.values()]) for n, dtype in self._arrays]
+        return {"version": self.version,
+                "path": self.path,
+                "name": self.name,
+                "title": self.title,
+                "uuid": self.uuid,
+                "numentries": self.numentries,
+                "compression": self.compression,
+                "clusters": self.clusters,
+                "aliases": self.aliases,
+                "branches": branches,
+                "arrays": arrays,
+                "interpretations": self._interpretations}
+
+    def __setstate__(self, state):
+        if state.get("version", None) != self.version:
+            raise ValueError("TTreeMetadata has version {0}, not {1}".format(repr(state.get("version", None)), self.version))
+        self.path = state["path"]
+        self.name = state["name"]
+        self.title = state["title"]
+        self.uuid = state["uuid"]
+        self.numentries = state["numentries"]
+        self.compression = state["compression"]
+        self.clusters = state["clusters"]
+        self.aliases = state["aliases"]
+        self._interpretations = state["interpretations"]
+        unpickler = _MetadataUnpickler(io.BytesIO(self._interpretations))
+        seek, basketbytes, entryoffsets = state["arrays"]
+        self.branches = OrderedDict()
+        start, offsetstart = 0, 0
+        for x in state["branches"]:
+            branchname, numgood = x[:2]
+            fields = self.branches[branchname] = dict(zip(self._scalars, x[2:]))
+            stop, offsetstop = start + numgood, offsetstart + numgood + len(fields["recovered"]) + 1
+            fields["seek"], fields["bytes"], fields["entryoffsets"] = seek[start:stop], basketbytes[start:stop], entryoffsets[offsetstart:offsetstop]
+            fields["interpretation"] = unpickler.load()
+            start, offsetstart = stop, offsetstop
+
+    def tree(self, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, **options):
+        source = uproot.rootio._opensource(uproot.rootio._fspath(self.path), localsource, xrootdsource, httpsource, options)
+        try:
+            if len(options) > 0:
+                raise TypeError("unrecognized options: {0}".format(", ".join(options)))
+            cursor = Cursor(0)
+            magic, fVersion = cursor.fields(source, uproot.rootio.ROOTDirectory._format1)
+            if magic != b"root":
+                raise ValueError("not a ROOT file (starts with {0} instead of 'root')\n   in file: {1}".format(repr(magic), self.path))
+            uuid = cursor.fields(source, uproot.rootio.ROOTDirectory._format2_small if fVersion < 1000000 else uproot.rootio.ROOTDirectory._format2_big)[-1]
+            if uuid != self.uuid:
+                raise ValueError("file {0} is not the one this TTreeMetadata describes (different UUID)".format(repr(self.path)))
+        except Exception:
+            source.dismiss()
+            raise
+        return _TTreeFromMetadata(self, source)
+
+class _TTreeFromMetadata(TTreeMethods):
+    def __init__(self, metadata, source):
+        self._context = uproot.rootio.ROOTDirectory._FileContext(metadata.path, [], {}, dict(uproot.rootio.builtin_classes), uproot.source.compressed.Compression(metadata.compression), {"_fUUID": metadata.uuid, "_fCompress": metadata.compression})
+        self._context.source = source
+        self._context.treename = metadata.name
+        self._context.treepath = metadata.name
+        self._context.speedbump = True
+        self._fName = metadata.name
+        self._fTitle = metadata.title
+        self._fEntries = metadata.numentries
+        self._clusters = metadata.clusters
+        self.aliases = dict(metadata.aliases)
+        self._fBranches = [_TBranchFromMetadata(branchname, fields, self._context, source) for branchname, fields in metadata.branches.items()]
+        self._branchlookup = {}
+        self._fill_branchlookup(self._branchlookup)
+        for branch, fields in zip(self._fBranches, metadata.branches.values()):
+            if fields["countbranch"] is not None:
+                branch._countbranch = self._branchlookup[fields["countbranch"]]
+
+    def __repr__(self):
+        return "<TTree {0} from metadata at 0x{1:012x}>".format(repr(self._fName), id(self))
+
+    def _clustermetadata(self):
+        return self._clusters
+
+class _TBranchFromMetadata(TBranchMethods):
+    def __init__(self, name, fields, context, source):
+        self._source = source
+        self._context = context
+        self._fName = name
+        self._fTitle = fields["title"]
+        self._fEntries = fields["numentries"]
+        self._fCompress = fields["compression"]
+        self._fTotBytes = fields["totbytes"]
+        self._fZipBytes = fields["zipbytes"]
+        self._fBranches = []
+        self._fLeaves = []
+        self._fBasketSeek = fields["seek"]
+        self._fBasketBytes = fields["bytes"]
+        self._fBasketEntry = fields["entryoffsets"]
+        self._fWriteBasket = self._numgoodbaskets = len(fields["seek"])
+        self._recoveredbaskets = []
+        for x in fields["recovered"]:
+            basket = TBranchMethods._RecoveredTBasket.__new__(TBranchMethods._RecoveredTBasket)
+            basket.__dict__.update(x)
+            self._recoveredbaskets.append(basket)
+        self._entryoffsets = fields["entryoffsets"].tolist()
+        self._recoverylock = None
+        self._streamer = None
+        self._interpretation = self._savedinterpretation = fields["interpretation"]
+        self._provenance = list(fields["provenance"])
+        self._countbranch = None
+        self._countleaf = None
+        self._tree_iofeatures = fields["iofeatures"]
+
+    def __repr__(self):
+        return "<TBranch {0} from metadata at 0x{1:012x}>".format(repr(self._fName), id(self))
+
 ################################################################ for lazy arrays
 
 class _LazyFiles(object):
-    def __init__(self, paths, treepath, branches, entrysteps, flatten, awkwardlib, basketcache, keycache, executor, persistvirtual, localsource, xrootdsource, httpsource, options):
+    def __init__(self, paths, treepath, branches, entrysteps, flatten, awkwardlib, basketcache, keycache, executor, persistvirtual, localsource, xrootdsource, httpsource, options, max_memory=None):
         self.paths = paths
         self.treepath = treepath
         self.branches = branches
@@ -1866,10 +2918,11 @@ class _LazyFiles(object):
         self.xrootdsource = xrootdsource
         self.httpsource = httpsource
         self.options = options
+        self.max_memory = max_memory
         self._init()
 
     def _init(self):
-        self.trees = cachetools.LRUCache(5)                                 # last 5 TTrees
+        self.interpretations = {}                                           # TTrees themselves are in uproot.rootio.filepool
         if self.basketcache is None:
             self.basketcache = uproot.cache.ThreadSafeArrayCache(1024**2)   # 1 MB
         if self.keycache is None:
@@ -1903,18 +2956,30 @@ class _LazyFiles(object):
         self.xrootdsource = state["xrootdsource"]
         self.httpsource = state["httpsource"]
         self.options = state["options"]
+        self.max_memory = None
         self._init()
 
     def __call__(self, pathi, branchname):
         awkward = _normalize_awkwardlib(self.awkwardlib)
-        tree = self.trees.get(self.paths[pathi], None)
-        if tree is None:
-            tree = self.trees[self.paths[pathi]] = uproot.rootio.open(self.paths[pathi])[self.treepath]
-            tree.interpretations = dict((b.name, x) for b, x in tree._normalize_branches(self.branches, awkward))
-        return tree[branchname].lazyarray(interpretation=tree.interpretations[branchname], entrysteps=self.entrysteps, entrystart=None, entrystop=None, flatten=self.flatten, awkwardlib=awkward, cache=None, basketcache=self.basketcache, keycache=self.keycache, executor=self.executor, persistvirtual=self.persistvirtual)
+        path = self.paths[pathi]
+        tree = uproot.rootio.filepool.tree(path, self.treepath, localsource=self.localsource, xrootdsource=self.xrootdsource, httpsource=self.httpsource, **self.options)
+        try:
+            interpretations = self.interpretations.get(path, None)
+            if interpretations is None:
+                interpretations = self.interpretations[path] = dict((b.name, x) for b, x in tree._normalize_branches(self.branches, awkward))
+            return tree[branchname].lazyarray(interpretation=interpretations[branchname], entrysteps=self.entrysteps, entrystart=None, entrystop=None, flatten=self.flatten, awkwardlib=awkward, cache=None, basketcache=self.basketcache, keycache=self.keycache, executor=self.executor, persistvirtual=self.persistvirtual, max_memory=self.max_memory)
+        finally:
+            uproot.rootio.filepool.release(tree)
+
+def _frompool(obj):
+    # (pool, path, options) to get obj's file back from, if it was opened through a FilePool
+    pool = getattr(obj._context, "pool", None)
+    if pool is None:
+        return None, None, None
+    return pool, obj._context.poolkey[0], obj._context.poolargs
 
 class _LazyTree(object):
-    def __init__(self, path, treepath, tree, interpretation, flatten, awkwardlib, basketcache, keycache, executor):
+    def __init__(self, path, treepath, tree, interpretation, flatten, awkwardlib, basketcache, keycache, executor, max_memory=None, entries=None):
         self.path = path
         self.treepath = treepath
         self.tree = tree
@@ -1924,22 +2989,48 @@ class _LazyTree(object):
         self.basketcache = basketcache
         self.keycache = keycache
         self.executor = executor
+        self.max_memory = max_memory
+        self.entries = entries
+        self.metadata = None
         self._init()
 
     def _init(self):
+        # a TTree from a FilePool (or an unpickled one) is taken from the pool for each read, so that idle files can be closed
         if self.tree is None:
-            self.tree = uproot.rootio.open(self.path)[self.treepath]
+            self.pool, self.poolargs = uproot.rootio.filepool, {}
+        else:
+            self.pool, path, self.poolargs = _frompool(self.tree)
+            if self.pool is not None:
+                self.path, self.tree = path, None
         if self.basketcache is None:
             self.basketcache = uproot.cache.ThreadSafeArrayCache(1024**2)   # 1 MB
         if self.keycache is None:
             self.keycache = {}                                              # unlimited
+        self.prefetched = {}
+
+    def _metadata(self):
+        # TTreeMetadata of the branches, so that an unpickled copy reads baskets without reading the TTree again
+        if self.metadata is None:
+            tree, pooled = self.tree, self.tree is None
+            if pooled:
+                tree = self.pool.tree(self.path, self.treepath, **self.poolargs)
+            try:
+                self.metadata = tree.metadata(self.interpretation)
+            except ValueError:
+                self.metadata = False           # needs the file's streamers; the file will be opened
+            finally:
+                if pooled:
+                    self.pool.release(tree)
+        return self.metadata or None
 
     def __getstate__(self):
         return {"path": self.path,
                 "treepath": self.treepath,
                 "interpretation": self.interpretation,
                 "flatten": self.flatten,
-                "awkwardlib": self.awkwardlib}
+                "awkwardlib": self.awkwardlib,
+                "entries": self.entries,
+                "metadata": self._metadata()}
 
     def __setstate__(self, state):
         self.path = state["path"]
@@ -1951,13 +3042,42 @@ class _LazyTree(object):
         self.basketcache = None
         self.keycache = None
         self.executor = None
+        self.max_memory = None
+        self.entries = state.get("entries", None)
+        self.metadata = state.get("metadata", None)
         self._init()
 
     def __call__(self, branch, entrystart, entrystop):
-        return self.tree[branch].array(interpretation=self.interpretation[branch], entrystart=entrystart, entrystop=entrystop, flatten=self.flatten, awkwardlib=self.awkwardlib, cache=None, basketcache=self.basketcache, keycache=self.keycache, executor=self.executor)
+        out = self.prefetched.pop((branch, entrystart, entrystop), None)
+        if out is not None:
+            return out
+        tree, pooled = self.tree, False
+        if tree is None and self.metadata:
+            tree = self.tree = self.metadata.tree()
+        elif tree is None:
+            tree, pooled = self.pool.tree(self.path, self.treepath, **self.poolargs), True
+        try:
+            tbranch = tree[branch]
+            entries = self.entries
+            if entries is not None:
+                # only this chunk's entries, so that each chunk doesn't check and search all of them
+                entries = entries[numpy.searchsorted(entries, entrystart) : numpy.searchsorted(entries, entrystop)]
+            with _budgeted(self.max_memory, [(tbranch, self.interpretation[branch])], entrystart, entrystop, self.keycache):
+                return tbranch.array(interpretation=self.interpretation[branch], entrystart=entrystart, entrystop=entrystop, flatten=self.flatten, awkwardlib=self.awkwardlib, cache=None, basketcache=self.basketcache, keycache=self.keycache, executor=self.executor, entries=entries)
+        finally:
+            if pooled:
+                self.pool.release(tree)
+
+    def prefetch(self, branch, steps, counts):
+        # reads adjacent (entrystart, entrystop) steps of a branch in one call, for __call__ to hand out in pieces
+        array = self(branch, steps[0][0], steps[-1][1])
+        offset = 0
+        for (entrystart, entrystop), count in zip(steps, counts):
+            self.prefetched[branch, entrystart, entrystop] = array[offset : offset + count]
+            offset += count
 
 class _LazyBranch(object):
-    def __init__(self, path, treepath, branchname, branch, interpretation, flatten, awkwardlib, basketcache, keycache, executor):
+    def __init__(self, path, treepath, branchname, branch, interpretation, flatten, awkwardlib, basketcache, keycache, executor, max_memory=None):
         self.path = path
         self.treepath = treepath
         self.branchname = branchname
@@ -1968,23 +3088,47 @@ class _LazyBranch(object):
         self.basketcache = basketcache
         self.keycache = keycache
         self.executor = executor
+        self.max_memory = max_memory
+        self.metadata = None
         self._init()
 
     def _init(self):
+        # as in _LazyTree, a pooled (or unpickled) TBranch is looked up in the pool for each read
         if self.branch is None:
-            self.branch = uproot.rootio.open(self.path)[self.treepath][self.branchname]
+            self.pool, self.poolargs = uproot.rootio.filepool, {}
+        else:
+            self.pool, path, self.poolargs = _frompool(self.branch)
+            if self.pool is not None:
+                self.path, self.branch = path, None
         if self.basketcache is None:
             self.basketcache = uproot.cache.ThreadSafeArrayCache(1024**2)   # 1 MB
         if self.keycache is None:
             self.keycache = {}                                              # unlimited
 
+    def _metadata(self):
+        if self.metadata is None:
+            branch, pooled = self.branch, self.branch is None
+            if pooled:
+                tree = self.pool.tree(self.path, self.treepath, **self.poolargs)
+            try:
+                if pooled:
+                    branch = tree[self.branchname]
+                self.metadata = _treemetadata(branch._context, self.treepath, b"", branch.numentries, None, {}, [(branch, self.interpretation)])
+            except ValueError:
+                self.metadata = False
+            finally:
+                if pooled:
+                    self.pool.release(tree)
+        return self.metadata or None
+
     def __getstate__(self):
         return {"path": self.path,
                 "treepath": self.treepath,
                 "branchname": self.branchname,
                 "interpretation": self.interpretation,
                 "flatten": self.flatten,
-                "awkwardlib": self.awkwardlib}
+                "awkwardlib": self.awkwardlib,
+                "metadata": self._metadata()}
 
     def __setstate__(self, state):
         self.path = state["path"]
@@ -1997,45 +3141,233 @@ class _LazyBranch(object):
         self.basketcache = None
         self.keycache = None
         self.executor = None
+        self.max_memory = None
+        self.metadata = state.get("metadata", None)
         self._init()
 
     def __call__(self, entrystart, entrystop):
-        return self.branch.array(interpretation=self.interpretation, entrystart=entrystart, entrystop=entrystop, flatten=self.flatten, awkwardlib=self.awkwardlib, cache=None, basketcache=self.basketcache, keycache=self.keycache, executor=self.executor, blocking=True)
+        branch, pooled = self.branch, False
+        if branch is None and self.metadata:
+            branch = self.branch = self.metadata.tree()[self.branchname]
+        elif branch is None:
+            tree, pooled = self.pool.tree(self.path, self.treepath, **self.poolargs), True
+        try:
+            if pooled:
+                branch = tree[self.branchname]
+            with _budgeted(self.max_memory, [(branch, self.interpretation)], entrystart, entrystop, self.keycache):
+                return branch.array(interpretation=self.interpretation, entrystart=entrystart, entrystop=entrystop, flatten=self.flatten, awkwardlib=self.awkwardlib, cache=None, basketcache=self.basketcache, keycache=self.keycache, executor=self.executor, blocking=True)
+        finally:
+            if pooled:
+                self.pool.release(tree)
+
+_LAZYBATCH = 16 * 1024**2      # most uncompressed bytes to read at once for adjacent chunks of a lazy array
+
+class _LazyChunks(object):
+    # the chunks of one column of a lazy table, as a sequence that makes each VirtualArray when it's first
+    # accessed; steps (an array) and counts are the same objects for all columns of the table
+    def __init__(self, awkward, generator, key, steps, counts, VirtualArray, type, cache, persistvirtual, entrybytes):
+        self.awkward = awkward
+        self.generator = generator
+        self.key = key
+        self.steps = steps                      # (entrystart, entrystop) of each chunk, or None for one chunk per file
+        self.counts = counts
+        self.VirtualArray = VirtualArray
+        self.type = type
+        self.cache = cache
+        self.persistvirtual = persistvirtual
+        self.entrybytes = entrybytes            # None if adjacent chunks can't be read together
+        self.made = {}
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __iter__(self):
+        for i in range(len(self.counts)):
+            yield self._chunk(i)
+
+    def __getitem__(self, where):
+        if isinstance(where, slice):
+            return [self._chunk(i) for i in range(*where.indices(len(self.counts)))]
+        i = int(where)
+        if i < 0:
+            i += len(self.counts)
+        if not 0 <= i < len(self.counts):
+            raise IndexError("chunk index {0} out of range for {1} chunks".format(where, len(self.counts)))
+        return self._chunk(i)
+
+    def _chunk(self, i):
+        out = self.made.get(i, None)
+        if out is None:
+            if self.steps is None:
+                args = (i, self.key)
+            else:
+                args = (self.key, int(self.steps[i, 0]), int(self.steps[i, 1]))
+            out = self.made[i] = self.VirtualArray(self.generator, args, cache=self.cache, type=self.awkward.type.ArrayType(self.counts[i], self.type), persistvirtual=self.persistvirtual)
+        return out
 
-def lazyarray(path, treepath, branchname, interpretation=None, namedecode="utf-8", entrysteps=float("inf"), flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, persistvirtual=False, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, **options):
+    def batch(self, start):
+        # chunk ids from start that would be read together
+        stop = start + 1
+        if self.entrybytes is not None:
+            numbytes = self.counts[start] * self.entrybytes
+            while stop < len(self.counts) and numbytes + self.counts[stop] * self.entrybytes <= _LAZYBATCH:
+                numbytes += self.counts[stop] * self.entrybytes
+                stop += 1
+        return range(start, stop)
+
+    def fetch(self, chunkids):
+        # materializes these chunks (in increasing order), reading runs of adjacent ones in one call each
+        if self.entrybytes is None:
+            return
+        run, numbytes = [], 0
+        for i in chunkids:
+            if self._chunk(i).ismaterialized:
+                continue
+            if len(run) > 0 and (i != run[-1] + 1 or numbytes + self.counts[i] * self.entrybytes > _LAZYBATCH):
+                self._read(run)
+                run, numbytes = [], 0
+            run.append(i)
+            numbytes += self.counts[i] * self.entrybytes
+        self._read(run)
+
+    def _read(self, run):
+        if len(run) > 1:
+            self.generator.prefetch(self.key, [(int(self.steps[i, 0]), int(self.steps[i, 1])) for i in run], [self.counts[i] for i in run])
+        for i in run:
+            self._chunk(i).materialize()
+
+_lazychunkedarrays = {}
+
+def _lazychunkedarray(awkward):
+    # ChunkedArray class (for this awkward library) that can hold _LazyChunks: they're checked without making
+    # every chunk, and slices and conversions to Numpy or iteration read the chunks they need in batches
+    if awkward.__name__ in _lazychunkedarrays:
+        return _lazychunkedarrays[awkward.__name__]
+
+    class ChunkedArray(awkward.ChunkedArray):
+        def __init__(self, chunks, chunksizes, offsets):
+            self._chunks = chunks
+            self._types = [None] * len(chunks)
+            self._chunksizes = chunksizes
+            self._offsets = offsets
+
+        def copy(self, chunks=None, chunksizes=None):
+            # without making every chunk: new chunks (such as the pieces of a slice) make an ordinary ChunkedArray
+            if isinstance(self._chunks, _LazyChunks) and chunks is not None:
+                return awkward.ChunkedArray(chunks, [] if chunksizes is None else chunksizes)
+            elif isinstance(self._chunks, _LazyChunks) and chunksizes is None:
+                return self.__class__(self._chunks, self._chunksizes, self._offsets)
+            else:
+                return awkward.ChunkedArray.copy(self, chunks=chunks, chunksizes=chunksizes)
+
+        def _valid(self):
+            if isinstance(self._chunks, _LazyChunks):
+                self._gettype({})               # chunk sizes agree by construction
+            else:
+                awkward.ChunkedArray._valid(self)
+
+        def _inbatches(self):
+            # chunk ids in order, each batch of adjacent chunks read before the first of them is used
+            for i in range(len(self._chunks)):
+                if not self._chunks[i].ismaterialized:
+                    self._chunks.fetch(self._chunks.batch(i))
+                yield i
+
+        def __getitem__(self, where):
+            if isinstance(self._chunks, _LazyChunks) and self._chunks.entrybytes is not None and not self._util_isstringslice(where):
+                head = where[0] if isinstance(where, tuple) and len(where) > 0 else where
+                entries = None
+                if isinstance(head, slice):
+                    entries = range(*head.indices(len(self)))
+                    if len(entries) > 0:
+                        entries = [min(entries[0], entries[-1]), max(entries[0], entries[-1])]
+                        chunkids = range(self.numpy.searchsorted(self.offsets, entries[0], "right") - 1, self.numpy.searchsorted(self.offsets, entries[1], "right"))
+                        self._chunks.fetch(chunkids)
+                elif isinstance(head, (list, self.numpy.ndarray)):
+                    head = self.numpy.asarray(head)
+                    if len(head.shape) == 1 and head.dtype == self.numpy.bool_ and len(head) == len(self):
+                        self._fetchall()                # a mask touches every chunk
+                    elif len(head.shape) == 1 and issubclass(head.dtype.type, self.numpy.integer):
+                        entries = self.numpy.where(head < 0, head + len(self), head)
+                        entries = entries[(entries >= 0) & (entries < len(self))]
+                    if entries is not None:
+                        self._chunks.fetch(self.numpy.unique(self.numpy.searchsorted(self.offsets, entries, "right") - 1))
+            return awkward.ChunkedArray.__getitem__(self, where)
+
+        def _fetchall(self):
+            # only if all chunks will be kept anyway: with a cache, early batches might be evicted before they're used
+            if self._chunks.cache is None:
+                self._chunks.fetch(range(len(self._chunks)))
+
+        def _reduce(self, ufunc, identity, dtype):
+            if isinstance(self._chunks, _LazyChunks) and self._chunks.entrybytes is not None:
+                self._fetchall()
+            return awkward.ChunkedArray._reduce(self, ufunc, identity, dtype)
+
+        def __iter__(self, checkiter=True):
+            if not isinstance(self._chunks, _LazyChunks):
+                for x in awkward.ChunkedArray.__iter__(self, checkiter=checkiter):
+                    yield x
+                return
+            if checkiter:
+                self._checkiter()
+            for i in self._inbatches():
+                for x in self._chunks[i]:
+                    yield x
+
+        def __array__(self, *args, **kwargs):
+            if isinstance(self._chunks, _LazyChunks) and isinstance(self.type.to, self.numpy.dtype) and len(self) > 0:
+                self._checktonumpy()
+                out = self.numpy.empty(self.shape, dtype=self.dtype)
+                slices = self._slices()
+                for i in self._inbatches():
+                    out[slices[i]] = self._chunks[i]
+                return out
+            return awkward.ChunkedArray.__array__(self, *args, **kwargs)
+
+    _lazychunkedarrays[awkward.__name__] = ChunkedArray
+    return ChunkedArray
+
+def lazyarray(path, treepath, branchname, interpretation=None, namedecode="utf-8", entrysteps=float("inf"), flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, persistvirtual=False, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, max_memory=None, **options):
     if interpretation is None:
         branches = branchname
     else:
         branches = {branchname: interpretation}
-    out = lazyarrays(path, treepath, branches=branches, namedecode=namedecode, entrysteps=entrysteps, flatten=flatten, profile=None, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, persistvirtual=persistvirtual, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, **options)
+    out = lazyarrays(path, treepath, branches=branches, namedecode=namedecode, entrysteps=entrysteps, flatten=flatten, profile=None, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, persistvirtual=persistvirtual, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, max_memory=max_memory, **options)
     if len(out.columns) != 1:
         raise ValueError("list of branch names or glob/regex matches more than one branch; use uproot.lazyarrays (plural)")
     return out[out.columns[0]]
 
-def lazyarrays(path, treepath, branches=None, namedecode="utf-8", entrysteps=float("inf"), flatten=False, profile=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, persistvirtual=False, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, **options):
+def lazyarrays(path, treepath, branches=None, namedecode="utf-8", entrysteps=float("inf"), flatten=False, profile=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, persistvirtual=False, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, max_memory=None, **options):
     awkward = _normalize_awkwardlib(awkwardlib)
-    if isinstance(path, string_types):
-        paths = _filename_explode(path)
-    else:
-        paths = [y for x in path for y in _filename_explode(x)]
+    paths = _paths(path)
+    if isinstance(path, Manifest):
+        # files without the TTree are left out, rather than opened again
+        paths = [x for x in paths if path.files[x]["hastree"]]
 
     path2count = numentries(path, treepath, total=False, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, executor=executor, blocking=True)
 
-    lazyfiles = _LazyFiles(paths, treepath, branches, entrysteps, flatten, awkward.__name__, basketcache, keycache, executor, persistvirtual, localsource, xrootdsource, httpsource, options)
+    lazyfiles = _LazyFiles(paths, treepath, branches, entrysteps, flatten, awkward.__name__, basketcache, keycache, executor, persistvirtual, localsource, xrootdsource, httpsource, options, _normalize_max_memory(max_memory))
 
     brancheslist = None
     for path in paths:
-        file = uproot.rootio.open(path, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, **options)
         try:
-            tree = file[treepath]
+            tree = uproot.rootio.filepool.tree(path, treepath, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, **options)
         except KeyError:
             continue
-        brancheslist = list(tree._normalize_branches(branches, awkward))
+        try:
+            brancheslist = list(tree._normalize_branches(branches, awkward))
+        finally:
+            uproot.rootio.filepool.release(tree)
         break
 
     if brancheslist is None:
         raise ValueError("no matching paths contained a tree named {0}".format(repr(treepath)))
 
+    counts = [path2count[path] for path in paths]
+    offsets = awkward.JaggedArray.counts2offsets(counts)
+    LazyChunkedArray = _lazychunkedarray(awkward)
+
     out = awkward.Table()
     for branch, interpretation in brancheslist:
         inner = interpretation
@@ -2048,47 +3380,157 @@ def lazyarrays(path, treepath, branches=None, namedecode="utf-8", entrysteps=flo
         else:
             VirtualArray = awkward.VirtualArray
 
-        chunks = []
-        counts = []
-        for pathi, path in enumerate(paths):
-            chunks.append(VirtualArray(lazyfiles, (pathi, branch.name), cache=cache, type=awkward.type.ArrayType(path2count[path], interpretation.type), persistvirtual=persistvirtual))
-            counts.append(path2count[path])
         name = branch.name.decode("ascii") if namedecode is None else branch.name.decode(namedecode)
-        out[name] = awkward.ChunkedArray(chunks, counts)
+        out[name] = LazyChunkedArray(_LazyChunks(awkward, lazyfiles, branch.name, None, counts, VirtualArray, interpretation.type, cache, persistvirtual, None), counts, offsets)
 
     if profile is not None:
         out = uproot_methods.profiles.transformer(profile)(out)
     return out
 
+class _DaskPartition(object):
+    # reads one (path, entrystart, entrystop, globalentrystart) range of all requested branches in one task;
+    # branches are resolved again in each process, since interpretations may refer to a file's own classes
+    def __init__(self, treepath, branches, namedecode, flatten, awkwardlib, cache, keycache, localsource, xrootdsource, httpsource, options):
+        self.treepath = treepath
+        self.branches = branches
+        self.namedecode = namedecode
+        self.flatten = flatten
+        self.awkwardlib = awkwardlib
+        self.cache = cache
+        self.keycache = keycache
+        self.localsource = localsource
+        self.xrootdsource = xrootdsource
+        self.httpsource = httpsource
+        self.options = options
+        self._interpretations = {}
+
+    def __getstate__(self):
+        return {"treepath": self.treepath,
+                "branches": self.branches,
+                "namedecode": self.namedecode,
+                "flatten": self.flatten,
+                "awkwardlib": self.awkwardlib,
+                "localsource": self.localsource,
+                "xrootdsource": self.xrootdsource,
+                "httpsource": self.httpsource,
+                "options": self.options}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.cache = None
+        self.keycache = None
+        self._interpretations = {}
+
+    def _tree(self, path):
+        # from uproot.rootio.filepool, so that a file's partitions in this process don't each open it; release when done
+        tree = uproot.rootio.filepool.tree(path, self.treepath, localsource=self.localsource, xrootdsource=self.xrootdsource, httpsource=self.httpsource, **self.options)
+        interpretations = self._interpretations.get(path, None)
+        if interpretations is None:
+            awkward = _normalize_awkwardlib(self.awkwardlib)
+            try:
+                interpretations = self._interpretations[path] = OrderedDict((branch.name, interpretation) for branch, interpretation in tree._normalize_branches(self.branches, awkward))
+            except Exception:
+                uproot.rootio.filepool.release(tree)
+                raise
+        return tree, interpretations
+
+    def frame(self, part):
+        # DataFrame indexed by global entry number; flattened jagged branches add a "subentry" column
+        path, entrystart, entrystop, globalentrystart = part
+        import pandas
+        tree, interpretations = self._tree(path)
+        try:
+            out = tree.arrays(interpretations, outputtype=pandas.DataFrame, namedecode=self.namedecode, entrystart=entrystart, entrystop=entrystop, flatten=self.flatten, awkwardlib=self.awkwardlib, cache=self.cache, keycache=self.keycache)
+        finally:
+            uproot.rootio.filepool.release(tree)
+        if type(out.index).__name__ == "MultiIndex":
+            out = out.reset_index(level=1)
+        out.index = out.index + globalentrystart
+        return out
+
+    def array(self, part, branchname):
+        path, entrystart, entrystop, globalentrystart = part
+        tree, interpretations = self._tree(path)
+        try:
+            return tree[branchname].array(interpretations[branchname], entrystart=entrystart, entrystop=entrystop, flatten=self.flatten, awkwardlib=self.awkwardlib, cache=self.cache, keycache=self.keycache)
+        finally:
+            uproot.rootio.filepool.release(tree)
+
+def _daskparts(path, treepath, branches, entrysteps, awkward, keycache, executor, localsource, xrootdsource, httpsource, options):
+    # (path, entrystart, entrystop, globalentrystart) of each non-empty step, as in iterate
+    out = []
+    if isinstance(entrysteps, (numbers.Integral, numpy.integer)) or (isinstance(entrysteps, float) and entrysteps == float("inf")):
+        # only the numbers of entries are needed
+        if isinstance(entrysteps, (numbers.Integral, numpy.integer)) and entrysteps <= 0:
+            raise ValueError("if an integer, entrysteps must be positive")
+        globalentrystart = 0
+        for thispath, count in numentries(path, treepath, total=False, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, executor=executor, **options).items():
+            step = count if entrysteps == float("inf") else int(entrysteps)
+            for start in range(0, count, max(step, 1)):
+                out.append((thispath, start, min(start + step, count), globalentrystart))
+            globalentrystart += count
+    else:
+        for tree, branchesinterp, globalentrystart, thispath, thisfile in _iterate(path, treepath, branches, awkward, localsource, xrootdsource, httpsource, close=True, **options):
+            for start, stop in tree._normalize_entrysteps(entrysteps, branchesinterp, 0, tree.numentries, keycache):
+                if start < stop:
+                    out.append((thispath, start, stop, globalentrystart))
+    return out
+
 def daskarray(path, treepath, branchname, interpretation=None, namedecode="utf-8", entrysteps=float("inf"), flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, **options):
-    out = lazyarray(path, treepath, branchname, interpretation=interpretation, namedecode=namedecode, entrysteps=entrysteps, flatten=flatten, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, persistvirtual=False, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, **options)
     import dask.array
-    if len(out.shape) == 1:
-        return dask.array.from_array(out, out.shape, fancy=True)
+    awkward = _normalize_awkwardlib(awkwardlib)
+    branches = branchname if interpretation is None else {branchname: interpretation}
+    parts = _daskparts(path, treepath, branches, entrysteps, awkward, keycache, executor, localsource, xrootdsource, httpsource, options)
+    if len(parts) == 0:
+        raise ValueError("no matching paths contained a tree named {0} with entries".format(repr(treepath)))
+    reader = _DaskPartition(treepath, branches, namedecode, flatten, awkward.__name__, cache, keycache, localsource, xrootdsource, httpsource, options)
+
+    tree, interpretations = reader._tree(parts[0][0])
+    if len(interpretations) != 1:
+        raise ValueError("list of branch names or glob/regex matches more than one branch; use uproot.daskframe")
+    name, interpretation = list(interpretations.items())[0]
+    inner = interpretation.content if isinstance(interpretation, asjagged) and flatten else interpretation
+    if not isinstance(inner, asdtype) or inner.todtype.names is not None:
+        raise NotImplementedError("daskarray is for branches of numbers, possibly multidimensional (or jagged with flatten=True), not {0}".format(interpretation))
+
+    # the graph has one task per step, with chunk sizes known unless jagged arrays are flattened
+    from dask.base import tokenize
+    token = "uproot-daskarray-" + tokenize(treepath, name, flatten, parts)
+    graph = dict(((token, i) + (0,) * len(inner.todims), (reader.array, part, name)) for i, part in enumerate(parts))
+    if inner is interpretation:
+        lengths = tuple(stop - start for path, start, stop, globalentrystart in parts)
     else:
-        raise NotImplementedError("TODO: len(shape) > 1")
+        lengths = (float("nan"),) * len(parts)
+    return dask.array.Array(graph, token, (lengths,) + tuple((x,) for x in inner.todims), dtype=inner.todtype.base)
 
 def daskframe(path, treepath, branches=None, namedecode="utf-8", entrysteps=float("inf"), flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, **options):
-    import dask.array
     import dask.dataframe
-    out = lazyarrays(path, treepath, branches=branches, namedecode=namedecode, entrysteps=entrysteps, flatten=flatten, profile=None, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, persistvirtual=False, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, **options)
-    series = []
-    for n in out.columns:
-        x = out[n]
-        if len(x.shape) == 1:
-            array = dask.array.from_array(x, x.shape, fancy=True)
-            series.append(dask.dataframe.from_dask_array(array, columns=n))
-        else:
-            raise NotImplementedError("TODO: len(shape) > 1")
-    return dask.dataframe.concat(series, axis=1)
+    awkward = _normalize_awkwardlib(awkwardlib)
+    parts = _daskparts(path, treepath, branches, entrysteps, awkward, keycache, executor, localsource, xrootdsource, httpsource, options)
+    if len(parts) == 0:
+        raise ValueError("no matching paths contained a tree named {0} with entries".format(repr(treepath)))
+    reader = _DaskPartition(treepath, branches, namedecode, flatten, awkward.__name__, cache, keycache, localsource, xrootdsource, httpsource, options)
+
+    # columns and types from the first entry; partitions are indexed by global entry number
+    path, start, stop, globalentrystart = parts[0]
+    meta = reader.frame((path, start, start + 1, globalentrystart)).iloc[:0]
+    divisions = [globalentrystart + start for path, start, stop, globalentrystart in parts]
+    divisions.append(parts[-1][3] + parts[-1][2] - 1)
+
+    if hasattr(dask.dataframe, "from_map"):
+        return dask.dataframe.from_map(reader.frame, parts, meta=meta, divisions=divisions, label="uproot-daskframe", enforce_metadata=False)
+    else:
+        import dask
+        return dask.dataframe.from_delayed([dask.delayed(reader.frame)(part) for part in parts], meta=meta, divisions=divisions)
 
 ################################################################ for quickly getting numentries
 
 def numentries(path, treepath, total=True, localsource=MemmapSource.defaults, xrootdsource={"timeout": None, "chunkbytes": 32*1024, "limitbytes": 1024**2, "parallel": False}, httpsource={"chunkbytes": 32*1024, "limitbytes": 1024**2, "parallel": False}, executor=None, blocking=True, **options):
-    if isinstance(path, string_types):
-        paths = _filename_explode(path)
-    else:
-        paths = [y for x in path for y in _filename_explode(x)]
+    if isinstance(path, Manifest):
+        path._checktreepath(treepath)
+        out = path.numentries(total)
+        return out if blocking else lambda: out
+    paths = _paths(path)
     return _numentries(paths, treepath, total, localsource, xrootdsource, httpsource, executor, blocking, [None] * len(paths), options)
 
 def _numentries(paths, treepath, total, localsource, xrootdsource, httpsource, executor, blocking, uuids, options):
@@ -2146,3 +3588,276 @@ def _numentries(paths, treepath, total, localsource, xrootdsource, httpsource, e
         return wait()
     else:
         return wait
+
+################################################################ for scanning many files once
+
+class Manifest(object):
+    # what iterate, lazyarrays, and numentries would otherwise discover by opening files: for each
+    # file, its UUID, number of entries, and the selected branches' interpretations, sizes, and cluster
+    # boundaries, all from TTree metadata; saved as JSON, so that a dataset is scanned once
+    version = 1
+
+    def __init__(self, path=None):
+        self.path = path
+        self.treepath = None
+        self.branches = None
+        self.files = OrderedDict()
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __repr__(self):
+        return "<Manifest of {0} files with {1} entries at 0x{2:012x}>".format(len(self.files), self.numentries(), id(self))
+
+    def __len__(self):
+        return len(self.files)
+
+    @property
+    def paths(self):
+        return list(self.files)
+
+    def numentries(self, total=True):
+        if total:
+            return sum(x["numentries"] for x in self.files.values())
+        else:
+            return OrderedDict((path, x["numentries"]) for path, x in self.files.items())
+
+    @staticmethod
+    def _name(name):
+        # branch names are bytes; latin-1 turns them into JSON strings and back without loss
+        return name.decode("latin-1")
+
+    @staticmethod
+    def _selection(branches):
+        # the branches argument of scan as JSON, or False if it can't be compared with a saved one
+        if branches is None:
+            return None
+        elif isinstance(branches, string_types):
+            return [Manifest._name(_bytesid(branches))]
+        elif isinstance(branches, (list, tuple)) and all(isinstance(x, string_types) for x in branches):
+            return [Manifest._name(_bytesid(x)) for x in branches]
+        else:
+            return False
+
+    @staticmethod
+    def _stat(path):
+        # (size, modification time) of a local file, for noticing that it changed; (None, None) if remote
+        if _bytesid(path).startswith(b"root://") or _bytesid(path).startswith(b"http://") or _bytesid(path).startswith(b"https://"):
+            return None, None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None, None
+        return stat.st_size, stat.st_mtime
+
+    def _uptodate(self, path, treepath, selection):
+        entry = self.files.get(path, None)
+        if entry is None or selection is False or self.branches != selection or self.treepath != Manifest._name(_bytesid(treepath)):
+            return False
+        size, mtime = self._stat(path)
+        return size is None or (entry["size"] == size and entry["mtime"] == mtime)
+
+    def _checktreepath(self, treepath):
+        if Manifest._name(_bytesid(treepath)) != self.treepath:
+            raise ValueError("manifest describes TTree {0}, not {1}".format(repr(self.treepath), repr(treepath)))
+
+    def _check(self, path, tree):
+        # raises if the file no longer matches what was scanned
+        entry = self.files[path]
+        if entry["uuid"] != base64.b64encode(tree._context.uuid).decode("ascii") or entry["numentries"] != tree.numentries:
+            raise ValueError("file {0} changed since it was scanned; scan it again".format(repr(path)))
+
+    def _bytesperentry(self, path, names):
+        # average uncompressed bytes per entry of the named branches, or None if any of them wasn't scanned
+        entry = self.files.get(path, None)
+        if entry is None or entry["numentries"] == 0:
+            return None
+        total = 0
+        for name in names:
+            branch = entry["branches"].get(Manifest._name(name), None)
+            if branch is None:
+                return None
+            total += branch["uncompressedbytes"]
+        return float(total) / entry["numentries"]
+
+    def save(self, path=None):
+        if path is None:
+            path = self.path
+        if path is None:
+            raise ValueError("no path given for the Manifest file")
+        with open(path, "w") as file:
+            json.dump({"version": self.version, "treepath": self.treepath, "branches": self.branches, "files": [dict(path=path, **entry) for path, entry in self.files.items()]}, file)
+
+    def load(self, path):
+        with open(path) as file:
+            data = json.load(file, object_pairs_hook=OrderedDict)
+        if data.get("version", None) != self.version:
+            raise ValueError("Manifest file {0} has version {1}, not {2}".format(repr(path), repr(data.get("version", None)), self.version))
+        self.treepath = data["treepath"]
+        self.branches = data["branches"]
+        self.files = OrderedDict()
+        for entry in data["files"]:
+            self.files[entry.pop("path")] = entry
+
+def _scanfile(path, treepath, branches, awkward, localsource, xrootdsource, httpsource, options):
+    size, mtime = Manifest._stat(path)
+    file = uproot.rootio.filepool.open(path, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, **options)
+    try:
+        out = OrderedDict([("uuid", base64.b64encode(file._context.uuid).decode("ascii")), ("size", size), ("mtime", mtime)])
+        try:
+            tree = file[treepath]
+        except KeyError:
+            out["hastree"], out["numentries"], out["clusters"], out["branches"] = False, 0, None, OrderedDict()
+            return out
+
+        selected = list(tree._normalize_branches(branches, awkward))
+        boundaries = tree._clusterboundaries(selected)
+        out["hastree"], out["numentries"] = True, tree.numentries
+        out["clusters"] = None if boundaries is None else boundaries.tolist()
+        out["branches"] = OrderedDict()
+        for branch, interpretation in selected:
+            # totals from the TBranch itself, rather than from every TBasket's key
+            out["branches"][Manifest._name(branch.name)] = OrderedDict([("interpretation", None if interpretation is None else interpretation.identifier),
+                                                                        ("compressedbytes", int(getattr(branch, "_fZipBytes", 0))),
+                                                                        ("uncompressedbytes", int(getattr(branch, "_fTotBytes", 0)))])
+        return out
+    finally:
+        uproot.rootio.filepool.release(file)
+
+def scan(path, treepath, branches=None, awkwardlib=None, executor=None, blocking=True, manifest=None, localsource=MemmapSource.defaults, xrootdsource={"timeout": None, "chunkbytes": 32*1024, "limitbytes": 1024**2, "parallel": False}, httpsource={"chunkbytes": 32*1024, "limitbytes": 1024**2, "parallel": False}, **options):
+    awkward = _normalize_awkwardlib(awkwardlib)
+    paths = _paths(path)
+
+    if manifest is None or isinstance(manifest, string_types):
+        manifest = Manifest(manifest)
+    selection = Manifest._selection(branches)
+
+    # files that were scanned with the same treepath and branches and haven't changed are not opened
+    out = [manifest.files[x] if manifest._uptodate(x, treepath, selection) else None for x in paths]
+
+    def fill(i):
+        try:
+            out[i] = _scanfile(paths[i], treepath, branches, awkward, localsource, xrootdsource, httpsource, options)
+        except Exception:
+            return sys.exc_info()
+        else:
+            return None
+
+    missing = [i for i in range(len(paths)) if out[i] is None]
+    if executor is None:
+        for i in missing:
+            _delayedraise(fill(i))
+        excinfos = ()
+    else:
+        excinfos = executor.map(fill, missing)
+
+    def wait():
+        for excinfo in excinfos:
+            _delayedraise(excinfo)
+        manifest.treepath = Manifest._name(_bytesid(treepath))
+        manifest.branches = selection
+        manifest.files = OrderedDict(zip(paths, out))
+        if manifest.path is not None:
+            manifest.save()
+        return manifest
+
+    if blocking:
+        return wait()
+    else:
+        return wait
+
+################################################################ for planning distributed work
+
+def _basketsizes(branch, compressed, keycache):
+    # bytes of each basket: compressed sizes come from the TBranch itself, uncompressed sizes from the TKeys
+    if branch._recoveredbaskets is None:
+        branch._tryrecover()
+    if compressed:
+        good = numpy.array(branch._fBasketBytes[: branch._numgoodbaskets], dtype=numpy.float64)
+        recovered = numpy.array([key._fObjlen for key in branch._recoveredbaskets], dtype=numpy.float64)    # in the TTree, not compressed
+        return numpy.concatenate([good, recovered])
+    else:
+        return numpy.array([key._fObjlen for key in branch._threadsafe_iterate_keys(keycache, False)], dtype=numpy.float64)
+
+def _clusterbytes(tree, branches, compressed, keycache):
+    # (cluster boundaries, bytes in each cluster), prorating baskets that cross a boundary by entries
+    boundaries = tree._clusterboundaries(branches)
+    if boundaries is None:
+        boundaries = numpy.array([0, tree.numentries], dtype=numpy.int64)
+    boundaries = numpy.unique(numpy.concatenate([[0, tree.numentries], boundaries[(0 < boundaries) & (boundaries < tree.numentries)]])).astype(numpy.int64)
+
+    total = numpy.zeros(len(boundaries), dtype=numpy.float64)
+    for branch, interpretation in branches:
+        sizes = _basketsizes(branch, compressed, keycache)
+        offsets = numpy.array(branch._entryoffsets[: len(sizes) + 1], dtype=numpy.float64)
+        cumulative = numpy.zeros(len(offsets), dtype=numpy.float64)
+        numpy.cumsum(sizes, out=cumulative[1:])
+        total += numpy.interp(boundaries, offsets, cumulative)
+    return boundaries, numpy.diff(total)
+
+def partitions(path, treepath, numbytes, branches=None, compressed=False, keycache=None, executor=None, blocking=True, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, **options):
+    m = _memsize(numbytes)
+    if m is not None:
+        numbytes = m
+    if isinstance(numbytes, string_types):
+        raise ValueError("string {0} does not match the memory size pattern (number followed by B/kB/MB/GB/etc.)".format(repr(numbytes)))
+    if numbytes <= 0:
+        raise ValueError("target numbytes must be positive")
+
+    paths = _paths(path)
+    if isinstance(path, Manifest):
+        path._checktreepath(treepath)
+        paths = [x for x in paths if path.files[x]["hastree"] and path.files[x]["numentries"] > 0]
+    awkward = _normalize_awkwardlib(None)
+    clusters = [None] * len(paths)
+
+    def fill(i):
+        try:
+            tree = uproot.rootio.filepool.tree(paths[i], treepath, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, **options)
+        except KeyError:
+            return None
+        except Exception:
+            return sys.exc_info()
+        try:
+            clusters[i] = _clusterbytes(tree, list(tree._normalize_branches(branches, awkward)), compressed, keycache)
+        except Exception:
+            return sys.exc_info()
+        finally:
+            uproot.rootio.filepool.release(tree)
+
+    if executor is None:
+        for i in range(len(paths)):
+            _delayedraise(fill(i))
+        excinfos = ()
+    else:
+        excinfos = executor.map(fill, range(len(paths)))
+
+    def wait():
+        for excinfo in excinfos:
+            _delayedraise(excinfo)
+
+        # clusters in file order are packed into units, each ending where its size is nearest to numbytes
+        units, unit, unitbytes = [], [], 0.0
+        for path, found in zip(paths, clusters):
+            if found is None:
+                continue
+            boundaries, sizes = found
+            for start, stop, size in zip(boundaries[:-1].tolist(), boundaries[1:].tolist(), sizes.tolist()):
+                if len(unit) > 0 and unitbytes + size > numbytes and unitbytes + size - numbytes > numbytes - unitbytes:
+                    units.append(unit)
+                    unit, unitbytes = [], 0.0
+                if len(unit) > 0 and unit[-1][0] == path and unit[-1][2] == start:
+                    unit[-1] = (path, unit[-1][1], stop)
+                else:
+                    unit.append((path, start, stop))
+                unitbytes += size
+                if unitbytes >= numbytes:
+                    units.append(unit)
+                    unit, unitbytes = [], 0.0
+        if len(unit) > 0:
+            units.append(unit)
+        return units
+
+    if blocking:
+        return wait()
+    else:
+        return wait